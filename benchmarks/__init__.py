@@ -0,0 +1 @@
+"""Offline benchmarks of nc_api against a local WebDAV/OCS stand-in server."""
@@ -0,0 +1,335 @@
+"""
+Benchmarks of the client against the in-process stand-in server.
+
+Every case runs in its own Python process, so the reported peak RSS belongs
+to that case alone. Results can be saved as JSON and compared with an
+earlier run to catch regressions::
+
+    python -m benchmarks --save baseline.json
+    python -m benchmarks --compare baseline.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from benchmarks.standin import StandinServer
+from nc_api import NextcloudClient
+from nc_api.xml_query.search import SearchQuery, is_collection, prop
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+USERNAME = "admin"
+
+
+def _percentile(samples: List[float], percent: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    rank = max(1, round(percent / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _timed(operation: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    operation()
+    return time.perf_counter() - started
+
+
+def bench_upload_file(
+    client: NextcloudClient, server: StandinServer, args: Any
+) -> Dict[str, Any]:
+    payload = os.urandom(args.size)
+    client.dirs.create_directory("/bench-upload")
+    samples = [
+        _timed(
+            lambda i=i: client.files.upload_file(
+                FILE=payload, REMOTE_UPLOAD_PATH=f"/bench-upload/{i}.bin"
+            )
+        )
+        for i in range(args.files)
+    ]
+    return {"samples": samples, "bytes": args.size * args.files}
+
+
+def bench_download_file(
+    client: NextcloudClient, server: StandinServer, args: Any
+) -> Dict[str, Any]:
+    with server.state.lock:
+        server.state.make_dir("bench-download")
+        for i in range(args.files):
+            server.state.put_file(f"bench-download/{i}.bin", os.urandom(args.size))
+    with tempfile.TemporaryDirectory() as local:
+        samples = [
+            _timed(
+                lambda i=i: client.files.download_file(
+                    os.path.join(local, f"{i}.bin"), f"/bench-download/{i}.bin"
+                )
+            )
+            for i in range(args.files)
+        ]
+    return {"samples": samples, "bytes": args.size * args.files}
+
+
+def bench_upload_folder(
+    client: NextcloudClient, server: StandinServer, args: Any
+) -> Dict[str, Any]:
+    samples = []
+    with tempfile.TemporaryDirectory() as local:
+        for i in range(args.files):
+            folder = os.path.join(local, f"sub{i % 10}")
+            os.makedirs(folder, exist_ok=True)
+            with open(os.path.join(folder, f"{i}.bin"), "wb") as file:
+                file.write(os.urandom(args.size))
+        for run in range(args.repeat):
+            report = client.paths.upload_folder(
+                local, f"/bench-folder-{run}", max_workers=args.workers
+            )
+            if not report.ok:
+                raise RuntimeError(report.failed[0].error)
+            samples.append(report.elapsed)
+    return {
+        "samples": samples,
+        "bytes": args.size * args.files * args.repeat,
+        "operations": args.files * args.repeat,
+    }
+
+
+def bench_get_data_file(
+    client: NextcloudClient, server: StandinServer, args: Any
+) -> Dict[str, Any]:
+    with server.state.lock:
+        server.state.make_dir("bench-meta")
+        for i in range(args.files):
+            server.state.put_file(f"bench-meta/{i}.txt", b"x")
+    samples = [
+        _timed(lambda i=i: client.files.get_data_file(f"/bench-meta/{i}.txt"))
+        for i in range(args.files)
+    ]
+    return {"samples": samples}
+
+
+def bench_get_users(
+    client: NextcloudClient, server: StandinServer, args: Any
+) -> Dict[str, Any]:
+    samples = [
+        _timed(
+            lambda offset=offset: client.users.get_users(
+                limit=args.page_size, offset=offset
+            )
+        )
+        for _ in range(args.repeat)
+        for offset in range(0, args.users, args.page_size)
+    ]
+    return {"samples": samples}
+
+
+def bench_search(
+    client: NextcloudClient, server: StandinServer, args: Any
+) -> Dict[str, Any]:
+    with server.state.lock:
+        server.state.make_dir("bench-search")
+        for i in range(args.files):
+            folder = f"bench-search/sub{i % 10}"
+            if folder not in server.state.nodes:
+                server.state.make_dir(folder)
+            server.state.put_file(f"{folder}/{i}.bin", b"x")
+            # Every tenth file counts as recently modified
+            if i % 10:
+                server.state.nodes[f"{folder}/{i}.bin"].mtime -= 7200
+    hour_ago = time.time() - 3600
+    query = SearchQuery("/bench-search").where(
+        (prop("last_modified") > datetime.fromtimestamp(hour_ago, timezone.utc))
+        & ~is_collection()
+    )
+    samples = [
+        _timed(lambda: list(client.files.search(query, page_size=args.page_size)))
+        for _ in range(args.repeat)
+    ]
+    return {"samples": samples}
+
+
+Case = Callable[[NextcloudClient, StandinServer, Any], Dict[str, Any]]
+
+CASES: Dict[str, Case] = {
+    "upload_file": bench_upload_file,
+    "download_file": bench_download_file,
+    "upload_folder": bench_upload_folder,
+    "get_data_file": bench_get_data_file,
+    "get_users": bench_get_users,
+    "search": bench_search,
+}
+
+
+def run_case(name: str, args: Any) -> Dict[str, Any]:
+    """Runs one case in this process and summarizes it."""
+    server = StandinServer(
+        latency=args.latency / 1000,
+        bandwidth=args.bandwidth * 1024 * 1024 if args.bandwidth else None,
+        users=args.users,
+    )
+    with server:
+        client = NextcloudClient(
+            server.url, USERNAME, "admin", pool_maxsize=max(10, args.workers)
+        )
+        with client:
+            started = time.perf_counter()
+            measured = CASES[name](client, server, args)
+            elapsed = time.perf_counter() - started
+        requests = server.state.requests
+
+    samples = measured["samples"]
+    operations = measured.get("operations", len(samples))
+    summary = {
+        "case": name,
+        "operations": operations,
+        "requests": requests,
+        "elapsed": elapsed,
+        "ops_per_second": operations / elapsed if elapsed else 0.0,
+        "p50_ms": _percentile(samples, 50) * 1000,
+        "p90_ms": _percentile(samples, 90) * 1000,
+        "p99_ms": _percentile(samples, 99) * 1000,
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        / (1024 * 1024 if sys.platform == "darwin" else 1024),
+    }
+    if "bytes" in measured:
+        summary["mb_per_second"] = measured["bytes"] / elapsed / (1024 * 1024)
+    return summary
+
+
+def run_isolated(name: str, argv: List[str]) -> Dict[str, Any]:
+    """Runs one case in a fresh interpreter and returns its summary."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks", "--case", name, "--json", *argv],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)[0]
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float
+) -> List[str]:
+    """
+    :return: Descriptions of the cases slower or larger than the baseline beyond ``tolerance``
+    """
+    previous = {result["case"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(result["case"])
+        if before is None:
+            continue
+        if result["ops_per_second"] < before["ops_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{result['case']}: {result['ops_per_second']:.1f} ops/s, "
+                f"baseline {before['ops_per_second']:.1f}"
+            )
+        if result["p90_ms"] > before["p90_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{result['case']}: p90 {result['p90_ms']:.2f} ms, "
+                f"baseline {before['p90_ms']:.2f}"
+            )
+        if result["peak_rss_mb"] > before["peak_rss_mb"] * (1 + tolerance):
+            regressions.append(
+                f"{result['case']}: peak RSS {result['peak_rss_mb']:.1f} MB, "
+                f"baseline {before['peak_rss_mb']:.1f}"
+            )
+    return regressions
+
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    print(
+        f"{'case':<15}{'ops':>7}{'ops/s':>10}{'MB/s':>9}"
+        f"{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'RSS MB':>9}"
+    )
+    for result in results:
+        throughput = result.get("mb_per_second")
+        print(
+            f"{result['case']:<15}{result['operations']:>7}{result['ops_per_second']:>10.1f}"
+            f"{(f'{throughput:.1f}' if throughput is not None else '-'):>9}"
+            f"{result['p50_ms']:>9.2f}{result['p90_ms']:>9.2f}{result['p99_ms']:>9.2f}"
+            f"{result['peak_rss_mb']:>9.1f}"
+        )
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks of nc_api against a local stand-in server.",
+    )
+    add = parser.add_argument
+    add("--case", action="append", choices=sorted(CASES), help="Case to run, repeatable")
+    add("--files", type=int, default=200, help="Files per case")
+    add("--size", type=int, default=64 * 1024, help="Bytes per file")
+    add("--users", type=int, default=5000, help="Users served by the OCS endpoints")
+    add("--page-size", type=int, default=500, help="Users per OCS page and results per SEARCH page")
+    add("--repeat", type=int, default=3, help="Runs of upload_folder, get_users and search")
+    add("--workers", type=int, default=8, help="Parallel transfers of upload_folder")
+    add("--latency", type=float, default=0.0, help="Latency added per request, ms")
+    add("--bandwidth", type=float, default=None, help="Bandwidth per connection, MiB/s")
+    add("--in-process", action="store_true", help="Run all cases in this process")
+    add("--json", action="store_true", help="Print the results as JSON")
+    add("--save", help="Write the results to this JSON file")
+    add("--compare", help="Baseline JSON file to compare against")
+    add("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    args = _parser().parse_args(argv)
+    names = args.case or list(CASES)
+
+    if args.in_process or len(names) == 1 and args.json:
+        results = [run_case(name, args) for name in names]
+    else:
+        # The children get the workload options, not the selection and output ones
+        shared = _strip_options(
+            argv,
+            with_value={"--case", "--save", "--compare", "--tolerance"},
+            flags={"--json", "--in-process"},
+        )
+        results = [run_isolated(name, shared) for name in names]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def _strip_options(argv: List[str], with_value: Set[str], flags: Set[str]) -> List[str]:
+    stripped = []
+    skip = False
+    for item in argv:
+        if skip:
+            skip = False
+            continue
+        name = item.split("=", 1)[0]
+        if name in flags:
+            continue
+        if name in with_value:
+            skip = "=" not in item
+            continue
+        stripped.append(item)
+    return stripped
@@ -0,0 +1,522 @@
+"""
+In-process stand-in for the parts of a Nextcloud server the client talks to.
+
+Emulates the WebDAV files endpoint (PROPFIND, GET with Range, PUT, MKCOL,
+MOVE, COPY, DELETE) with ETag propagation to parent folders, basic SEARCH
+on ``/remote.php/dav/``, and the OCS ``cloud/users`` endpoints, over a threaded HTTP/1.1 keep-alive server.
+Latency and bandwidth can be injected to approximate a remote server.
+"""
+
+import hashlib
+import itertools
+import json
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+FILES_PREFIX = "/remote.php/dav/files/"
+OCS_USERS_PREFIX = "/ocs/v1.php/cloud/users"
+SEARCH_PATH = "/remote.php/dav/"
+# Size of the pieces bodies are sent and received in when bandwidth is limited
+THROTTLE_BLOCK = 64 * 1024
+
+_MULTISTATUS_OPEN = (
+    '<?xml version="1.0"?>'
+    '<d:multistatus xmlns:d="DAV:" xmlns:oc="http://owncloud.org/ns"'
+    ' xmlns:nc="http://nextcloud.org/ns">'
+)
+
+
+@dataclass
+class Node:
+    """A file (``data`` is not None) or a folder of the stand-in tree."""
+
+    mtime: float
+    etag: str
+    file_id: int
+    data: Optional[bytes] = None
+    # Value of the OC-Checksum header the file was uploaded with
+    checksum: Optional[str] = None
+
+    @property
+    def is_dir(self) -> bool:
+        return self.data is None
+
+
+class StandinState:
+    """Tree of files and folders plus the OCS users, shared by all handler threads."""
+
+    def __init__(self, users: int = 100) -> None:
+        self.lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.nodes: Dict[str, Node] = {"": self._node()}
+        self.users: Dict[str, Dict[str, Any]] = {
+            f"user{i:06d}": {
+                "id": f"user{i:06d}",
+                "displayname": f"User {i}",
+                "email": f"user{i}@example.org",
+                "quota": {"free": 10**9, "used": i, "total": 10**9 + i},
+                "groups": ["users"],
+                "enabled": True,
+            }
+            for i in range(users)
+        }
+        self.requests = 0
+
+    def _node(self, data: Optional[bytes] = None) -> Node:
+        file_id = next(self._ids)
+        return Node(time.time(), _etag(file_id), file_id, data)
+
+    def touch(self, path: str) -> None:
+        """Gives the ancestors of ``path`` new ETags, as Nextcloud does."""
+        parts = path.split("/")
+        for depth in range(len(parts)):
+            parent = self.nodes.get("/".join(parts[:depth]))
+            if parent is not None:
+                parent.mtime = time.time()
+                parent.etag = _etag(next(self._ids))
+
+    def put_file(self, path: str, data: bytes) -> bool:
+        """:return: True if the file already existed"""
+        existed = path in self.nodes
+        self.nodes[path] = self._node(data)
+        self.touch(path)
+        return existed
+
+    def make_dir(self, path: str) -> None:
+        self.nodes[path] = self._node()
+        self.touch(path)
+
+    def subtree(self, path: str) -> List[str]:
+        prefix = path + "/" if path else ""
+        return [key for key in self.nodes if key.startswith(prefix) and key != path]
+
+    def children(self, path: str, infinite: bool) -> List[str]:
+        prefix = path + "/" if path else ""
+        return sorted(
+            key
+            for key in self.subtree(path)
+            if infinite or "/" not in key[len(prefix) :]
+        )
+
+    def size(self, path: str) -> int:
+        node = self.nodes[path]
+        if not node.is_dir:
+            return len(node.data)
+        return sum(
+            len(self.nodes[key].data)
+            for key in self.subtree(path)
+            if not self.nodes[key].is_dir
+        )
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; Nagle would hold the body back
+    disable_nagle_algorithm = True
+    state: StandinState
+    latency: float = 0.0
+    bandwidth: Optional[float] = None
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def handle_one_request(self) -> None:
+        try:
+            super().handle_one_request()
+        except ConnectionError:
+            self.close_connection = True
+
+    # WebDAV
+
+    def do_PROPFIND(self) -> None:
+        self._begin()
+        wanted = _requested_props(self._read_body())
+        path = self._files_path()
+        depth = self.headers.get("Depth", "infinity")
+        with self.state.lock:
+            if path is None or path not in self.state.nodes:
+                return self._send(404)
+            paths = [path]
+            if self.state.nodes[path].is_dir and depth != "0":
+                paths += self.state.children(path, depth == "infinity")
+            body = "".join(
+                [_MULTISTATUS_OPEN]
+                + [self._response(key, wanted) for key in paths]
+                + ["</d:multistatus>"]
+            )
+        self._send(207, body.encode(), {"Content-Type": "application/xml; charset=utf-8"})
+
+    def do_SEARCH(self) -> None:
+        self._begin()
+        body = self._read_body()
+        if urlsplit(self.path).path != SEARCH_PATH:
+            return self._send(405)
+        search = ET.fromstring(body).find("d:basicsearch", _NS)
+        wanted = {_local(child.tag) for child in search.find("d:select/d:prop", _NS)}
+        href = search.findtext("d:from/d:scope/d:href", "", _NS)
+        scope = "/".join(part for part in unquote(href).split("/")[3:] if part)
+        limit = search.find("d:limit", _NS)
+        with self.state.lock:
+            if scope not in self.state.nodes:
+                return self._send(404)
+            matches = [
+                key
+                for key in self.state.subtree(scope)
+                if _matches(search.find("d:where", _NS)[0], self._values(key))
+            ]
+            for order in reversed(search.findall("d:orderby/d:order", _NS)):
+                name = _local(order.find("d:prop", _NS)[0].tag)
+                matches.sort(
+                    key=lambda key: self._values(key)[name],
+                    reverse=order.find("d:descending", _NS) is not None,
+                )
+            if limit is not None:
+                first = int(limit.findtext("ns:firstresult", "0", _NS))
+                count = int(limit.findtext("d:nresults", str(len(matches)), _NS))
+                matches = matches[first : first + count]
+            body = "".join(
+                [_MULTISTATUS_OPEN]
+                + [self._response(key, wanted) for key in matches]
+                + ["</d:multistatus>"]
+            )
+        self._send(207, body.encode(), {"Content-Type": "application/xml; charset=utf-8"})
+
+    def _values(self, path: str) -> Dict[str, Any]:
+        """Searchable properties of a node, keyed by local name."""
+        node = self.state.nodes[path]
+        return {
+            "getlastmodified": node.mtime,
+            "size": self.state.size(path),
+            "fileid": node.file_id,
+            "displayname": path.rsplit("/", 1)[-1],
+            "getcontenttype": "" if node.is_dir else "application/octet-stream",
+            "is_dir": node.is_dir,
+        }
+
+    def do_GET(self) -> None:
+        self._begin()
+        if self.path.startswith(OCS_USERS_PREFIX):
+            return self._ocs_users()
+        path = self._files_path()
+        with self.state.lock:
+            node = self.state.nodes.get(path) if path is not None else None
+            if node is None or node.is_dir:
+                return self._send(404)
+            data, etag = node.data, node.etag
+        headers = {"ETag": f'"{etag}"', "Content-Type": "application/octet-stream"}
+        requested = self.headers.get("Range", "")
+        if requested.startswith("bytes="):
+            start = int(requested[6:].split("-", 1)[0] or 0)
+            if start >= len(data):
+                return self._send(416)
+            headers["Content-Range"] = f"bytes {start}-{len(data) - 1}/{len(data)}"
+            return self._send(206, data[start:], headers)
+        self._send(200, data, headers)
+
+    def do_PUT(self) -> None:
+        self._begin()
+        data = self._read_body()
+        path = self._files_path()
+        with self.state.lock:
+            if not path or _parent(path) not in self.state.nodes:
+                return self._send(409)
+            existed = self.state.put_file(path, data)
+            self.state.nodes[path].checksum = self.headers.get("OC-Checksum")
+            etag = self.state.nodes[path].etag
+        self._send(204 if existed else 201, headers={"ETag": f'"{etag}"'})
+
+    def do_MKCOL(self) -> None:
+        self._begin()
+        self._read_body()
+        path = self._files_path()
+        with self.state.lock:
+            if path is None or path in self.state.nodes:
+                return self._send(405)
+            if _parent(path) not in self.state.nodes:
+                return self._send(409)
+            self.state.make_dir(path)
+        self._send(201)
+
+    def do_MOVE(self) -> None:
+        self._copy_or_move(move=True)
+
+    def do_COPY(self) -> None:
+        self._copy_or_move(move=False)
+
+    def do_DELETE(self) -> None:
+        self._begin()
+        path = self._files_path()
+        with self.state.lock:
+            if not path or path not in self.state.nodes:
+                return self._send(404)
+            for key in self.state.subtree(path) + [path]:
+                del self.state.nodes[key]
+            self.state.touch(path)
+        self._send(204)
+
+    def _copy_or_move(self, move: bool) -> None:
+        self._begin()
+        self._read_body()
+        source = self._files_path()
+        destination = _files_path(self.headers.get("Destination", ""))
+        state = self.state
+        with state.lock:
+            if not source or source not in state.nodes:
+                return self._send(404)
+            if not destination or _parent(destination) not in state.nodes:
+                return self._send(409)
+            existed = destination in state.nodes
+            if existed and self.headers.get("Overwrite", "T") == "F":
+                return self._send(412)
+            for key in state.subtree(destination) + ([destination] if existed else []):
+                del state.nodes[key]
+            for key in [source] + state.subtree(source):
+                node = state.nodes[key]
+                target = destination + key[len(source) :]
+                if move:
+                    state.nodes[target] = state.nodes.pop(key)
+                else:
+                    state.nodes[target] = state._node(node.data)
+            state.touch(destination)
+            if move:
+                state.touch(source)
+        self._send(204 if existed else 201)
+
+    def _response(self, path: str, wanted: Optional[Set[str]] = None) -> str:
+        """:param wanted: Local names of the requested properties, None for all"""
+        node = self.state.nodes[path]
+        href = FILES_PREFIX + "admin/" + quote(path) + ("/" if node.is_dir else "")
+        props = [
+            f"<d:getlastmodified>{formatdate(node.mtime, usegmt=True)}</d:getlastmodified>",
+            f'<d:getetag>"{node.etag}"</d:getetag>',
+            f"<oc:fileid>{node.file_id}</oc:fileid>",
+            f"<oc:size>{self.state.size(path)}</oc:size>",
+        ]
+        if node.is_dir:
+            props.append("<d:resourcetype><d:collection/></d:resourcetype>")
+            props.append("<oc:permissions>RGDNVCK</oc:permissions>")
+        else:
+            props.append("<d:resourcetype/>")
+            props.append("<d:getcontenttype>application/octet-stream</d:getcontenttype>")
+            props.append(f"<d:getcontentlength>{len(node.data)}</d:getcontentlength>")
+            checksum = escape(node.checksum or "")
+            props.append(
+                f"<oc:checksums><oc:checksum>{checksum}</oc:checksum></oc:checksums>"
+            )
+            props.append("<oc:permissions>RGDNVW</oc:permissions>")
+        if wanted is not None:
+            props = [item for item in props if _local(item[1 : item.index(">")]) in wanted]
+        return (
+            f"<d:response><d:href>{escape(href)}</d:href><d:propstat><d:prop>"
+            + "".join(props)
+            + "</d:prop><d:status>HTTP/1.1 200 OK</d:status></d:propstat></d:response>"
+        )
+
+    # OCS
+
+    def _ocs_users(self) -> None:
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        rest = url.path[len(OCS_USERS_PREFIX) :].strip("/")
+        users = self.state.users
+        if rest in ("", "details"):
+            search = query.get("search", [""])[0]
+            ids = sorted(userid for userid in users if search in userid)
+            offset = int(query.get("offset", [0])[0])
+            limit = int(query.get("limit", [len(ids)])[0])
+            page = ids[offset : offset + limit]
+            data: Any = {
+                "users": {userid: users[userid] for userid in page}
+                if rest == "details"
+                else page
+            }
+        else:
+            data = users.get(unquote(rest))
+            if data is None:
+                return self._send_ocs(404, 404, [])
+        self._send_ocs(200, 100, data)
+
+    def _send_ocs(self, status: int, ocs_status: int, data: Any) -> None:
+        body = json.dumps(
+            {"ocs": {"meta": {"status": "ok", "statuscode": ocs_status}, "data": data}}
+        ).encode()
+        self._send(status, body, {"Content-Type": "application/json"})
+
+    # Plumbing
+
+    def _begin(self) -> None:
+        with self.state.lock:
+            self.state.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _files_path(self) -> Optional[str]:
+        return _files_path(self.path)
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            blocks = []
+            while True:
+                size = int(self.rfile.readline().split(b";", 1)[0], 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                blocks.append(self._read(size))
+                self.rfile.readline()
+            return b"".join(blocks)
+        return self._read(int(self.headers.get("Content-Length") or 0))
+
+    def _read(self, size: int) -> bytes:
+        blocks = []
+        for block_size in _blocks(size, self.bandwidth):
+            blocks.append(self.rfile.read(block_size))
+            self._throttle(block_size)
+        return b"".join(blocks)
+
+    def _send(
+        self, status: int, body: bytes = b"", headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        view = memoryview(body)
+        offset = 0
+        for block_size in _blocks(len(body), self.bandwidth):
+            self.wfile.write(view[offset : offset + block_size])
+            offset += block_size
+            self._throttle(block_size)
+
+    def _throttle(self, size: int) -> None:
+        if self.bandwidth:
+            time.sleep(size / self.bandwidth)
+
+
+class StandinServer:
+    """
+    Runs the stand-in on a free local port in a background thread.
+
+    ``latency`` (seconds) is added to every request; ``bandwidth`` (bytes
+    per second, per connection) limits request and response bodies.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        users: int = 100,
+    ) -> None:
+        self.state = StandinState(users=users)
+        handler = type(
+            "Handler",
+            (StandinHandler,),
+            {"state": self.state, "latency": latency, "bandwidth": bandwidth},
+        )
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandinServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def _files_path(url: str) -> Optional[str]:
+    """Path below the user's files root, without slashes at either end."""
+    path = unquote(urlsplit(url).path)
+    if not path.startswith(FILES_PREFIX):
+        return None
+    # Drop the user segment: /remote.php/dav/files/<user>/<path>
+    rest = path[len(FILES_PREFIX) :].split("/", 1)
+    return "/".join(part for part in (rest[1] if len(rest) > 1 else "").split("/") if part)
+
+
+_NS = {
+    "d": "DAV:",
+    "oc": "http://owncloud.org/ns",
+    "ns": "https://github.com/icewind1991/SearchDAV/ns",
+}
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda value, literal: value == literal,
+    "gt": lambda value, literal: value > literal,
+    "gte": lambda value, literal: value >= literal,
+    "lt": lambda value, literal: value < literal,
+    "lte": lambda value, literal: value <= literal,
+}
+
+
+def _local(tag: str) -> str:
+    """Local name of a ``{ns}name`` tag or a ``prefix:name`` element name."""
+    return tag.split("}", 1)[-1].split(":", 1)[-1].rstrip("/")
+
+
+def _requested_props(body: bytes) -> Optional[Set[str]]:
+    """Local names asked for by a PROPFIND body, None for allprop or no body."""
+    if not body:
+        return None
+    prop = ET.fromstring(body).find("d:prop", _NS)
+    return {_local(child.tag) for child in prop} if prop is not None else None
+
+
+def _matches(condition: ET.Element, values: Dict[str, Any]) -> bool:
+    """Evaluates a basicsearch where-clause against the values of one node."""
+    operator = _local(condition.tag)
+    if operator == "and":
+        return all(_matches(child, values) for child in condition)
+    if operator == "or":
+        return any(_matches(child, values) for child in condition)
+    if operator == "not":
+        return not _matches(condition[0], values)
+    if operator == "is-collection":
+        return values["is_dir"]
+    value = values[_local(condition.find("d:prop", _NS)[0].tag)]
+    literal = condition.findtext("d:literal", "", _NS)
+    if operator == "like":
+        pattern = re.escape(literal).replace("%", ".*").replace("_", ".")
+        return re.fullmatch(pattern, str(value)) is not None
+    if isinstance(value, float):
+        literal = datetime.fromisoformat(literal).timestamp()
+    elif isinstance(value, int):
+        literal = int(literal)
+    return _COMPARISONS[operator](value, literal)
+
+
+def _parent(path: str) -> str:
+    return path.rsplit("/", 1)[0] if "/" in path else ""
+
+
+def _etag(seed: int) -> str:
+    return hashlib.md5(str((seed, time.time_ns())).encode()).hexdigest()[:16]
+
+
+def _blocks(size: int, bandwidth: Optional[float]) -> Iterator[int]:
+    """Splits ``size`` bytes into the pieces transferred between throttling pauses."""
+    step = THROTTLE_BLOCK if bandwidth else max(size, 1)
+    for offset in range(0, size, step):
+        yield min(step, size - offset)
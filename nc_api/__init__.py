@@ -1,13 +1,48 @@
+from nc_api.cache import MetadataCache, TTLCache, UserCache
+from nc_api.changes import Change, ChangeIndex
+from nc_api.checksums import HashCache
+from nc_api.chunked_upload import ChunkedUploadManager
 from nc_api.client import NextcloudClient
 from nc_api.directory_manager import DirectoryManager
 from nc_api.file_manager import FileManager
+from nc_api.limits import AdaptiveConcurrencyLimiter, RequestLimiter, TokenBucket
+from nc_api.listing import FileTable
+from nc_api.metrics import RequestEvent, RequestMetrics
 from nc_api.path_manager import PathManager
+from nc_api.propfind import FileInfo
+from nc_api.results import BatchReport, TransferResult
+from nc_api.retry import RetryBudget, RetryPolicy
+from nc_api.streams import UploadStream
+from nc_api.sync import SyncIndex, SyncManager
+from nc_api.transport import Transport
 from nc_api.user_manager import UserManager
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "BatchReport",
+    "Change",
+    "ChangeIndex",
+    "ChunkedUploadManager",
     "NextcloudClient",
     "DirectoryManager",
+    "FileInfo",
     "FileManager",
+    "FileTable",
+    "HashCache",
+    "MetadataCache",
     "PathManager",
+    "RequestEvent",
+    "RequestLimiter",
+    "RequestMetrics",
+    "RetryBudget",
+    "RetryPolicy",
+    "SyncIndex",
+    "SyncManager",
+    "TransferResult",
+    "TokenBucket",
+    "Transport",
+    "TTLCache",
+    "UploadStream",
+    "UserCache",
     "UserManager",
 ]
@@ -0,0 +1,24 @@
+try:
+    import aiohttp  # noqa: F401
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "nc_api.aio requires aiohttp, install it with: pip install nc-api[async]"
+    ) from e
+
+from nc_api.aio.chunked_upload import AsyncChunkedUploadManager
+from nc_api.aio.client import AsyncNextcloudClient
+from nc_api.aio.directory_manager import AsyncDirectoryManager
+from nc_api.aio.file_manager import AsyncFileManager
+from nc_api.aio.path_manager import AsyncPathManager
+from nc_api.aio.transport import AsyncTransport
+from nc_api.aio.user_manager import AsyncUserManager
+
+__all__ = [
+    "AsyncChunkedUploadManager",
+    "AsyncNextcloudClient",
+    "AsyncDirectoryManager",
+    "AsyncFileManager",
+    "AsyncPathManager",
+    "AsyncTransport",
+    "AsyncUserManager",
+]
@@ -0,0 +1,203 @@
+import asyncio
+import dataclasses
+from typing import Any, Callable, Dict, Optional
+
+import aiohttp
+
+from nc_api.aio.transport import AsyncTransport
+from nc_api.parsers import loads_json
+from nc_api.retry import RetryPolicy
+
+
+class AsyncResponse:
+    """Fully read response with the attributes the managers use from requests.Response."""
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Any,
+        content: bytes,
+        encoding: Optional[str] = None,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return loads_json(self.content)
+
+
+async def read_response(response: aiohttp.ClientResponse) -> AsyncResponse:
+    """
+    Reads and releases a response. Errors raised by the async managers carry
+    the result as ``HTTPError.response``, with ``status_code`` as in requests.
+    """
+    async with response:
+        content = await response.read()
+        return AsyncResponse(
+            response.status, response.headers, content, response.charset
+        )
+
+
+class AsyncBaseManager:
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        transport: Optional[AsyncTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        self.NEXTCLOUD_URL: str = NEXTCLOUD_URL
+        self.USERNAME: str = USERNAME
+        self.PASSWORD: str = PASSWORD
+        self.transport: AsyncTransport = transport or AsyncTransport()
+        self.retry_policy: Optional[RetryPolicy] = retry_policy
+        self._auth = aiohttp.BasicAuth(USERNAME, PASSWORD)
+
+    async def _request_webdav(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        is_rest: bool = False,
+        **kwargs: Any,
+    ) -> AsyncResponse:
+        """
+        Unified entry point for all HTTP requests to the Nextcloud API.
+
+        The response body is read completely; use ``_open_webdav`` to stream it.
+
+        :param method: HTTP method (GET, PUT, POST, DELETE, PROPFIND, MOVE, etc.)
+        :param path: Path on the Nextcloud server
+        :param data: Data to send: bytes, str or an (async) iterator of bytes
+        :param headers: Additional headers
+        :param kwargs: Additional parameters for aiohttp
+        :return: AsyncResponse object
+        """
+        response = await self._open_webdav(
+            method, path, data=data, headers=headers, is_rest=is_rest, **kwargs
+        )
+        return await read_response(response)
+
+    async def _open_webdav(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        is_rest: bool = False,
+        **kwargs: Any,
+    ) -> aiohttp.ClientResponse:
+        """
+        Sends a request and returns the unread response. The caller must release it.
+
+        Requests whose body can be sent again go through the manager's retry
+        policy, as in ``BaseManager._request_webdav``.
+        """
+        policy = self.retry_policy
+        if policy is not None and policy.retries > 0:
+            body = _replayable_body(data)
+            if body is not None:
+                return await self._send_with_policy(
+                    policy, method, path, body, headers=headers, is_rest=is_rest, **kwargs
+                )
+        return await self._send_webdav(method, path, data, headers, is_rest, **kwargs)
+
+    async def _send_webdav(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        is_rest: bool = False,
+        **kwargs: Any,
+    ) -> aiohttp.ClientResponse:
+        """Sends a single request, without retries."""
+        url = self._build_url(path, is_rest=is_rest)
+
+        request_headers: Dict[str, str] = headers or {}
+
+        return await self.transport.request(
+            method,
+            url,
+            data=data,
+            headers=request_headers,
+            auth=self._auth,
+            **kwargs,
+        )
+
+    def _build_url(self, path: str, is_rest: bool = False) -> str:
+        if is_rest:
+            url = "/"
+        else:
+            url = "/remote.php/dav/files/"
+        return self.NEXTCLOUD_URL + url + path
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Callable[[], Any]] = None,
+        retries: int = 3,
+        backoff: float = 0.5,
+        **kwargs: Any,
+    ) -> AsyncResponse:
+        """
+        Sends a request, retrying on connection errors and throttling responses.
+        Same policy as the synchronous ``BaseManager._request_with_retries``:
+        the manager's ``RetryPolicy`` (idempotency rules and budget included)
+        with ``retries`` and ``backoff`` overridden.
+        """
+        policy = dataclasses.replace(
+            self.retry_policy or RetryPolicy(), retries=retries, backoff=backoff
+        )
+        response = await self._send_with_policy(policy, method, path, body, **kwargs)
+        return await read_response(response)
+
+    async def _send_with_policy(
+        self,
+        policy: RetryPolicy,
+        method: str,
+        path: str,
+        body: Optional[Callable[[], Any]],
+        **kwargs: Any,
+    ) -> aiohttp.ClientResponse:
+        policy.record_request()
+        attempt = 0
+        while True:
+            try:
+                response = await self._send_webdav(
+                    method, path, data=body() if body else None, **kwargs
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                # aiohttp raises ClientConnectorError when no connection was opened
+                sent = not isinstance(e, aiohttp.ClientConnectorError)
+                if not policy.retry_error(method, e, attempt, sent=sent):
+                    raise
+                delay = policy.delay(attempt)
+            else:
+                if not policy.retry_response(
+                    method, response.status, attempt, response
+                ):
+                    return response
+                delay = policy.delay(attempt, response)
+                response.release()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def _replayable_body(data: Any) -> Optional[Callable[[], Any]]:
+    """
+    Returns a factory producing the request body for every attempt, or None
+    if the body is a one-shot (async) stream that cannot be sent twice.
+    """
+    if data is None or isinstance(data, (bytes, bytearray, memoryview, str, dict)):
+        return lambda: data
+    return None
@@ -0,0 +1,256 @@
+import asyncio
+import math
+import mmap
+import os
+import uuid
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from requests import HTTPError
+
+from nc_api.aio.base_manager import AsyncBaseManager
+from nc_api.aio.streams import aiter_upload
+from nc_api.aio.transport import AsyncTransport
+from nc_api.chunked_upload import (
+    DEFAULT_UPLOAD_CHUNK_SIZE,
+    MAX_UPLOAD_CHUNKS,
+    MIN_UPLOAD_CHUNK_SIZE,
+    _FileSlice,
+)
+from nc_api.retry import RetryPolicy
+from nc_api.streams import DEFAULT_CHUNK_SIZE, ProgressCallback, source_size
+
+AsyncChunkBody = Callable[[], AsyncIterator[bytes]]
+
+
+class AsyncChunkedUploadManager(AsyncBaseManager):
+    """
+    Asyncio counterpart of ``ChunkedUploadManager``.
+
+    Same protocol: an upload session is created with MKCOL, numbered chunks
+    are PUT concurrently and retried individually, and the assembled
+    ``.file`` is finally MOVEd to the target path.
+    """
+
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        max_workers: int = 4,
+        retries: int = 3,
+        backoff: float = 0.5,
+        transport: Optional[AsyncTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        """
+        :param chunk_size: Size of every chunk but the last, at least 5 MiB
+        :param max_workers: Number of chunks uploaded concurrently
+        :param retries: Additional attempts per chunk after a failure
+        :param backoff: Base delay in seconds, doubled after every failed attempt
+        """
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            retry_policy=retry_policy,
+        )
+        if chunk_size < MIN_UPLOAD_CHUNK_SIZE:
+            raise ValueError(
+                f"chunk_size must be at least {MIN_UPLOAD_CHUNK_SIZE} bytes."
+            )
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive.")
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+
+    async def upload(
+        self,
+        REMOTE_UPLOAD_PATH: str,
+        LOCAL_UPLOAD_PATH: Optional[str] = None,
+        FILE: Optional[Any] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        checksum: Optional[str] = None,
+    ) -> bool:
+        """
+        Uploads a file in chunks. The target directory must already exist.
+
+        :param REMOTE_UPLOAD_PATH: Remote path in Nextcloud
+        :param LOCAL_UPLOAD_PATH: Local file path to upload
+        :param FILE: Bytes, binary file object, mmap, iterator or async iterator of bytes (alternative to LOCAL_UPLOAD_PATH)
+        :param progress_callback: Called with (bytes_sent, total_size) after each chunk
+        :param checksum: ``OC-Checksum`` of the whole file, stored when the chunks are assembled
+        :return: True if successful
+        """
+        if FILE is None and LOCAL_UPLOAD_PATH is None:
+            raise ValueError("Either LOCAL_UPLOAD_PATH or FILE must be provided.")
+
+        session_path = (
+            f"remote.php/dav/uploads/{self.USERNAME}/nc-api-{uuid.uuid4().hex}"
+        )
+        headers = {"Destination": self._build_url(REMOTE_UPLOAD_PATH)}
+
+        try:
+            if FILE is None:
+                total = os.path.getsize(LOCAL_UPLOAD_PATH)
+            elif hasattr(FILE, "__aiter__"):
+                total = None
+            else:
+                total = source_size(FILE)
+            await self._start_session(session_path, headers, total)
+            await self._upload_chunks(
+                session_path,
+                headers,
+                FILE,
+                total,
+                progress_callback,
+                LOCAL_UPLOAD_PATH,
+            )
+
+            if checksum:
+                headers = dict(headers, **{"OC-Checksum": checksum})
+            response = await self._request_with_retries(
+                "MOVE",
+                f"{session_path}/.file",
+                retries=self.retries,
+                backoff=self.backoff,
+                headers=headers,
+                is_rest=True,
+            )
+            if response.status_code in [200, 201, 204]:
+                return True
+            raise HTTPError(
+                f"Failed to assemble chunks: {response.status_code} - {response.text}",
+                response=response,
+            )
+        except Exception as e:
+            await self._abort_session(session_path)
+            raise Exception(f"Failed to upload file in chunks: {e}") from e
+
+    async def _start_session(
+        self, session_path: str, headers: Dict[str, str], total: Optional[int]
+    ) -> None:
+        if total is not None:
+            headers["OC-Total-Length"] = str(total)
+        response = await self._request_webdav(
+            "MKCOL", session_path, headers=headers, is_rest=True
+        )
+        if response.status_code not in [200, 201]:
+            raise HTTPError(
+                f"Failed to create upload session: {response.status_code} - {response.text}",
+                response=response,
+            )
+
+    async def _abort_session(self, session_path: str) -> None:
+        try:
+            await self._request_webdav("DELETE", session_path, is_rest=True)
+        except Exception:
+            pass
+
+    async def _upload_chunks(
+        self,
+        session_path: str,
+        headers: Dict[str, str],
+        source: Optional[Any],
+        total: Optional[int],
+        progress_callback: Optional[ProgressCallback],
+        local_path: Optional[str],
+    ) -> None:
+        chunk_size = self.chunk_size
+        if total is not None:
+            chunk_size = max(chunk_size, math.ceil(total / MAX_UPLOAD_CHUNKS))
+
+        sent = 0
+        failed = False
+        # Bounds both the requests in flight and the chunks read ahead of them
+        slots = asyncio.Semaphore(self.max_workers)
+
+        async def put_chunk(number: int, body: AsyncChunkBody, size: int) -> None:
+            nonlocal sent, failed
+            try:
+                response = await self._request_with_retries(
+                    "PUT",
+                    f"{session_path}/{number}",
+                    body=body,
+                    retries=self.retries,
+                    backoff=self.backoff,
+                    headers=dict(headers, **{"Content-Length": str(size)}),
+                    is_rest=True,
+                )
+                if response.status_code not in [200, 201, 204]:
+                    raise HTTPError(
+                        f"Failed to upload chunk {number}: {response.status_code} - {response.text}",
+                        response=response,
+                    )
+                sent += size
+                if progress_callback:
+                    progress_callback(sent, total)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                slots.release()
+
+        tasks: List["asyncio.Task[None]"] = []
+        try:
+            async for number, body, size in _aiter_chunks(source, chunk_size, local_path):
+                if number > MAX_UPLOAD_CHUNKS:
+                    raise ValueError(
+                        f"Upload exceeds {MAX_UPLOAD_CHUNKS} chunks, increase chunk_size."
+                    )
+                await slots.acquire()
+                if failed:
+                    slots.release()
+                    break
+                tasks.append(asyncio.ensure_future(put_chunk(number, body, size)))
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
+async def _aiter_chunks(
+    source: Optional[Any], chunk_size: int, local_path: Optional[str]
+) -> AsyncIterator[Tuple[int, AsyncChunkBody, int]]:
+    """Yields (chunk number, body factory, chunk size) for every chunk of the source."""
+    if source is None:
+        # Every attempt reopens its own slice of the file, nothing is buffered
+        total = os.path.getsize(local_path)
+        for number, offset in enumerate(range(0, total, chunk_size), start=1):
+            size = min(chunk_size, total - offset)
+            yield number, _file_slice_body(local_path, offset, size), size
+        return
+
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        view = memoryview(source)
+        for number, offset in enumerate(range(0, len(view), chunk_size), start=1):
+            block = view[offset : offset + chunk_size]
+            yield number, _buffer_body(block), len(block)
+        return
+
+    # File objects and (async) iterators are read sequentially, file reads in the executor
+    number = 0
+    buffer = bytearray()
+    async for block in aiter_upload(source, DEFAULT_CHUNK_SIZE):
+        buffer += block
+        while len(buffer) >= chunk_size:
+            number += 1
+            data = bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+            yield number, _buffer_body(data), len(data)
+    if buffer or number == 0:
+        number += 1
+        yield number, _buffer_body(bytes(buffer)), len(buffer)
+
+
+def _buffer_body(block: Any) -> AsyncChunkBody:
+    return lambda: aiter_upload(block, DEFAULT_CHUNK_SIZE)
+
+
+def _file_slice_body(path: str, offset: int, size: int) -> AsyncChunkBody:
+    return lambda: aiter_upload(_FileSlice(path, offset, size), DEFAULT_CHUNK_SIZE)
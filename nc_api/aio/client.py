@@ -0,0 +1,95 @@
+from typing import Any, Optional
+
+from nc_api.aio.base_manager import AsyncBaseManager
+from nc_api.aio.directory_manager import AsyncDirectoryManager
+from nc_api.aio.file_manager import AsyncFileManager
+from nc_api.aio.path_manager import AsyncPathManager
+from nc_api.aio.transport import AsyncTransport
+from nc_api.aio.user_manager import AsyncUserManager
+from nc_api.retry import RetryBudget, RetryPolicy
+from nc_api.transport import Timeout
+
+
+class AsyncNextcloudClient(AsyncBaseManager):
+    """
+    Asyncio counterpart of NextcloudClient aggregating all async managers.
+
+    Requests are retried under the same policy as in ``NextcloudClient``.
+    The metadata cache, request limiter, metrics, user cache and hash cache
+    of the synchronous client have no async counterpart yet.
+    """
+
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        transport: Optional[AsyncTransport] = None,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        timeout: Timeout = None,
+        retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        """
+        :param transport: Shared transport; built from the options below if omitted
+        :param limit: Maximum number of open connections in total
+        :param limit_per_host: Maximum number of open connections per host
+        :param timeout: Default timeout in seconds, or (connect, read) tuple
+        :param retries: Retries of failed requests under the default retry policy, 0 to disable
+        :param retry_policy: Retry policy shared by all managers; overrides ``retries``
+        """
+        if transport is None:
+            transport = AsyncTransport(
+                limit=limit, limit_per_host=limit_per_host, timeout=timeout
+            )
+        if retry_policy is None and retries > 0:
+            retry_policy = RetryPolicy(retries=retries, budget=RetryBudget())
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            retry_policy=retry_policy,
+        )
+        self.dirs = AsyncDirectoryManager(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=self.transport,
+            retry_policy=retry_policy,
+        )
+        self.files = AsyncFileManager(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            directory_manager=self.dirs,
+            transport=self.transport,
+            retry_policy=retry_policy,
+        )
+        self.paths = AsyncPathManager(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            directory_manager=self.dirs,
+            file_manager=self.files,
+            transport=self.transport,
+            retry_policy=retry_policy,
+        )
+        self.users = AsyncUserManager(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=self.transport,
+            retry_policy=retry_policy,
+        )
+
+    async def close(self) -> None:
+        """Closes the pooled connections shared by all managers."""
+        await self.transport.close()
+
+    async def __aenter__(self) -> "AsyncNextcloudClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
@@ -0,0 +1,181 @@
+from collections import deque
+from typing import AsyncIterator, List, Optional, Union
+
+from requests import HTTPError
+
+from nc_api.aio.base_manager import AsyncBaseManager, read_response
+from nc_api.aio.transport import AsyncTransport
+from nc_api.directory_manager import LISTING_READ_SIZE
+from nc_api.propfind import FileInfo, MultistatusParser
+from nc_api.retry import RetryPolicy
+from nc_api.xml_query.properties import Profile, propfind_body
+
+
+class AsyncDirectoryManager(AsyncBaseManager):
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        transport: Optional[AsyncTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            retry_policy=retry_policy,
+        )
+
+    async def directory_exists_check(
+        self, DIRECTORY_PATH: str, profile: Profile = "etag"
+    ) -> Union[bool, str]:
+        """
+        Checks if a directory exists in Nextcloud storage.
+
+        :param DIRECTORY_PATH: The path of the directory to check.
+        :param profile: Properties requested with the check, see ``nc_api.xml_query.properties``.
+        :return: True if exists, False if not.
+        """
+        try:
+            response = await self._request_webdav(
+                "PROPFIND",
+                DIRECTORY_PATH,
+                data=propfind_body(profile),
+                headers={"Depth": "0", "Content-Type": "application/xml"},
+            )
+            if response.status_code in [200, 201, 207, 206]:
+                return True
+            else:
+                raise HTTPError(
+                    f"Failed to check if directory exists: {response.status_code} - {response.text}",
+                    response=response,
+                )
+        except Exception:
+            return False
+
+    async def create_directory(
+        self, DIRECTORY_PATH: str, create_parents: bool = False
+    ) -> bool:
+        """
+        Creates a directory in Nextcloud with WebDAV MKCOL.
+
+        :param DIRECTORY_PATH: Path of the directory to create.
+        :param create_parents: Also create missing parent directories.
+        :return: True on success or if the directory already exists.
+        """
+        if not isinstance(DIRECTORY_PATH, str) or not DIRECTORY_PATH:
+            raise ValueError("DIRECTORY_PATH must be a non-empty string.")
+
+        response = await self._request_webdav("MKCOL", DIRECTORY_PATH)
+
+        if response.status_code in [200, 201, 207, 206]:
+            return True
+        if response.status_code == 405:
+            return True
+        if response.status_code == 409 and create_parents:
+            # Only the missing segments are created: MKCOL walks up until a parent exists
+            parent = DIRECTORY_PATH.rstrip("/").rsplit("/", 1)[0]
+            if parent.strip("/"):
+                await self.create_directory(parent, create_parents=True)
+                return await self.create_directory(DIRECTORY_PATH)
+        if response.status_code == 409:
+            raise FileNotFoundError(
+                f"Parent directory does not exist for '{DIRECTORY_PATH}'."
+            )
+
+        raise HTTPError(
+            f"Failed to create directory '{DIRECTORY_PATH}': {response.status_code} - {response.text}",
+            response=response,
+        )
+
+    async def iter_directory(
+        self,
+        DIRECTORY_PATH: str,
+        depth: str = "1",
+        include_self: bool = False,
+        profile: Profile = "full",
+    ) -> AsyncIterator[FileInfo]:
+        """
+        Lists a directory with a single PROPFIND and yields its entries as they arrive.
+
+        :param DIRECTORY_PATH: The path of the directory to list.
+        :param depth: PROPFIND depth, "1" or "infinity".
+        :param include_self: Also yield the entry of the directory itself.
+        :param profile: Properties to request, see ``nc_api.xml_query.properties``.
+        :return: Async iterator of FileInfo entries.
+        """
+        response = await self._open_webdav(
+            "PROPFIND",
+            DIRECTORY_PATH,
+            data=propfind_body(profile),
+            headers={"Depth": depth, "Content-Type": "application/xml"},
+        )
+        async with response:
+            if response.status == 404:
+                raise FileNotFoundError(f"Directory not found: {DIRECTORY_PATH}")
+            if response.status != 207:
+                failed = await read_response(response)
+                raise HTTPError(
+                    f"Failed to list directory '{DIRECTORY_PATH}': {failed.status_code} - {failed.text}",
+                    response=failed,
+                )
+
+            parser = MultistatusParser(DIRECTORY_PATH)
+            skip_self = not include_self
+            async for block in response.content.iter_chunked(LISTING_READ_SIZE):
+                for entry in parser.feed(block):
+                    if skip_self:
+                        skip_self = False
+                        continue
+                    yield entry
+            for entry in parser.close():
+                if skip_self:
+                    skip_self = False
+                    continue
+                yield entry
+
+    async def list_directory(
+        self, DIRECTORY_PATH: str, profile: Profile = "full"
+    ) -> List[FileInfo]:
+        """
+        Returns the direct children of a directory (Depth: 1 PROPFIND).
+
+        :param DIRECTORY_PATH: The path of the directory to list.
+        :param profile: Properties to request, see ``nc_api.xml_query.properties``.
+        :return: List of FileInfo entries, without the directory itself.
+        """
+        return [
+            entry
+            async for entry in self.iter_directory(DIRECTORY_PATH, profile=profile)
+        ]
+
+    async def walk(
+        self, DIRECTORY_PATH: str, infinite: bool = True, profile: Profile = "full"
+    ) -> AsyncIterator[FileInfo]:
+        """
+        Yields every entry below a directory, like ``DirectoryManager.walk``.
+
+        :param DIRECTORY_PATH: The path of the directory to walk.
+        :param infinite: Try a Depth: infinity request before crawling.
+        :param profile: Properties to request, see ``nc_api.xml_query.properties``.
+        :return: Async iterator of FileInfo entries, without the directory itself.
+        """
+        if infinite:
+            try:
+                async for entry in self.iter_directory(
+                    DIRECTORY_PATH, depth="infinity", profile=profile
+                ):
+                    yield entry
+                return
+            except HTTPError as e:
+                if e.response is None or e.response.status_code not in [400, 403]:
+                    raise
+
+        pending = deque([DIRECTORY_PATH])
+        while pending:
+            async for entry in self.iter_directory(pending.popleft(), profile=profile):
+                yield entry
+                if entry.is_dir:
+                    pending.append(entry.path)
@@ -0,0 +1,375 @@
+import asyncio
+import os
+import xml.etree.ElementTree as ET
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Union
+
+from requests import HTTPError
+
+from nc_api.aio.base_manager import AsyncBaseManager, read_response
+from nc_api.aio.chunked_upload import AsyncChunkedUploadManager
+from nc_api.aio.streams import aiter_upload
+from nc_api.aio.transport import AsyncTransport
+from nc_api.cache import KnownDirectories
+from nc_api.file_manager import (
+    DEFAULT_CHUNKED_THRESHOLD,
+    PART_SUFFIX,
+    _group_by_parent,
+    _match_group,
+    _remove_silently,
+)
+from nc_api.propfind import MultistatusParser
+from nc_api.retry import RetryPolicy
+from nc_api.streams import DEFAULT_CHUNK_SIZE, ProgressCallback, source_size
+from nc_api.xml_query.properties import Profile, propfind_body
+
+
+class AsyncFileManager(AsyncBaseManager):
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        directory_manager: Optional[Any] = None,
+        transport: Optional[AsyncTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        chunked_uploader: Optional[AsyncChunkedUploadManager] = None,
+        chunked_threshold: Optional[int] = DEFAULT_CHUNKED_THRESHOLD,
+    ) -> None:
+        """
+        :param chunked_uploader: Uploader for large files; created on the same transport if omitted
+        :param chunked_threshold: Size in bytes above which uploads are chunked, None to disable
+        """
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            retry_policy=retry_policy,
+        )
+        self.directory_manager = directory_manager
+        self.known_directories = KnownDirectories()
+        self.chunked_threshold = chunked_threshold
+        self.chunked_uploader = chunked_uploader or AsyncChunkedUploadManager(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=self.transport,
+            retry_policy=retry_policy,
+        )
+
+    async def upload_file(
+        self,
+        LOCAL_UPLOAD_PATH: Optional[str] = None,
+        FILE: Optional[Any] = None,
+        REMOTE_UPLOAD_PATH: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        create_parents: bool = False,
+    ) -> bool:
+        """
+        Uploads a file to Nextcloud. The target directory must exist unless
+        ``create_parents`` is set; it is checked only once per manager.
+
+        Local files, file objects, (async) iterators and mmaps are streamed in
+        ``chunk_size`` blocks; file reads run in the default executor. Uploads
+        of known size above ``chunked_threshold`` are sent with the chunked
+        upload protocol, as in ``FileManager.upload_file``.
+
+        :param LOCAL_UPLOAD_PATH: Local file path to upload
+        :param FILE: Bytes, binary file object, mmap, iterator or async iterator of bytes (alternative to LOCAL_UPLOAD_PATH)
+        :param REMOTE_UPLOAD_PATH: Remote path in Nextcloud
+        :param chunk_size: Size of the blocks sent over the wire
+        :param progress_callback: Called with (bytes_sent, total_size) after each block
+        :param create_parents: Create missing directories of REMOTE_UPLOAD_PATH instead of failing
+        :return: True if successful
+        """
+        try:
+            remote_dir = "/".join(REMOTE_UPLOAD_PATH.split("/")[:-1])
+
+            if remote_dir not in self.known_directories:
+                if create_parents:
+                    await self.directory_manager.create_directory(
+                        remote_dir, create_parents=True
+                    )
+                else:
+                    dir_check = await self.directory_manager.directory_exists_check(
+                        remote_dir
+                    )
+                    if not dir_check:
+                        raise HTTPError(f"Directory does not exist: {remote_dir}")
+                self.known_directories.add(remote_dir)
+
+            # Large files go up in concurrent chunks
+            if FILE is None:
+                size = os.path.getsize(LOCAL_UPLOAD_PATH)
+            elif hasattr(FILE, "__aiter__"):
+                size = None
+            else:
+                size = source_size(FILE)
+            if (
+                self.chunked_threshold is not None
+                and size is not None
+                and size > self.chunked_threshold
+            ):
+                return await self.chunked_uploader.upload(
+                    REMOTE_UPLOAD_PATH,
+                    LOCAL_UPLOAD_PATH=LOCAL_UPLOAD_PATH if FILE is None else None,
+                    FILE=FILE,
+                    progress_callback=progress_callback,
+                )
+
+            if FILE is not None:
+                if isinstance(FILE, bytes) and progress_callback is None:
+                    response = await self._request_webdav(
+                        "PUT", REMOTE_UPLOAD_PATH, data=FILE
+                    )
+                else:
+                    response = await self._put_stream(
+                        REMOTE_UPLOAD_PATH, FILE, chunk_size, progress_callback
+                    )
+            else:
+                with open(LOCAL_UPLOAD_PATH, "rb") as file:
+                    response = await self._put_stream(
+                        REMOTE_UPLOAD_PATH, file, chunk_size, progress_callback
+                    )
+            if response.status_code in [200, 201, 204, 207, 206]:
+                return True
+            else:
+                if response.status_code in [404, 409]:
+                    self.known_directories.discard(remote_dir)
+                raise HTTPError(
+                    f"Failed to upload file: {response.status_code} - {response.text}",
+                    response=response,
+                )
+        except Exception as e:
+            raise Exception(f"Failed to upload file: {e}") from e
+
+    async def _put_stream(
+        self,
+        REMOTE_UPLOAD_PATH: str,
+        source: Any,
+        chunk_size: int,
+        progress_callback: Optional[ProgressCallback],
+    ) -> Any:
+        total = None if hasattr(source, "__aiter__") else source_size(source)
+        headers = {} if total is None else {"Content-Length": str(total)}
+        return await self._request_webdav(
+            "PUT",
+            REMOTE_UPLOAD_PATH,
+            data=aiter_upload(source, chunk_size, progress_callback, total),
+            headers=headers,
+        )
+
+    async def download_file(
+        self,
+        LOCAL_DOWNLOAD_PATH: str,
+        REMOTE_DOWNLOAD_PATH: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> bool:
+        """
+        Downloads a file from Nextcloud.
+
+        Same behaviour as ``FileManager.download_file``: the body is streamed
+        into ``LOCAL_DOWNLOAD_PATH + ".part"``, resumed with a Range request when
+        a partial file and its recorded ETag exist, and renamed over the
+        target when complete.
+
+        :param LOCAL_DOWNLOAD_PATH: Local path to save the file
+        :param REMOTE_DOWNLOAD_PATH: Remote path to download from
+        :param chunk_size: Size of the blocks read from the network
+        :param resume: Continue an existing partial download
+        :param progress_callback: Called with (bytes_received, total_size) after each block
+        :return: True if successful
+        """
+        part_path = LOCAL_DOWNLOAD_PATH + PART_SUFFIX
+        etag_path = part_path + ".etag"
+        loop = asyncio.get_running_loop()
+        try:
+            offset = 0
+            headers: Dict[str, str] = {}
+            if resume and os.path.exists(part_path) and os.path.exists(etag_path):
+                offset = os.path.getsize(part_path)
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+                with open(etag_path, "r") as file:
+                    headers["If-Range"] = file.read()
+
+            response = await self._open_webdav(
+                "GET", REMOTE_DOWNLOAD_PATH, headers=headers
+            )
+            async with response:
+                if response.status == 416:
+                    total = response.headers.get("Content-Range", "").split("/")[-1]
+                    if total.isdigit() and int(total) == offset:
+                        os.replace(part_path, LOCAL_DOWNLOAD_PATH)
+                        _remove_silently(etag_path)
+                        return True
+                    _remove_silently(part_path)
+                    _remove_silently(etag_path)
+                    return await self.download_file(
+                        LOCAL_DOWNLOAD_PATH,
+                        REMOTE_DOWNLOAD_PATH,
+                        chunk_size=chunk_size,
+                        resume=False,
+                        progress_callback=progress_callback,
+                    )
+                if response.status not in [200, 206]:
+                    failed = await read_response(response)
+                    raise HTTPError(
+                        f"Failed to download file: {failed.status_code} - {failed.text}",
+                        response=failed,
+                    )
+
+                if response.status == 200:
+                    offset = 0
+                etag = response.headers.get("ETag")
+                if resume and etag:
+                    with open(etag_path, "w") as file:
+                        file.write(etag)
+
+                total = (
+                    offset + response.content_length
+                    if response.content_length is not None
+                    else None
+                )
+
+                received = offset
+                with open(part_path, "ab" if offset else "wb") as file:
+                    async for block in response.content.iter_chunked(chunk_size):
+                        await loop.run_in_executor(None, file.write, block)
+                        received += len(block)
+                        if progress_callback:
+                            progress_callback(received, total)
+
+            os.replace(part_path, LOCAL_DOWNLOAD_PATH)
+            _remove_silently(etag_path)
+            return True
+        except Exception as e:
+            if not resume:
+                _remove_silently(part_path)
+            raise Exception(f"Failed to download file: {e}") from e
+
+    async def iter_download(
+        self,
+        REMOTE_DOWNLOAD_PATH: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        offset: int = 0,
+    ) -> AsyncIterator[bytes]:
+        """
+        Streams a file from Nextcloud without touching the local disk.
+
+        The request is sent when awaited, so errors surface before iteration:
+        ``async for block in await files.iter_download(path): ...``
+
+        :param REMOTE_DOWNLOAD_PATH: Remote path to download from
+        :param chunk_size: Size of the yielded blocks
+        :param offset: Byte offset to start from (sent as an HTTP Range)
+        :return: Async iterator over the file contents
+        """
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            response = await self._open_webdav(
+                "GET", REMOTE_DOWNLOAD_PATH, headers=headers
+            )
+            if not (
+                response.status == 206 or (response.status == 200 and not offset)
+            ):
+                failed = await read_response(response)
+                raise HTTPError(
+                    f"Failed to download file: {failed.status_code} - {failed.text}",
+                    response=failed,
+                )
+        except Exception as e:
+            raise Exception(f"Failed to download file: {e}") from e
+
+        async def blocks() -> AsyncIterator[bytes]:
+            async with response:
+                async for block in response.content.iter_chunked(chunk_size):
+                    yield block
+
+        return blocks()
+
+    async def get_data_file(
+        self, REMOTE_FILE_PATH: str, profile: Profile = "full"
+    ) -> Union[Dict[str, str], str]:
+        """
+        Retrieves metadata of a file from Nextcloud via WebDAV PROPFIND.
+
+        :param REMOTE_FILE_PATH: Remote file path in Nextcloud
+        :param profile: Properties to request, see ``nc_api.xml_query.properties``
+        :return: Dict with metadata
+        """
+        try:
+            response = await self._request_webdav(
+                "PROPFIND",
+                REMOTE_FILE_PATH,
+                data=propfind_body(profile),
+                headers={"Depth": "0", "Content-Type": "application/xml"},
+            )
+
+            if response.status_code in [200, 201, 207, 206]:
+                parser = MultistatusParser(REMOTE_FILE_PATH)
+                entries = parser.feed(response.content) + parser.close()
+                return entries[0].as_file_data() if entries else {}
+            elif response.status_code == 404:
+                raise FileNotFoundError(f"File not found: {REMOTE_FILE_PATH}")
+            else:
+                raise HTTPError(
+                    f"HTTP error: {response.status_code} - {response.text}",
+                    response=response,
+                )
+
+        except ET.ParseError as e:
+            raise ValueError(f"Failed to parse XML: {e}") from e
+        except Exception as e:
+            raise Exception(f"Failed to retrieve file metadata: {e}") from e
+
+    async def get_data_files(
+        self,
+        REMOTE_FILE_PATHS: Iterable[str],
+        max_workers: int = 8,
+        profile: Profile = "full",
+    ) -> Dict[str, Optional[Dict[str, str]]]:
+        """
+        Retrieves metadata of many files with about one request per directory.
+
+        Same grouping as ``FileManager.get_data_files``: one Depth: 1 PROPFIND
+        per parent directory, at most ``max_workers`` in flight.
+
+        :param REMOTE_FILE_PATHS: Remote file paths in Nextcloud
+        :param max_workers: Number of PROPFIND requests in flight
+        :param profile: Properties to request, see ``nc_api.xml_query.properties``
+        :return: Mapping of every requested path to its metadata dict, None if it does not exist
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive.")
+
+        slots = asyncio.Semaphore(max_workers)
+
+        async def fetch(
+            parent: str, paths: List[str]
+        ) -> Dict[str, Optional[Dict[str, str]]]:
+            target, depth = (paths[0], "0") if len(paths) == 1 else (parent, "1")
+            async with slots:
+                response = await self._request_webdav(
+                    "PROPFIND",
+                    target,
+                    data=propfind_body(profile),
+                    headers={"Depth": depth, "Content-Type": "application/xml"},
+                )
+            return _match_group(target, paths, response)
+
+        results: Dict[str, Optional[Dict[str, str]]] = {}
+        try:
+            groups = _group_by_parent(dict.fromkeys(REMOTE_FILE_PATHS))
+            for found in await asyncio.gather(
+                *(fetch(parent, paths) for parent, paths in groups.items())
+            ):
+                results.update(found)
+        except ET.ParseError as e:
+            raise ValueError(f"Failed to parse XML: {e}") from e
+        except Exception as e:
+            raise Exception(f"Failed to retrieve file metadata: {e}") from e
+        return results
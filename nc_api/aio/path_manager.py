@@ -0,0 +1,304 @@
+import asyncio
+import os
+import posixpath
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from requests import HTTPError
+
+from nc_api.aio.base_manager import AsyncBaseManager
+from nc_api.aio.streams import aiter_upload
+from nc_api.aio.transport import AsyncTransport
+from nc_api.path_manager import _destination_headers
+from nc_api.results import BatchReport, TransferResult
+from nc_api.retry import RetryPolicy
+from nc_api.streams import DEFAULT_CHUNK_SIZE
+
+
+class AsyncPathManager(AsyncBaseManager):
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        directory_manager: Optional[Any] = None,
+        file_manager: Optional[Any] = None,
+        transport: Optional[AsyncTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            retry_policy=retry_policy,
+        )
+        self.directory_manager = directory_manager
+        self.file_manager = file_manager
+
+    async def rename_path(
+        self, CURRENT_PATH: str, NEW_PATH: str, overwrite: bool = True
+    ) -> bool:
+        """
+        Renames or moves a file or directory in Nextcloud.
+
+        :param CURRENT_PATH: The current path of the file or folder.
+        :param NEW_PATH: The new path for the file or folder.
+        :param overwrite: Replace an existing resource at NEW_PATH.
+        :return: True if successful
+        """
+        return await self._move_or_copy("MOVE", CURRENT_PATH, NEW_PATH, overwrite)
+
+    async def copy_path(
+        self,
+        CURRENT_PATH: str,
+        NEW_PATH: str,
+        overwrite: bool = True,
+        depth: str = "infinity",
+    ) -> bool:
+        """
+        Copies a file or directory on the server with WebDAV COPY.
+
+        :param CURRENT_PATH: The path of the file or folder to copy.
+        :param NEW_PATH: The path of the copy.
+        :param overwrite: Replace an existing resource at NEW_PATH.
+        :param depth: "infinity" copies a directory with its contents, "0" only the directory itself.
+        :return: True if successful
+        """
+        return await self._move_or_copy(
+            "COPY", CURRENT_PATH, NEW_PATH, overwrite, depth
+        )
+
+    async def _move_or_copy(
+        self,
+        method: str,
+        CURRENT_PATH: str,
+        NEW_PATH: str,
+        overwrite: bool,
+        depth: Optional[str] = None,
+    ) -> bool:
+        action = "rename/move" if method == "MOVE" else "copy"
+        if not isinstance(CURRENT_PATH, str) or not isinstance(NEW_PATH, str):
+            raise ValueError("Both CURRENT_PATH and NEW_PATH must be strings.")
+
+        new_dir = "/".join(NEW_PATH.split("/")[:-1])
+
+        if new_dir and self.directory_manager:
+            # Best-effort create missing directories
+            try:
+                await self.directory_manager.create_directory(
+                    new_dir, create_parents=True
+                )
+            except Exception:
+                pass
+
+        response = await self._request_webdav(
+            method,
+            CURRENT_PATH,
+            headers=_destination_headers(self._build_url(NEW_PATH), overwrite, depth),
+        )
+
+        if response.status_code in [200, 201, 204, 207, 206]:
+            if method == "MOVE":
+                self._forget_directory(CURRENT_PATH)
+            return True
+        if response.status_code == 404:
+            raise RuntimeError(f"The resource at '{CURRENT_PATH}' does not exist.")
+        if response.status_code == 403:
+            raise PermissionError(f"Permission denied to {action} '{CURRENT_PATH}'.")
+        if response.status_code == 412:
+            raise FileExistsError(f"The resource at '{NEW_PATH}' already exists.")
+        raise HTTPError(
+            f"Failed to {action} '{CURRENT_PATH}': {response.status_code} - {response.text}",
+            response=response,
+        )
+
+    async def delete_path(self, TRAGET_PATH: str) -> str:
+        """
+        Deletes a file or directory in Nextcloud. If the target is a directory, it will be deleted recursively.
+
+        :param TRAGET_PATH: The path of the file or folder to delete.
+        :return: Confirmation message if successful
+        """
+        if not isinstance(TRAGET_PATH, str):
+            raise ValueError("The target_path must be a string.")
+
+        response = await self._request_webdav("DELETE", TRAGET_PATH)
+
+        if response.status_code in [200, 201, 204, 207, 206]:
+            self._forget_directory(TRAGET_PATH)
+            return f"Successfully deleted '{TRAGET_PATH}'."
+        if response.status_code == 404:
+            raise RuntimeError(f"The resource at '{TRAGET_PATH}' does not exist.")
+        if response.status_code == 403:
+            raise PermissionError(f"Permission denied to delete '{TRAGET_PATH}'.")
+        raise HTTPError(
+            f"Failed to delete '{TRAGET_PATH}': {response.status_code} - {response.text}",
+            response=response,
+        )
+
+    def _forget_directory(self, PATH: str) -> None:
+        # Uploads into a moved or deleted directory must check it again
+        known = getattr(self.file_manager, "known_directories", None)
+        if known is not None:
+            known.discard(PATH)
+
+    async def upload_folder(
+        self,
+        LOCAL_FOLDER_PATH: str,
+        REMOTE_FOLDER_PATH: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+    ) -> BatchReport:
+        """
+        Uploads a folder and its contents to Nextcloud, overwriting any existing files.
+
+        Same pipeline as ``PathManager.upload_folder``: directories are created
+        breadth-first, then up to ``max_workers`` files are uploaded at once.
+        Files above the file manager's chunked threshold are sent with the
+        chunked upload protocol. A directory that cannot be created fails the
+        files below it in the report; the rest are still uploaded.
+
+        :param LOCAL_FOLDER_PATH: The local folder path to be uploaded.
+        :param REMOTE_FOLDER_PATH: The remote folder path on Nextcloud.
+        :param chunk_size: Size of the blocks sent over the wire.
+        :param max_workers: Number of files uploaded concurrently.
+        :param retries: Additional attempts per request after a failure.
+        :param backoff: Base delay in seconds between attempts.
+        :return: BatchReport with one TransferResult per file.
+        """
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        tree = await loop.run_in_executor(None, list, os.walk(LOCAL_FOLDER_PATH))
+
+        directories: Dict[int, List[str]] = {}
+        uploads: List[Tuple[str, str]] = []
+        for root, dirs, files in tree:
+            relative_path = os.path.relpath(root, LOCAL_FOLDER_PATH)
+            if relative_path == ".":
+                remote_path = REMOTE_FOLDER_PATH
+            else:
+                remote_path = posixpath.join(
+                    REMOTE_FOLDER_PATH, relative_path.replace("\\", "/")
+                )
+            depth = 0 if relative_path == "." else relative_path.count(os.sep) + 1
+            directories.setdefault(depth, []).append(remote_path)
+
+            for file in files:
+                uploads.append(
+                    (os.path.join(root, file), posixpath.join(remote_path, file))
+                )
+
+        slots = asyncio.Semaphore(max_workers)
+
+        async def bounded(coroutine: Any) -> Any:
+            async with slots:
+                return await coroutine
+
+        # Error of every directory that could not be created, by path
+        failed: Dict[str, str] = {}
+        for depth in sorted(directories):
+            pending = []
+            for path in directories[depth]:
+                key = posixpath.normpath(path)
+                parent_error = failed.get(posixpath.dirname(key))
+                if parent_error is not None:
+                    failed[key] = parent_error
+                else:
+                    pending.append(path)
+            errors = await asyncio.gather(
+                *(
+                    bounded(self._directory_error(path, retries, backoff))
+                    for path in pending
+                )
+            )
+            for path, error in zip(pending, errors):
+                if error is not None:
+                    failed[posixpath.normpath(path)] = error
+
+        async def upload(local: str, remote: str) -> TransferResult:
+            error = failed.get(posixpath.dirname(posixpath.normpath(remote)))
+            if error is not None:
+                return TransferResult(
+                    path=remote, ok=False, local_path=local, attempts=0, error=error
+                )
+            return await self._upload_folder_file(
+                local, remote, chunk_size, retries, backoff
+            )
+
+        results = await asyncio.gather(
+            *(bounded(upload(local, remote)) for local, remote in uploads)
+        )
+        return BatchReport(results=list(results), elapsed=time.monotonic() - started)
+
+    async def _directory_error(
+        self, DIRECTORY_PATH: str, retries: int, backoff: float
+    ) -> Optional[str]:
+        """:return: Why the directory could not be created, None on success"""
+        try:
+            await self._make_directory(DIRECTORY_PATH, retries, backoff)
+        except Exception as e:
+            return str(e)
+        return None
+
+    async def _make_directory(
+        self, DIRECTORY_PATH: str, retries: int, backoff: float
+    ) -> None:
+        response = await self._request_with_retries(
+            "MKCOL", DIRECTORY_PATH, retries=retries, backoff=backoff
+        )
+        if response.status_code not in [200, 201, 405]:
+            raise HTTPError(
+                f"Failed to create directory '{DIRECTORY_PATH}': {response.status_code} - {response.text}",
+                response=response,
+            )
+
+    async def _upload_folder_file(
+        self,
+        local_file_path: str,
+        remote_file_path: str,
+        chunk_size: int,
+        retries: int,
+        backoff: float,
+    ) -> TransferResult:
+        result = TransferResult(
+            path=remote_file_path, ok=False, local_path=local_file_path, attempts=0
+        )
+        try:
+            size = os.path.getsize(local_file_path)
+            threshold = getattr(self.file_manager, "chunked_threshold", None)
+            if threshold is not None and size > threshold:
+                result.attempts = 1
+                result.ok = await self.file_manager.chunked_uploader.upload(
+                    remote_file_path, LOCAL_UPLOAD_PATH=local_file_path
+                )
+                result.bytes = size
+                return result
+
+            with open(local_file_path, "rb") as f:
+
+                def body() -> Any:
+                    result.attempts += 1
+                    f.seek(0)
+                    return aiter_upload(f, chunk_size)
+
+                response = await self._request_with_retries(
+                    "PUT",
+                    remote_file_path,
+                    body=body,
+                    retries=retries,
+                    backoff=backoff,
+                    headers={"Content-Length": str(size)},
+                )
+
+            result.status_code = response.status_code
+            if response.status_code in [200, 201, 204]:
+                result.ok = True
+                result.bytes = size
+            else:
+                result.error = f"Failed to upload {local_file_path}: {response.status_code} - {response.text}"
+        except Exception as e:
+            result.error = str(e)
+        return result
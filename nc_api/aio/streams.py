@@ -0,0 +1,58 @@
+import asyncio
+import mmap
+from typing import Any, AsyncIterator, Optional
+
+from nc_api.streams import (
+    DEFAULT_CHUNK_SIZE,
+    ProgressCallback,
+    UploadSource,
+    UploadStream,
+)
+
+
+async def aiter_upload(
+    source: Any,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress_callback: Optional[ProgressCallback] = None,
+    total_size: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Async counterpart of ``UploadStream``: yields the source in blocks.
+
+    Blocking file reads run in the default executor so the event loop is never
+    stalled by disk I/O. Async iterables are passed through as they come.
+
+    :param source: Bytes, mmap, binary file object, iterator or async iterator of bytes
+    :param chunk_size: Size of the blocks read from sync sources
+    :param progress_callback: Called with (bytes_sent, total_size) after each block
+    :param total_size: Size of the data, reported to the progress callback
+    """
+    sent = 0
+    if hasattr(source, "__aiter__"):
+        blocks = source
+    elif hasattr(source, "read") and not isinstance(source, mmap.mmap):
+        blocks = _aiter_file(source, chunk_size)
+    else:
+        blocks = _aiter_sync(UploadStream(source, chunk_size))
+
+    async for block in blocks:
+        if not block:
+            continue
+        sent += len(block)
+        if progress_callback:
+            progress_callback(sent, total_size)
+        yield block
+
+
+async def _aiter_file(file: Any, chunk_size: int) -> AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    while True:
+        block = await loop.run_in_executor(None, file.read, chunk_size)
+        if not block:
+            break
+        yield block
+
+
+async def _aiter_sync(blocks: UploadSource) -> AsyncIterator[bytes]:
+    for block in blocks:
+        yield block
@@ -0,0 +1,81 @@
+from typing import Any, Optional
+
+import aiohttp
+
+from nc_api.transport import Timeout
+
+
+class AsyncTransport:
+    """
+    Pooled keep-alive HTTP transport for the asyncio client.
+
+    Wraps a single ``aiohttp.ClientSession``. The session is created lazily on
+    first use so the transport can be built outside of a running event loop.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        timeout: Timeout = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        """
+        :param limit: Maximum number of open connections in total
+        :param limit_per_host: Maximum number of open connections per host
+        :param timeout: Default timeout in seconds, or (connect, read) tuple
+        :param session: Existing session to use instead of creating a new one
+        """
+        if limit < 1 or limit_per_host < 1:
+            raise ValueError("limit and limit_per_host must be positive.")
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout: Timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = session
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit, limit_per_host=self.limit_per_host
+                ),
+                timeout=_client_timeout(self.timeout),
+            )
+        return self._session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """
+        Starts a request over the pooled session.
+
+        :param method: HTTP method
+        :param url: Absolute URL
+        :param kwargs: Additional parameters for aiohttp
+        :return: Awaitable / async context manager yielding ``aiohttp.ClientResponse``
+        """
+        if kwargs.get("timeout") is None:
+            kwargs.pop("timeout", None)
+        else:
+            kwargs["timeout"] = _client_timeout(kwargs["timeout"])
+        return self.session.request(method, url, **kwargs)
+
+    async def close(self) -> None:
+        """Closes all pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncTransport":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+def _client_timeout(timeout: Timeout) -> aiohttp.ClientTimeout:
+    if timeout is None:
+        return aiohttp.ClientTimeout(total=None)
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return aiohttp.ClientTimeout(total=None, connect=connect, sock_read=read)
+    return aiohttp.ClientTimeout(total=None, connect=timeout, sock_read=timeout)
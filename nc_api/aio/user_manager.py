@@ -0,0 +1,234 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+from requests import HTTPError
+
+from nc_api.aio.base_manager import AsyncBaseManager
+from nc_api.aio.transport import AsyncTransport
+from nc_api.parsers import loads_json
+from nc_api.retry import RetryPolicy
+from nc_api.user_manager import OCS_NOT_FOUND
+
+
+class AsyncUserManager(AsyncBaseManager):
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        transport: Optional[AsyncTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            retry_policy=retry_policy,
+        )
+
+    async def get_users(
+        self,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Union[List[str], str]:
+        """
+        Retrieves list of users from Nextcloud via OCS API.
+
+        :param search: Optional search filter
+        :param limit: Optional limit
+        :param offset: Optional offset
+        :return: Parsed OCS response
+        """
+        try:
+            url = "ocs/v1.php/cloud/users"
+            params = {"format": "json"}
+
+            if search:
+                params["search"] = search
+            if limit:
+                params["limit"] = limit
+            if offset:
+                params["offset"] = offset
+
+            response = await self._request_webdav(
+                "GET",
+                url,
+                headers={"OCS-APIRequest": "true"},
+                params=params,
+                is_rest=True,
+            )
+
+            if response.status_code in [200, 201, 207, 206]:
+                return loads_json(response.content)
+            else:
+                raise HTTPError(
+                    f"HTTP error: {response.status_code} - {response.text}",
+                    response=response,
+                )
+
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse JSON: {e}") from e
+        except Exception as e:
+            raise Exception(f"Failed to retrieve users list: {e}") from e
+
+    async def get_user(
+        self,
+        username: Optional[str] = None,
+        user_id: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> Union[Dict[str, str], str]:
+        """
+        Retrieves full user data via OCS API for a specific user.
+
+        :param username: Optional username (login)
+        :param user_id: Optional user ID
+        :param name: Optional display name
+        :return: Parsed OCS response
+        """
+        try:
+            userid = username or user_id or name
+            if not userid:
+                raise ValueError("One of username, user_id or name must be provided")
+
+            url = f"/ocs/v1.php/cloud/users/{userid}?format=json"
+
+            response = await self._request_webdav(
+                "GET",
+                url,
+                headers={"OCS-APIRequest": "true"},
+                is_rest=True,
+            )
+
+            if response.status_code in [200, 201, 207, 206]:
+                return loads_json(response.content)
+            elif response.status_code == 404:
+                raise HTTPError(f"User not found: {userid}", response=response)
+            else:
+                raise HTTPError(
+                    f"HTTP error: {response.status_code} - {response.text}",
+                    response=response,
+                )
+
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse JSON: {e}") from e
+        except Exception as e:
+            raise Exception(f"Failed to retrieve user data: {e}") from e
+
+    async def iter_users(
+        self, search: Optional[str] = None, page_size: int = 500
+    ) -> AsyncIterator[str]:
+        """
+        Yields all user IDs, fetching them page by page via OCS API.
+
+        :param search: Optional search filter
+        :param page_size: Users requested per call
+        :return: Async iterator over user IDs
+        """
+        async for page in self._iter_pages("ocs/v1.php/cloud/users", search, page_size):
+            for userid in page:
+                yield userid
+
+    async def iter_users_details(
+        self, search: Optional[str] = None, page_size: int = 500
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yields full user data page by page via ``cloud/users/details``.
+
+        :param search: Optional search filter
+        :param page_size: Users requested per call
+        :return: Async iterator over ``(user ID, user data)`` pairs
+        """
+        async for page in self._iter_pages(
+            "ocs/v1.php/cloud/users/details", search, page_size
+        ):
+            for item in page.items():
+                yield item
+
+    async def get_users_details(
+        self, usernames: Iterable[str], max_workers: int = 8
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Retrieves user data of many users, at most ``max_workers`` requests in flight.
+
+        :param usernames: User IDs to fetch
+        :param max_workers: Number of requests in flight
+        :return: Mapping of every user ID to its data, None if the user does not exist
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive.")
+
+        slots = asyncio.Semaphore(max_workers)
+
+        async def fetch(userid: str) -> Optional[Dict[str, Any]]:
+            async with slots:
+                response = await self._request_webdav(
+                    "GET",
+                    f"ocs/v1.php/cloud/users/{quote(userid, safe='')}",
+                    headers={"OCS-APIRequest": "true"},
+                    params={"format": "json"},
+                    is_rest=True,
+                )
+            if response.status_code == 404:
+                return None
+            if response.status_code != 200:
+                raise HTTPError(
+                    f"HTTP error: {response.status_code} - {response.text}",
+                    response=response,
+                )
+            ocs = loads_json(response.content)["ocs"]
+            if ocs["meta"].get("statuscode") in OCS_NOT_FOUND:
+                return None
+            return ocs["data"]
+
+        userids = list(dict.fromkeys(usernames))
+        try:
+            found = await asyncio.gather(*(fetch(userid) for userid in userids))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse JSON: {e}") from e
+        except Exception as e:
+            raise Exception(f"Failed to retrieve user data: {e}") from e
+        return dict(zip(userids, found))
+
+    async def _iter_pages(
+        self, url: str, search: Optional[str], page_size: int
+    ) -> AsyncIterator[Any]:
+        if page_size < 1:
+            raise ValueError("page_size must be positive.")
+
+        offset = 0
+        while True:
+            params: Dict[str, Any] = {
+                "format": "json",
+                "limit": page_size,
+                "offset": offset,
+            }
+            if search:
+                params["search"] = search
+            try:
+                response = await self._request_webdav(
+                    "GET",
+                    url,
+                    headers={"OCS-APIRequest": "true"},
+                    params=params,
+                    is_rest=True,
+                )
+                if response.status_code != 200:
+                    raise HTTPError(
+                        f"HTTP error: {response.status_code} - {response.text}",
+                        response=response,
+                    )
+                page = loads_json(response.content)["ocs"]["data"]["users"]
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Failed to parse JSON: {e}") from e
+            except Exception as e:
+                raise Exception(f"Failed to retrieve users list: {e}") from e
+
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            offset += page_size
@@ -1,21 +1,49 @@
-from typing import Any, Dict, Optional
+import dataclasses
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import unquote
 
-import requests
 from requests import Response
 from requests.auth import HTTPBasicAuth
 
+from nc_api.cache import MetadataCache
+from nc_api.limits import OVERLOAD_STATUS_CODES, RequestLimiter
+from nc_api.metrics import RequestEvent
+from nc_api.propfind import FileInfo, MultistatusParser
+from nc_api.retry import RetryPolicy
+from nc_api.streams import UploadStream
+from nc_api.transport import Transport
+from nc_api.xml_query.properties import propfind_body
+
+# WebDAV methods that change the resource they are sent to
+WRITE_METHODS = frozenset({"PUT", "MKCOL", "DELETE", "MOVE", "COPY", "PROPPATCH"})
+
 
 class BaseManager:
-    def __init__(self, NEXTCLOUD_URL: str, USERNAME: str, PASSWORD: str) -> None:
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        transport: Optional[Transport] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        limiter: Optional[RequestLimiter] = None,
+    ) -> None:
         self.NEXTCLOUD_URL: str = NEXTCLOUD_URL
         self.USERNAME: str = USERNAME
         self.PASSWORD: str = PASSWORD
+        self.transport: Transport = transport or Transport()
+        self.metadata_cache: Optional[MetadataCache] = metadata_cache
+        self.retry_policy: Optional[RetryPolicy] = retry_policy
+        self.limiter: Optional[RequestLimiter] = limiter
+        self._auth = HTTPBasicAuth(USERNAME, PASSWORD)
 
     def _request_webdav(
         self,
         method: str,
         path: str,
-        data: Optional[bytes | str] = None,
+        data: Optional[Any] = None,
         headers: Optional[Dict[str, str]] = None,
         is_rest: bool = False,
         **kwargs: Any,
@@ -25,27 +53,246 @@ class BaseManager:
 
         :param method: HTTP method (GET, PUT, POST, DELETE, PROPFIND, MOVE, etc.)
         :param path: Path on the Nextcloud server
-        :param data: Data to send (for PUT/POST)
+        :param data: Data to send (for PUT/POST): bytes, str or a streaming body
         :param headers: Additional headers
         :param kwargs: Additional parameters for requests
         :return: requests.Response object
         """
+        policy = self.retry_policy
+        if policy is not None and policy.retries > 0:
+            body = _replayable_body(data)
+            if body is not None:
+                return self._send_with_policy(
+                    policy, method, path, body, headers=headers, is_rest=is_rest, **kwargs
+                )
+        return self._send_webdav(method, path, data, headers, is_rest, **kwargs)
+
+    def _send_webdav(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        is_rest: bool = False,
+        attempt: int = 0,
+        **kwargs: Any,
+    ) -> Response:
+        """Sends a single request, without retries."""
+        url = self._build_url(path, is_rest=is_rest)
+
+        request_headers: Dict[str, str] = headers or {}
+
+        metrics = getattr(self.transport, "metrics", None)
+        event = None
+        if metrics is not None:
+            event = RequestEvent(method, url, attempt=attempt)
+            metrics.started(event)
+
+        limiter = self.limiter
+        # Streamed responses give their slot back once the headers arrive
+        key = limiter.acquire(url) if limiter is not None else None
+        started = time.monotonic()
+        response: Optional[Response] = None
+        try:
+            response = self.transport.request(
+                method,
+                url,
+                data=data,
+                headers=request_headers,
+                auth=self._auth,
+                **kwargs,
+            )
+        except Exception as e:
+            if event is not None:
+                event.error = e
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            if limiter is not None:
+                limiter.release(
+                    key,
+                    elapsed,
+                    response is None
+                    or response.status_code in OVERLOAD_STATUS_CODES,
+                )
+            if event is not None:
+                event.elapsed = elapsed
+                if response is not None:
+                    event.status_code = response.status_code
+                    event.bytes_sent = _bytes_sent(data, response)
+                    event.bytes_received = _bytes_received(
+                        response, kwargs.get("stream", False)
+                    )
+                metrics.finished(event)
+
+        if (
+            self.metadata_cache is not None
+            and method in WRITE_METHODS
+            and response.status_code < 400
+        ):
+            self._invalidate_metadata(method, path, is_rest, request_headers)
+
+        return response
+
+    def _invalidate_metadata(
+        self, method: str, path: str, is_rest: bool, headers: Dict[str, str]
+    ) -> None:
+        """Drops cached metadata made outdated by a successful write request."""
+        # COPY leaves its source untouched; only collections can have cached children
+        if not is_rest and method != "COPY":
+            self.metadata_cache.invalidate_tree(
+                path, recursive=method in ["DELETE", "MOVE"]
+            )
+        destination = headers.get("Destination")
+        files_root = self._build_url("")
+        if destination and destination.startswith(files_root):
+            self.metadata_cache.invalidate_tree(unquote(destination[len(files_root) :]))
+
+    def _revalidate_metadata(self, path: str, cached: FileInfo) -> bool:
+        """
+        Checks a stale cache entry against the server's current ETag.
+
+        :param path: Remote path of the entry
+        :param cached: Stale cached entry
+        :return: True if the entry is still current (and has been refreshed)
+        """
+        if not cached.etag:
+            return False
+        response = self._request_webdav(
+            "PROPFIND",
+            path,
+            data=propfind_body("etag"),
+            headers={"Depth": "0", "Content-Type": "application/xml"},
+        )
+        if response.status_code != 207:
+            if response.status_code == 404:
+                self.metadata_cache.invalidate(path)
+            return False
+        parser = MultistatusParser(path)
+        entries = parser.feed(response.content) + parser.close()
+        if entries and entries[0].etag == cached.etag:
+            self.metadata_cache.touch(path)
+            return True
+        return False
+
+    def _build_url(self, path: str, is_rest: bool = False) -> str:
+        """
+        Builds the absolute URL used by ``_request_webdav`` for a path.
+
+        :param path: Path on the Nextcloud server
+        :param is_rest: Resolve against the server root instead of the WebDAV files root
+        :return: Absolute URL
+        """
         if is_rest:
             url = "/"
         else:
             url = "/remote.php/dav/files/"
-        url = self.NEXTCLOUD_URL + url + path
-        auth = HTTPBasicAuth(self.USERNAME, self.PASSWORD)
+        return self.NEXTCLOUD_URL + url + path
 
-        request_headers: Dict[str, str] = headers or {}
+    def _request_with_retries(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Callable[[], Any]] = None,
+        retries: int = 3,
+        backoff: float = 0.5,
+        on_attempt: Optional[Callable[[int], None]] = None,
+        **kwargs: Any,
+    ) -> Response:
+        """
+        Sends a request, retrying on connection errors and throttling responses.
 
-        response: Response = requests.request(
-            method=method,
-            url=url,
-            data=data,
-            headers=request_headers,
-            auth=auth,
-            **kwargs,
+        Waits for ``Retry-After`` when the server sends it, otherwise for an
+        exponentially growing, jittered delay. The manager's retry policy
+        decides what is retried, so non-idempotent methods (MOVE, COPY) are
+        only sent again when the server refused them or the connection could
+        not be opened; ``retries`` and ``backoff`` override the policy's.
+
+        :param method: HTTP method
+        :param path: Path on the Nextcloud server
+        :param body: Factory returning a fresh request body for every attempt
+        :param retries: Additional attempts after the first one
+        :param backoff: Base delay in seconds
+        :param on_attempt: Called with the attempt number, starting at 1, before every attempt
+        :param kwargs: Additional parameters for ``_request_webdav``
+        :return: Last response received
+        """
+        policy = dataclasses.replace(
+            self.retry_policy or RetryPolicy(), retries=retries, backoff=backoff
+        )
+        return self._send_with_policy(
+            policy, method, path, body, on_attempt=on_attempt, **kwargs
         )
 
-        return response
+    def _send_with_policy(
+        self,
+        policy: RetryPolicy,
+        method: str,
+        path: str,
+        body: Optional[Callable[[], Any]],
+        on_attempt: Optional[Callable[[int], None]] = None,
+        **kwargs: Any,
+    ) -> Response:
+        policy.record_request()
+        attempt = 0
+        while True:
+            if on_attempt is not None:
+                on_attempt(attempt + 1)
+            try:
+                response = self._send_webdav(
+                    method,
+                    path,
+                    data=body() if body else None,
+                    attempt=attempt,
+                    **kwargs,
+                )
+            except OSError as e:
+                # requests' connection and timeout errors derive from OSError
+                if not policy.retry_error(method, e, attempt):
+                    raise
+                delay = policy.delay(attempt)
+            else:
+                if not policy.retry_response(
+                    method, response.status_code, attempt, response
+                ):
+                    return response
+                delay = policy.delay(attempt, response)
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+
+def _replayable_body(data: Any) -> Optional[Callable[[], Any]]:
+    """
+    Returns a factory producing the request body for every attempt, or None
+    if the body is a one-shot stream that cannot be sent twice.
+    """
+    if data is None or isinstance(data, (bytes, bytearray, memoryview, str, dict)):
+        return lambda: data
+    if isinstance(data, UploadStream):
+        try:
+            data.rewind()
+        except ValueError:
+            return None
+
+        def rewound() -> UploadStream:
+            data.rewind()
+            return data
+
+        return rewound
+    return None
+
+
+def _bytes_sent(data: Any, response: Response) -> int:
+    if isinstance(data, UploadStream):
+        return data.bytes_sent
+    length = response.request.headers.get("Content-Length") if response.request else None
+    return int(length) if length and length.isdigit() else 0
+
+
+def _bytes_received(response: Response, stream: bool) -> int:
+    # Streamed bodies are read by the caller; count what the server announced
+    if not stream:
+        return len(response.content)
+    length = response.headers.get("Content-Length", "")
+    return int(length) if length.isdigit() else 0
@@ -0,0 +1,337 @@
+import bisect
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
+
+from nc_api.propfind import FileInfo
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Thread-safe in-process cache with a time-to-live and an LRU size bound.
+
+    Expired entries are kept until evicted so callers can revalidate them
+    (e.g. by ETag) instead of fetching them again from scratch.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param maxsize: Maximum number of entries; least recently used ones are evicted first
+        :param ttl: Seconds an entry stays fresh
+        :param clock: Monotonic time source
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[V, float, bool]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[V], bool]:
+        """
+        :param key: Cache key
+        :return: (value or None, True if the value is still fresh)
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None, False
+            self._data.move_to_end(key)
+            value, expires, valid = item
+            return value, valid and expires > self.clock()
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """
+        :param key: Cache key
+        :param default: Returned when the key is missing or stale
+        :return: Fresh value or default
+        """
+        value, fresh = self.lookup(key)
+        return value if fresh else default
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """
+        :param key: Cache key
+        :param value: Value to store
+        :param ttl: Override of the default time-to-live for this entry
+        """
+        expires = self.clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires, True)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def touch(self, key: Hashable) -> None:
+        """Marks an entry fresh again after a successful revalidation."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                self._data[key] = (item[0], self.clock() + self.ttl, True)
+
+    def expire(self, key: Hashable) -> None:
+        """Marks an entry stale while keeping it available for revalidation."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                self._data[key] = (item[0], item[1], False)
+
+    def alive(self, key: Hashable) -> bool:
+        """True if the entry exists and its TTL has not run out, even if expired by ``expire``."""
+        with self._lock:
+            item = self._data.get(key)
+            return item is not None and item[1] > self.clock()
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class MetadataCache(TTLCache[FileInfo]):
+    """
+    Cache of remote file metadata keyed by normalized path.
+
+    Filled from PROPFIND responses and invalidated by the managers' own
+    PUT/MOVE/COPY/DELETE/MKCOL requests. A write to a path drops the path and
+    everything below it and marks its ancestors stale, because Nextcloud
+    propagates ETag and size changes up the tree.
+    """
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[FileInfo], bool]:
+        return super().lookup(normalize_path(key))
+
+    def set(self, key: Hashable, value: FileInfo, ttl: Optional[float] = None) -> None:
+        super().set(normalize_path(key), value, ttl)
+
+    def touch(self, key: Hashable) -> None:
+        super().touch(normalize_path(key))
+
+    def alive(self, key: Hashable) -> bool:
+        return super().alive(normalize_path(key))
+
+    def invalidate(self, key: Hashable) -> None:
+        super().invalidate(normalize_path(key))
+
+    def is_known_directory(self, path: str) -> bool:
+        """True if ``path`` was seen as a directory within the TTL."""
+        value, _ = self.lookup(path)
+        return value is not None and value.is_dir and self.alive(path)
+
+    def invalidate_tree(self, path: str, recursive: bool = True) -> None:
+        """
+        Drops ``path`` (and its descendants) and marks its ancestors stale.
+
+        :param path: Remote path that was written, moved or deleted
+        :param recursive: Also drop cached entries below ``path``; needs a full scan
+        """
+        key = normalize_path(path)
+        prefix = key.rstrip("/") + "/"
+        with self._lock:
+            self._data.pop(key, None)
+            if recursive:
+                for cached in [k for k in self._data if k.startswith(prefix)]:
+                    del self._data[cached]
+            parent = key
+            while parent != "/":
+                parent = parent.rsplit("/", 1)[0] or "/"
+                item = self._data.get(parent)
+                if item is not None:
+                    self._data[parent] = (item[0], item[1], False)
+
+
+class CacheBackend(Protocol):
+    """
+    Storage used by ``UserCache``. ``TTLCache`` implements it; an adapter
+    over a shared store (Redis, memcached) lets several worker processes use
+    one cache. Values must then survive serialization.
+    """
+
+    def get(self, key: Hashable, default: Any = None) -> Any: ...
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None: ...
+
+    def invalidate(self, key: Hashable) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class UserCache:
+    """
+    Cache of OCS user records keyed by user ID.
+
+    Stores the HTTP status and parsed response of ``cloud/users/<id>``, so
+    unknown users are cached as well (for ``negative_ttl`` seconds) and
+    repeated lookups of a missing ID do not reach the server either.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+        backend: Optional[CacheBackend] = None,
+        prefix: str = "nc_api:user:",
+    ) -> None:
+        """
+        :param maxsize: Maximum number of users kept by the default in-process backend
+        :param ttl: Seconds a found user stays cached
+        :param negative_ttl: Seconds a missing user stays cached, 0 to disable negative caching
+        :param backend: Shared storage; an in-process ``TTLCache`` if omitted
+        :param prefix: Prefix of the backend keys
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.prefix = prefix
+        self.backend: CacheBackend = (
+            backend if backend is not None else TTLCache(maxsize=maxsize, ttl=ttl)
+        )
+
+    def get(self, userid: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        :param userid: User ID
+        :return: Cached (status code, parsed OCS response) or None
+        """
+        entry = self.backend.get(self.prefix + userid)
+        return tuple(entry) if entry is not None else None
+
+    def set(
+        self, userid: str, status_code: int, payload: Dict[str, Any], found: bool = True
+    ) -> None:
+        """
+        :param userid: User ID
+        :param status_code: HTTP status of the response
+        :param payload: Parsed OCS response
+        :param found: False for a missing user, stored for ``negative_ttl`` only
+        """
+        ttl = self.ttl if found else self.negative_ttl
+        if ttl > 0:
+            self.backend.set(self.prefix + userid, (status_code, payload), ttl)
+
+    def invalidate(self, userid: str) -> None:
+        self.backend.invalidate(self.prefix + userid)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+
+class KnownDirectories:
+    """
+    Thread-safe set of remote directories confirmed to exist or created.
+
+    Lets batches of uploads into the same folder skip the existence check
+    after the first one. Paths are normalized; discarding a directory also
+    forgets everything below it. Like ``TTLCache``, entries expire after
+    ``ttl`` seconds and the least recently used ones are evicted beyond
+    ``maxsize``; the root always counts as known.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param maxsize: Maximum number of directories; least recently used ones are evicted first
+        :param ttl: Seconds a directory stays known, bounding how long a removal by another client goes unnoticed
+        :param clock: Monotonic time source
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._expires: "OrderedDict[str, float]" = OrderedDict()
+        # Sorted copy of the keys, so a subtree is one contiguous slice
+        self._sorted: List[str] = []
+        self._lock = threading.Lock()
+
+    def add(self, path: str) -> None:
+        key = normalize_path(path)
+        if key == "/":
+            return
+        with self._lock:
+            if key not in self._expires:
+                bisect.insort(self._sorted, key)
+            self._expires[key] = self.clock() + self.ttl
+            self._expires.move_to_end(key)
+            while len(self._expires) > self.maxsize:
+                self._remove(self._expires.popitem(last=False)[0])
+
+    def discard(self, path: str) -> None:
+        key = normalize_path(path)
+        with self._lock:
+            if key == "/":
+                self._expires.clear()
+                self._sorted = []
+                return
+            # "0" sorts right after "/", so this slice is the key and its subtree
+            start = bisect.bisect_left(self._sorted, key)
+            end = bisect.bisect_left(self._sorted, key + "0", start)
+            stale = [
+                known
+                for known in self._sorted[start:end]
+                if known == key or known.startswith(key + "/")
+            ]
+            for known in stale:
+                self._remove(known)
+                del self._expires[known]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expires.clear()
+            self._sorted = []
+
+    def _remove(self, key: str) -> None:
+        del self._sorted[bisect.bisect_left(self._sorted, key)]
+
+    def __contains__(self, path: object) -> bool:
+        key = normalize_path(path)
+        if key == "/":
+            return True
+        with self._lock:
+            expires = self._expires.get(key)
+            if expires is None:
+                return False
+            if expires <= self.clock():
+                del self._expires[key]
+                self._remove(key)
+                return False
+            self._expires.move_to_end(key)
+            return True
+
+    def __len__(self) -> int:
+        return len(self._expires) + 1
+
+
+def normalize_path(path: Any) -> str:
+    """Canonical form of a remote path: leading slash, no trailing or duplicate slashes."""
+    return "/" + "/".join(part for part in str(path).split("/") if part)
+
@@ -0,0 +1,106 @@
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from nc_api.propfind import FileInfo
+
+CHANGE_KINDS = ("added", "modified", "deleted")
+
+
+@dataclass(slots=True)
+class Change:
+    """One entry of a change feed."""
+
+    kind: str
+    path: str
+    is_dir: bool
+    # Current metadata; None for deleted entries
+    entry: Optional[FileInfo] = None
+
+
+class ChangeIndex:
+    """
+    SQLite-backed record of the ETags seen by ``DirectoryManager.iter_changes``.
+
+    Holds the ETag and type of every entry below the watched directories,
+    keyed by normalized remote path, so a later call can compare listings
+    against it and skip subtrees whose directory ETag did not change.
+    """
+
+    def __init__(self, db_path: str = ":memory:") -> None:
+        """
+        :param db_path: SQLite database file, created if missing; in memory by default
+        """
+        self.db_path = db_path
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "path TEXT PRIMARY KEY, parent TEXT NOT NULL, etag TEXT, "
+            "is_dir INTEGER NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS entries_parent ON entries (parent)"
+        )
+        self._db.commit()
+
+    def get(self, path: str) -> Optional[Tuple[Optional[str], bool]]:
+        """
+        :return: ETag and directory flag of ``path``, None if it is not recorded
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, is_dir FROM entries WHERE path = ?", (path,)
+            ).fetchone()
+        return (row[0], bool(row[1])) if row is not None else None
+
+    def children(self, parent: str) -> Dict[str, Tuple[Optional[str], bool]]:
+        """
+        :return: ETag and directory flag of every recorded child of ``parent``
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT path, etag, is_dir FROM entries WHERE parent = ?", (parent,)
+            ).fetchall()
+        return {row[0]: (row[1], bool(row[2])) for row in rows}
+
+    def put(self, path: str, parent: str, etag: Optional[str], is_dir: bool) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (path, parent, etag, int(is_dir)),
+            )
+
+    def remove_tree(self, path: str) -> List[Tuple[str, bool]]:
+        """
+        Forgets ``path`` and everything below it.
+
+        :return: Path and directory flag of every removed entry
+        """
+        # "0" follows "/", so the range covers exactly the paths below
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT path, is_dir FROM entries "
+                "WHERE path = ? OR (path > ? AND path < ?) ORDER BY path",
+                (path, path + "/", path + "0"),
+            ).fetchall()
+            self._db.execute(
+                "DELETE FROM entries WHERE path = ? OR (path > ? AND path < ?)",
+                (path, path + "/", path + "0"),
+            )
+        return [(row[0], bool(row[1])) for row in rows]
+
+    def commit(self) -> None:
+        with self._lock:
+            self._db.commit()
+
+    def close(self) -> None:
+        self.commit()
+        self._db.close()
+
+    def __enter__(self) -> "ChangeIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
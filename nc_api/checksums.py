@@ -0,0 +1,189 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from nc_api.propfind import FileInfo
+
+# Algorithms usable in the ``OC-Checksum`` header
+CHECKSUM_ALGORITHMS: Dict[str, Callable[..., Any]] = {
+    "SHA1": hashlib.sha1,
+    "MD5": hashlib.md5,
+    "SHA256": hashlib.sha256,
+}
+DEFAULT_CHECKSUM_ALGORITHM = "SHA1"
+HASH_READ_SIZE = 1024 * 1024
+HASH_COMMIT_EVERY = 500
+
+
+class HashCache:
+    """
+    SQLite-backed cache of local file hashes and of uploaded checksums.
+
+    Hashes are keyed by (inode, size, mtime), so a file that was not
+    touched is never read again, whatever its path. For every upload the
+    checksum sent and the ETag the server answered with are kept per remote
+    path, which identifies unchanged remote files even on servers that do
+    not return the stored checksum.
+    """
+
+    def __init__(self, db_path: str = ":memory:") -> None:
+        """
+        :param db_path: SQLite database file, created if missing; in memory by default
+        """
+        self.db_path = db_path
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "inode INTEGER NOT NULL, size INTEGER NOT NULL, mtime INTEGER NOT NULL, "
+            "algorithm TEXT NOT NULL, digest TEXT NOT NULL, "
+            "PRIMARY KEY (inode, size, mtime, algorithm))"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS uploads ("
+            "path TEXT PRIMARY KEY, checksum TEXT NOT NULL, etag TEXT NOT NULL)"
+        )
+        self._db.commit()
+
+    def get(self, stat: os.stat_result, algorithm: str) -> Optional[str]:
+        """
+        :param stat: ``os.stat`` result of the local file
+        :return: Hex digest recorded for this inode, size and mtime, None if unknown
+        """
+        if not stat.st_ino:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT digest FROM hashes "
+                "WHERE inode = ? AND size = ? AND mtime = ? AND algorithm = ?",
+                (stat.st_ino, stat.st_size, stat.st_mtime_ns, algorithm),
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def put(self, stat: os.stat_result, algorithm: str, digest: str) -> None:
+        # Platforms without inode numbers report 0; such files are not cached
+        if not stat.st_ino:
+            return
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?)",
+                (stat.st_ino, stat.st_size, stat.st_mtime_ns, algorithm, digest),
+            )
+            self._written()
+
+    def get_upload(self, remote_path: str) -> Optional[Tuple[str, str]]:
+        """
+        :return: Checksum and ETag of the last upload to ``remote_path``, None if unknown
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT checksum, etag FROM uploads WHERE path = ?", (remote_path,)
+            ).fetchone()
+        return (row[0], row[1]) if row is not None else None
+
+    def put_upload(self, remote_path: str, checksum: str, etag: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO uploads VALUES (?, ?, ?)",
+                (remote_path, checksum, etag),
+            )
+            self._written()
+
+    def commit(self) -> None:
+        with self._lock:
+            self._db.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        self.commit()
+        self._db.close()
+
+    def __enter__(self) -> "HashCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _written(self) -> None:
+        self._pending += 1
+        if self._pending >= HASH_COMMIT_EVERY:
+            self._db.commit()
+            self._pending = 0
+
+
+def file_checksum(
+    local_path: str,
+    algorithm: str = DEFAULT_CHECKSUM_ALGORITHM,
+    cache: Optional[HashCache] = None,
+) -> str:
+    """
+    Hashes a local file, reading it in ``HASH_READ_SIZE`` blocks.
+
+    :param local_path: Local file path
+    :param algorithm: One of ``CHECKSUM_ALGORITHMS``
+    :param cache: Hashes of unchanged files are taken from and stored in this cache
+    :return: Checksum in ``OC-Checksum`` form, e.g. ``"SHA1:2aae6c35..."``
+    """
+    factory = _algorithm(algorithm)
+    stat = os.stat(local_path)
+    digest = cache.get(stat, algorithm) if cache is not None else None
+    if digest is None:
+        hasher = factory()
+        with open(local_path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_READ_SIZE), b""):
+                hasher.update(block)
+        digest = hasher.hexdigest()
+        if cache is not None:
+            cache.put(stat, algorithm, digest)
+    return f"{algorithm}:{digest}"
+
+
+def data_checksum(data: bytes, algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> str:
+    """:return: Checksum of ``data`` in ``OC-Checksum`` form"""
+    return f"{algorithm}:{_algorithm(algorithm)(data).hexdigest()}"
+
+
+def content_matches(
+    remote: Optional[FileInfo],
+    size: int,
+    checksum: str,
+    last_upload: Optional[Tuple[str, str]] = None,
+) -> bool:
+    """
+    Tells whether a remote file already holds the local content.
+
+    The sizes must be equal, and either the server reports the same
+    checksum or the remote ETag is still the one answered to an upload of
+    this checksum.
+
+    :param remote: Remote entry with its ``checksum``, None if the file does not exist
+    :param size: Size of the local content
+    :param checksum: Checksum of the local content in ``OC-Checksum`` form
+    :param last_upload: Checksum and ETag from ``HashCache.get_upload``
+    """
+    if remote is None or remote.is_dir or remote.size != size:
+        return False
+    wanted = checksum.lower()
+    # The server lists every checksum it knows, e.g. "SHA1:... MD5:... ADLER32:..."
+    if remote.checksum and any(
+        known.lower() == wanted for known in remote.checksum.split()
+    ):
+        return True
+    return (
+        last_upload is not None
+        and remote.etag is not None
+        and last_upload[0].lower() == wanted
+        and last_upload[1] == remote.etag
+    )
+
+
+def _algorithm(algorithm: str) -> Callable[..., Any]:
+    factory = CHECKSUM_ALGORITHMS.get(algorithm)
+    if factory is None:
+        raise ValueError(
+            f"Unknown checksum algorithm {algorithm!r}, expected one of {tuple(CHECKSUM_ALGORITHMS)}"
+        )
+    return factory
@@ -0,0 +1,295 @@
+import math
+import mmap
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, Tuple
+
+from requests import HTTPError
+
+from nc_api.base_manager import BaseManager
+from nc_api.cache import MetadataCache
+from nc_api.limits import RequestLimiter
+from nc_api.retry import RetryPolicy
+from nc_api.streams import (
+    DEFAULT_CHUNK_SIZE,
+    ProgressCallback,
+    UploadSource,
+    UploadStream,
+    source_size,
+)
+from nc_api.transport import Transport
+
+DEFAULT_UPLOAD_CHUNK_SIZE = 10 * 1024 * 1024
+# Nextcloud rejects chunks below 5 MiB (except the last) and more than 10000 chunks
+MIN_UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024
+MAX_UPLOAD_CHUNKS = 10000
+
+ChunkBody = Callable[[], Any]
+
+
+class ChunkedUploadManager(BaseManager):
+    """
+    Uploads large files with the Nextcloud chunked upload v2 protocol.
+
+    An upload session is created with MKCOL under
+    ``/remote.php/dav/uploads/<user>/``, numbered chunks are PUT in parallel
+    and retried individually, and the assembled ``.file`` is finally MOVEd to
+    the target path.
+    """
+
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        max_workers: int = 4,
+        retries: int = 3,
+        backoff: float = 0.5,
+        transport: Optional[Transport] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        limiter: Optional[RequestLimiter] = None,
+    ) -> None:
+        """
+        :param chunk_size: Size of every chunk but the last, at least 5 MiB
+        :param max_workers: Number of chunks uploaded in parallel
+        :param retries: Additional attempts per chunk after a failure
+        :param backoff: Base delay in seconds, doubled after every failed attempt
+        """
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            metadata_cache=metadata_cache,
+            retry_policy=retry_policy,
+            limiter=limiter,
+        )
+        if chunk_size < MIN_UPLOAD_CHUNK_SIZE:
+            raise ValueError(
+                f"chunk_size must be at least {MIN_UPLOAD_CHUNK_SIZE} bytes."
+            )
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive.")
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+
+    def upload(
+        self,
+        REMOTE_UPLOAD_PATH: str,
+        LOCAL_UPLOAD_PATH: Optional[str] = None,
+        FILE: Optional[UploadSource] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        checksum: Optional[str] = None,
+    ) -> bool:
+        """
+        Uploads a file in chunks. The target directory must already exist.
+
+        :param REMOTE_UPLOAD_PATH: Remote path in Nextcloud
+        :param LOCAL_UPLOAD_PATH: Local file path to upload
+        :param FILE: Bytes, binary file object, mmap or iterator of bytes (alternative to LOCAL_UPLOAD_PATH)
+        :param progress_callback: Called with (bytes_sent, total_size) after each chunk
+        :param checksum: ``OC-Checksum`` of the whole file, stored when the chunks are assembled
+        :return: True if successful
+        """
+        if FILE is None and LOCAL_UPLOAD_PATH is None:
+            raise ValueError("Either LOCAL_UPLOAD_PATH or FILE must be provided.")
+
+        session_path = (
+            f"remote.php/dav/uploads/{self.USERNAME}/nc-api-{uuid.uuid4().hex}"
+        )
+        headers = {"Destination": self._build_url(REMOTE_UPLOAD_PATH)}
+
+        try:
+            if FILE is not None:
+                total = source_size(FILE)
+            else:
+                total = os.path.getsize(LOCAL_UPLOAD_PATH)
+            self._start_session(session_path, headers, total)
+            self._upload_chunks(
+                session_path,
+                headers,
+                FILE,
+                total,
+                progress_callback,
+                LOCAL_UPLOAD_PATH,
+            )
+
+            if checksum:
+                headers = dict(headers, **{"OC-Checksum": checksum})
+            response = self._request_with_retries(
+                "MOVE",
+                f"{session_path}/.file",
+                retries=self.retries,
+                backoff=self.backoff,
+                headers=headers,
+                is_rest=True,
+            )
+            if response.status_code in [200, 201, 204]:
+                return True
+            raise HTTPError(
+                f"Failed to assemble chunks: {response.status_code} - {response.text}",
+                response=response,
+            )
+        except Exception as e:
+            self._abort_session(session_path)
+            raise Exception(f"Failed to upload file in chunks: {e}") from e
+
+    def _start_session(
+        self, session_path: str, headers: Dict[str, str], total: Optional[int]
+    ) -> None:
+        if total is not None:
+            headers["OC-Total-Length"] = str(total)
+        response = self._request_webdav(
+            "MKCOL", session_path, headers=headers, is_rest=True
+        )
+        if response.status_code not in [200, 201]:
+            raise HTTPError(
+                f"Failed to create upload session: {response.status_code} - {response.text}",
+                response=response,
+            )
+
+    def _abort_session(self, session_path: str) -> None:
+        try:
+            self._request_webdav("DELETE", session_path, is_rest=True)
+        except Exception:
+            pass
+
+    def _upload_chunks(
+        self,
+        session_path: str,
+        headers: Dict[str, str],
+        source: Optional[UploadSource],
+        total: Optional[int],
+        progress_callback: Optional[ProgressCallback],
+        local_path: Optional[str],
+    ) -> None:
+        chunk_size = self.chunk_size
+        if total is not None:
+            chunk_size = max(chunk_size, math.ceil(total / MAX_UPLOAD_CHUNKS))
+
+        sent = 0
+        lock = threading.Lock()
+        failed = threading.Event()
+        # Bound the number of chunks read ahead of the workers
+        slots = threading.BoundedSemaphore(self.max_workers * 2)
+
+        def put_chunk(number: int, body: ChunkBody, size: int) -> None:
+            nonlocal sent
+            try:
+                response = self._request_with_retries(
+                    "PUT",
+                    f"{session_path}/{number}",
+                    body=body,
+                    retries=self.retries,
+                    backoff=self.backoff,
+                    headers=headers,
+                    is_rest=True,
+                )
+                if response.status_code not in [200, 201, 204]:
+                    raise HTTPError(
+                        f"Failed to upload chunk {number}: {response.status_code} - {response.text}",
+                        response=response,
+                    )
+                with lock:
+                    sent += size
+                    if progress_callback:
+                        progress_callback(sent, total)
+            except Exception:
+                failed.set()
+                raise
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = []
+            for number, body, size in _iter_chunks(source, chunk_size, local_path):
+                if number > MAX_UPLOAD_CHUNKS:
+                    raise ValueError(
+                        f"Upload exceeds {MAX_UPLOAD_CHUNKS} chunks, increase chunk_size."
+                    )
+                slots.acquire()
+                if failed.is_set():
+                    slots.release()
+                    break
+                futures.append(executor.submit(put_chunk, number, body, size))
+            for future in futures:
+                future.result()
+
+
+def _iter_chunks(
+    source: Optional[UploadSource], chunk_size: int, local_path: Optional[str]
+) -> Iterator[Tuple[int, ChunkBody, int]]:
+    """Yields (chunk number, body factory, chunk size) for every chunk of the source."""
+    if source is None:
+        # Every attempt reopens its own slice of the file, nothing is buffered
+        total = os.path.getsize(local_path)
+        for number, offset in enumerate(range(0, total, chunk_size), start=1):
+            size = min(chunk_size, total - offset)
+            yield number, _file_slice_body(local_path, offset, size), size
+        return
+
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        view = memoryview(source)
+        for number, offset in enumerate(range(0, len(view), chunk_size), start=1):
+            block = view[offset : offset + chunk_size]
+            yield number, _buffer_body(block), len(block)
+        return
+
+    # File objects and iterators are read sequentially, one chunk in memory per slot
+    blocks = UploadStream(source, DEFAULT_CHUNK_SIZE)
+    number = 0
+    buffer = bytearray()
+    for block in blocks:
+        buffer += block
+        while len(buffer) >= chunk_size:
+            number += 1
+            data = bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+            yield number, _buffer_body(data), len(data)
+    if buffer or number == 0:
+        number += 1
+        yield number, _buffer_body(bytes(buffer)), len(buffer)
+
+
+def _buffer_body(block: Any) -> ChunkBody:
+    return lambda: UploadStream(block, DEFAULT_CHUNK_SIZE)
+
+
+def _file_slice_body(path: str, offset: int, size: int) -> ChunkBody:
+    return lambda: UploadStream(
+        _FileSlice(path, offset, size), DEFAULT_CHUNK_SIZE, total_size=size
+    )
+
+
+class _FileSlice:
+    """Read-only view of ``size`` bytes of a file starting at ``offset``."""
+
+    def __init__(self, path: str, offset: int, size: int) -> None:
+        self.path = path
+        self.offset = offset
+        self.remaining = size
+        self._file: Optional[BinaryIO] = None
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            self.close()
+            return b""
+        if self._file is None:
+            self._file = open(self.path, "rb")
+            self._file.seek(self.offset)
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self._file.read(size)
+        self.remaining = self.remaining - len(data) if data else 0
+        return data
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -1,18 +1,105 @@
+from typing import Any, Dict, Optional
+
 from nc_api.base_manager import BaseManager
+from nc_api.cache import MetadataCache, UserCache
+from nc_api.checksums import HashCache
+from nc_api.chunked_upload import ChunkedUploadManager
 from nc_api.directory_manager import DirectoryManager
 from nc_api.file_manager import FileManager
+from nc_api.limits import RequestLimiter
+from nc_api.metrics import RequestMetrics
 from nc_api.path_manager import PathManager
+from nc_api.retry import RetryBudget, RetryPolicy
+from nc_api.sync import SyncManager
+from nc_api.transport import Timeout, Transport
 from nc_api.user_manager import UserManager
 
 
 class NextcloudClient(BaseManager):
     """Aggregates all managers into a single entry point."""
 
-    def __init__(self, NEXTCLOUD_URL: str, USERNAME: str, PASSWORD: str) -> None:
-        super().__init__(NEXTCLOUD_URL, USERNAME, PASSWORD)
-        self.dirs = DirectoryManager(NEXTCLOUD_URL, USERNAME, PASSWORD)
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        transport: Optional[Transport] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        timeout: Timeout = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        limiter: Optional[RequestLimiter] = None,
+        metrics: Optional[RequestMetrics] = None,
+        user_cache: Optional[UserCache] = None,
+        hash_cache: Optional[HashCache] = None,
+    ) -> None:
+        """
+        :param transport: Shared transport; built from the pool options below if omitted
+        :param pool_connections: Number of per-host connection pools to keep
+        :param pool_maxsize: Maximum number of connections kept per host
+        :param pool_block: Block when all connections to a host are busy
+        :param timeout: Default timeout in seconds, or (connect, read) tuple
+        :param metadata_cache: Cache of file metadata shared by all managers, None to disable
+        :param retries: Retries of failed requests under the default retry policy, 0 to disable
+        :param retry_policy: Retry policy shared by all managers; overrides ``retries``
+        :param limiter: Rate and concurrency limits shared by all managers, None to disable
+        :param metrics: Request statistics to collect into; a new collector is created if omitted
+        :param user_cache: Cache of OCS user records, None to disable
+        :param hash_cache: Cache of local file hashes used by deduplicating uploads
+        """
+        if transport is None:
+            transport = Transport(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                timeout=timeout,
+            )
+        if transport.metrics is None:
+            transport.metrics = metrics or RequestMetrics()
+        self.metrics: RequestMetrics = transport.metrics
+        if retry_policy is None and retries > 0:
+            retry_policy = RetryPolicy(retries=retries, budget=RetryBudget())
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            metadata_cache=metadata_cache,
+            retry_policy=retry_policy,
+            limiter=limiter,
+        )
+        self.dirs = DirectoryManager(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=self.transport,
+            metadata_cache=metadata_cache,
+            retry_policy=retry_policy,
+            limiter=limiter,
+        )
+        self.chunked = ChunkedUploadManager(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=self.transport,
+            metadata_cache=metadata_cache,
+            retry_policy=retry_policy,
+            limiter=limiter,
+        )
         self.files = FileManager(
-            NEXTCLOUD_URL, USERNAME, PASSWORD, directory_manager=self.dirs
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            directory_manager=self.dirs,
+            transport=self.transport,
+            chunked_uploader=self.chunked,
+            metadata_cache=metadata_cache,
+            retry_policy=retry_policy,
+            limiter=limiter,
+            hash_cache=hash_cache,
         )
         self.paths = PathManager(
             NEXTCLOUD_URL,
@@ -20,5 +107,55 @@ class NextcloudClient(BaseManager):
             PASSWORD,
             directory_manager=self.dirs,
             file_manager=self.files,
+            transport=self.transport,
+            metadata_cache=metadata_cache,
+            retry_policy=retry_policy,
+            limiter=limiter,
         )
-        self.users = UserManager(NEXTCLOUD_URL, USERNAME, PASSWORD)
+        self.sync = SyncManager(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            directory_manager=self.dirs,
+            file_manager=self.files,
+            transport=self.transport,
+            metadata_cache=metadata_cache,
+            retry_policy=retry_policy,
+            limiter=limiter,
+        )
+        self.users = UserManager(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=self.transport,
+            retry_policy=retry_policy,
+            limiter=limiter,
+            user_cache=user_cache,
+        )
+
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """
+        Request statistics of all managers plus connection reuse of the pool.
+
+        :return: Dict from ``RequestMetrics.snapshot`` with a "connections" entry
+        """
+        snapshot = self.metrics.snapshot()
+        snapshot["connections"] = self.transport.connection_stats()
+        return snapshot
+
+    def metrics_prometheus(self, prefix: str = "nc_api") -> str:
+        """
+        :param prefix: Prefix of every metric name
+        :return: The client's metrics in the Prometheus text exposition format
+        """
+        return self.metrics.to_prometheus(prefix, self.transport.connection_stats())
+
+    def close(self) -> None:
+        """Closes the pooled connections shared by all managers."""
+        self.transport.close()
+
+    def __enter__(self) -> "NextcloudClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -1,30 +1,81 @@
-from typing import Union
+from collections import deque
+from typing import Iterator, List, Optional, Union
 
 from requests import HTTPError
 
 from nc_api.base_manager import BaseManager
+from nc_api.cache import MetadataCache, normalize_path
+from nc_api.changes import Change, ChangeIndex
+from nc_api.limits import RequestLimiter
+from nc_api.listing import FileTable
+from nc_api.propfind import FileInfo, MultistatusParser
+from nc_api.retry import RetryPolicy
+from nc_api.transport import Transport
+from nc_api.xml_query.properties import Profile, profile_properties, propfind_body
+
+# Size of the pieces of a streamed PROPFIND body handed to the XML parser
+LISTING_READ_SIZE = 64 * 1024
 
 
 class DirectoryManager(BaseManager):
-    def __init__(self, NEXTCLOUD_URL, USERNAME, PASSWORD):
-        super().__init__(NEXTCLOUD_URL, USERNAME, PASSWORD)
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        transport: Optional[Transport] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        limiter: Optional[RequestLimiter] = None,
+    ) -> None:
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            metadata_cache=metadata_cache,
+            retry_policy=retry_policy,
+            limiter=limiter,
+        )
 
-    def directory_exists_check(self, DIRECTORY_PATH: str) -> Union[bool, str]:
+    def directory_exists_check(
+        self, DIRECTORY_PATH: str, profile: Profile = "etag"
+    ) -> Union[bool, str]:
         """
         Checks if a directory exists in Nextcloud storage.
 
         :param DIRECTORY_PATH: The path of the directory to check.
+        :param profile: Properties requested with the check, see ``nc_api.xml_query.properties``.
         :return: True if exists, False if not, or error message string.
         """
+        cache = self.metadata_cache
+        if cache is not None and cache.is_known_directory(DIRECTORY_PATH):
+            return True
         try:
             # Send a PROPFIND request to check if the directory exists
             response = self._request_webdav(
                 "PROPFIND",
                 DIRECTORY_PATH,
-                headers={"Depth": "1"},
+                data=propfind_body(profile),
+                headers={"Depth": "0", "Content-Type": "application/xml"},
             )
             if response.status_code in [200, 201, 207, 206]:
                 # 207 means directory exists (WebDAV specific)
+                if cache is not None:
+                    parser = MultistatusParser(DIRECTORY_PATH)
+                    entries = parser.feed(response.content) + parser.close()
+                    if entries and profile == "full":
+                        cache.set(DIRECTORY_PATH, entries[0])
+                    elif (
+                        entries
+                        and entries[0].is_dir
+                        and cache.lookup(DIRECTORY_PATH)[0] is None
+                    ):
+                        # Existence marker only, get_data_file still fetches full metadata
+                        cache.set(
+                            DIRECTORY_PATH,
+                            FileInfo(DIRECTORY_PATH, href="", is_dir=True),
+                        )
                 return True
             else:
                 raise HTTPError(
@@ -34,11 +85,14 @@ class DirectoryManager(BaseManager):
         except Exception:
             return False
 
-    def create_directory(self, DIRECTORY_PATH: str) -> bool:
+    def create_directory(
+        self, DIRECTORY_PATH: str, create_parents: bool = False
+    ) -> bool:
         """
         Создаёт директорию в Nextcloud с помощью WebDAV MKCOL.
 
         :param DIRECTORY_PATH: Путь директории для создания.
+        :param create_parents: Создать также недостающие родительские директории.
         :return: True при успехе или если директория уже существует.
         """
         if not isinstance(DIRECTORY_PATH, str) or not DIRECTORY_PATH:
@@ -50,6 +104,12 @@ class DirectoryManager(BaseManager):
             return True
         if response.status_code == 405:
             return True
+        if response.status_code == 409 and create_parents:
+            # Only the missing segments are created: MKCOL walks up until a parent exists
+            parent = DIRECTORY_PATH.rstrip("/").rsplit("/", 1)[0]
+            if parent.strip("/"):
+                self.create_directory(parent, create_parents=True)
+                return self.create_directory(DIRECTORY_PATH)
         if response.status_code == 409:
             raise FileNotFoundError(
                 f"Parent directory does not exist for '{DIRECTORY_PATH}'."
@@ -59,3 +119,215 @@ class DirectoryManager(BaseManager):
             f"Failed to create directory '{DIRECTORY_PATH}': {response.status_code} - {response.text}",
             response=response,
         )
+
+    def iter_directory(
+        self,
+        DIRECTORY_PATH: str,
+        depth: str = "1",
+        include_self: bool = False,
+        profile: Profile = "full",
+    ) -> Iterator[FileInfo]:
+        """
+        Lists a directory with a single PROPFIND and yields its entries as they arrive.
+
+        The response is parsed incrementally, so memory use stays bounded and
+        the first entries are available before the whole body is received.
+        Entries of the ``"full"`` profile are stored in the metadata cache
+        when one is configured.
+
+        :param DIRECTORY_PATH: The path of the directory to list.
+        :param depth: PROPFIND depth, "1" or "infinity".
+        :param include_self: Also yield the entry of the directory itself.
+        :param profile: Properties to request, see ``nc_api.xml_query.properties``.
+        :return: Iterator of FileInfo entries.
+        """
+        response = self._request_webdav(
+            "PROPFIND",
+            DIRECTORY_PATH,
+            data=propfind_body(profile),
+            headers={"Depth": depth, "Content-Type": "application/xml"},
+            stream=True,
+        )
+        with response:
+            if response.status_code == 404:
+                raise FileNotFoundError(f"Directory not found: {DIRECTORY_PATH}")
+            if response.status_code != 207:
+                raise HTTPError(
+                    f"Failed to list directory '{DIRECTORY_PATH}': {response.status_code} - {response.text}",
+                    response=response,
+                )
+
+            parser = MultistatusParser(DIRECTORY_PATH)
+
+            def entries() -> Iterator[FileInfo]:
+                for block in response.iter_content(LISTING_READ_SIZE):
+                    yield from parser.feed(block)
+                yield from parser.close()
+
+            # Only complete entries may answer later get_data_file calls
+            cache = self.metadata_cache if profile == "full" else None
+            for index, entry in enumerate(entries()):
+                if cache is not None:
+                    cache.set(entry.path, entry)
+                # The first response describes the directory itself
+                if index == 0 and not include_self:
+                    continue
+                yield entry
+
+    def list_directory(
+        self, DIRECTORY_PATH: str, profile: Profile = "full"
+    ) -> List[FileInfo]:
+        """
+        Returns the direct children of a directory (Depth: 1 PROPFIND).
+
+        :param DIRECTORY_PATH: The path of the directory to list.
+        :param profile: Properties to request, see ``nc_api.xml_query.properties``.
+        :return: List of FileInfo entries, without the directory itself.
+        """
+        return list(self.iter_directory(DIRECTORY_PATH, profile=profile))
+
+    def list_table(
+        self, DIRECTORY_PATH: str, recursive: bool = False, profile: Profile = "full"
+    ) -> FileTable:
+        """
+        Lists a directory (or its whole subtree) into a column-oriented table.
+
+        :param DIRECTORY_PATH: The path of the directory to list.
+        :param recursive: Include every entry below the directory, as ``walk`` does.
+        :param profile: Properties to request, see ``nc_api.xml_query.properties``.
+        :return: FileTable of the entries, without the directory itself.
+        """
+        entries = (
+            self.walk(DIRECTORY_PATH, profile=profile)
+            if recursive
+            else self.iter_directory(DIRECTORY_PATH, profile=profile)
+        )
+        return FileTable.from_entries(entries)
+
+    def walk(
+        self, DIRECTORY_PATH: str, infinite: bool = True, profile: Profile = "full"
+    ) -> Iterator[FileInfo]:
+        """
+        Yields every entry below a directory.
+
+        Tries a single Depth: infinity PROPFIND first; servers that refuse it
+        (Nextcloud does by default) are crawled breadth-first with Depth: 1.
+
+        :param DIRECTORY_PATH: The path of the directory to walk.
+        :param infinite: Try a Depth: infinity request before crawling.
+        :param profile: Properties to request, see ``nc_api.xml_query.properties``.
+        :return: Iterator of FileInfo entries, without the directory itself.
+        """
+        if infinite:
+            try:
+                yield from self.iter_directory(
+                    DIRECTORY_PATH, depth="infinity", profile=profile
+                )
+                return
+            except HTTPError as e:
+                if e.response is None or e.response.status_code not in [400, 403]:
+                    raise
+
+        pending = deque([DIRECTORY_PATH])
+        while pending:
+            for entry in self.iter_directory(pending.popleft(), profile=profile):
+                yield entry
+                if entry.is_dir:
+                    pending.append(entry.path)
+
+    def iter_changes(
+        self, DIRECTORY_PATH: str, index: ChangeIndex, profile: Profile = "minimal"
+    ) -> Iterator[Change]:
+        """
+        Yields the entries added, modified or deleted below a directory since
+        the last call with the same index.
+
+        Nextcloud gives a directory a new ETag whenever anything below it
+        changes, so only directories whose ETag differs from the recorded one
+        are listed (Depth: 1) and an unchanged tree costs one Depth: 0
+        request. Directories are descended into, not reported as modified.
+        The first call with an empty index reports every entry as added.
+
+        Changes are recorded in the index as they are yielded; the ETag of a
+        directory only once its whole subtree has been compared, so a feed
+        stopped halfway resumes the unfinished subtrees on the next call.
+
+        :param DIRECTORY_PATH: The path of the directory to watch.
+        :param index: Record of the previous call, see ``ChangeIndex``.
+        :param profile: Properties of the reported entries, see ``nc_api.xml_query.properties``; ``getetag`` is always added.
+        :return: Iterator of Change entries.
+        """
+        # The feed compares ETags, so they are requested whatever the profile
+        profile = profile_properties(profile)
+        if "d:getetag" not in profile:
+            profile += ("d:getetag",)
+        root = normalize_path(DIRECTORY_PATH)
+        recorded = index.get(root)
+        try:
+            current = list(
+                self.iter_directory(
+                    DIRECTORY_PATH, depth="0", include_self=True, profile="etag"
+                )
+            )
+        except FileNotFoundError:
+            if recorded is None:
+                raise
+            for path, is_dir in index.remove_tree(root):
+                yield Change("deleted", path, is_dir)
+            index.commit()
+            return
+        if recorded is not None and current and recorded[0] == current[0].etag:
+            return
+        yield from self._diff_directory(DIRECTORY_PATH, root, "", index, profile)
+        index.commit()
+
+    def _diff_directory(
+        self,
+        DIRECTORY_PATH: str,
+        key: str,
+        parent: str,
+        index: ChangeIndex,
+        profile: Profile,
+    ) -> Iterator[Change]:
+        try:
+            # Listed in full first: the response must not stay open while subtrees are compared
+            entries = list(
+                self.iter_directory(DIRECTORY_PATH, include_self=True, profile=profile)
+            )
+        except FileNotFoundError:
+            # Removed while the feed was running
+            for path, is_dir in index.remove_tree(key):
+                yield Change("deleted", path, is_dir)
+            return
+        if not entries:
+            return
+
+        recorded = index.children(key)
+        changed_dirs = []
+        for entry in entries[1:]:
+            path = normalize_path(entry.path)
+            before = recorded.pop(path, None)
+            if before is not None and before[1] != entry.is_dir:
+                # Replaced by an entry of the other type
+                for removed, is_dir in index.remove_tree(path):
+                    yield Change("deleted", removed, is_dir)
+                before = None
+            if entry.is_dir:
+                if before is None:
+                    # The ETag is recorded once the subtree has been compared
+                    index.put(path, key, None, True)
+                    yield Change("added", path, True, entry)
+                if before is None or before[0] != entry.etag:
+                    changed_dirs.append(entry)
+            elif before is None or before[0] != entry.etag:
+                index.put(path, key, entry.etag, False)
+                yield Change("added" if before is None else "modified", path, False, entry)
+
+        for path in recorded:
+            for removed, is_dir in index.remove_tree(path):
+                yield Change("deleted", removed, is_dir)
+        for entry in changed_dirs:
+            yield from self._diff_directory(
+                entry.path, normalize_path(entry.path), key, index, profile
+            )
+        index.put(key, parent, entries[0].etag, True)
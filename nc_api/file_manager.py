@@ -1,10 +1,46 @@
+import os
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from requests import HTTPError
+from requests import HTTPError, Response
 
 from nc_api.base_manager import BaseManager
-from nc_api.xml_query.file_manager import propfind_xml
+from nc_api.cache import KnownDirectories, MetadataCache, normalize_path
+from nc_api.checksums import (
+    DEFAULT_CHECKSUM_ALGORITHM,
+    HashCache,
+    content_matches,
+    data_checksum,
+    file_checksum,
+)
+from nc_api.chunked_upload import ChunkedUploadManager
+from nc_api.directory_manager import LISTING_READ_SIZE
+from nc_api.limits import RequestLimiter
+from nc_api.propfind import FileInfo, MultistatusParser
+from nc_api.retry import RetryPolicy
+from nc_api.streams import (
+    DEFAULT_CHUNK_SIZE,
+    ProgressCallback,
+    UploadSource,
+    UploadStream,
+    source_size,
+)
+from nc_api.transport import Transport
+from nc_api.xml_query.properties import Profile, propfind_body
+from nc_api.xml_query.search import SearchQuery
+
+PART_SUFFIX = ".part"
+# Uploads larger than this go through the chunked upload protocol
+DEFAULT_CHUNKED_THRESHOLD = 64 * 1024 * 1024
+# Local files larger than this are hashed in a worker thread while the
+# remote state is requested
+THREADED_HASH_SIZE = 8 * 1024 * 1024
+# Groups of paths in one directory fetched with a Depth: 1 PROPFIND of the
+# parent: at least this many paths when the directory size is unknown ...
+GROUP_LISTING_MIN = 8
+# ... or at least this fraction of the children counted in the cached parent
+GROUP_LISTING_FRACTION = 0.25
 
 
 class FileManager(BaseManager):
@@ -14,45 +50,155 @@ class FileManager(BaseManager):
         USERNAME: str,
         PASSWORD: str,
         directory_manager: Optional[Any] = None,
+        transport: Optional[Transport] = None,
+        chunked_uploader: Optional[ChunkedUploadManager] = None,
+        chunked_threshold: Optional[int] = DEFAULT_CHUNKED_THRESHOLD,
+        metadata_cache: Optional[MetadataCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        limiter: Optional[RequestLimiter] = None,
+        hash_cache: Optional[HashCache] = None,
+        checksum_algorithm: str = DEFAULT_CHECKSUM_ALGORITHM,
     ) -> None:
-        super().__init__(NEXTCLOUD_URL, USERNAME, PASSWORD)
+        """
+        :param directory_manager: Manager used to check the target directory
+        :param chunked_uploader: Uploader for large files; created on the same transport if omitted
+        :param chunked_threshold: Size in bytes above which uploads are chunked, None to disable
+        :param metadata_cache: Optional cache for ``get_data_file`` results
+        :param hash_cache: Cache of local hashes and uploaded checksums for deduplicating uploads
+        :param checksum_algorithm: Algorithm of the ``OC-Checksum`` sent with deduplicating uploads
+        """
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            metadata_cache=metadata_cache,
+            retry_policy=retry_policy,
+            limiter=limiter,
+        )
         self.directory_manager = directory_manager
+        # Directories confirmed or created by earlier uploads are not checked again
+        self.known_directories = KnownDirectories()
+        self.chunked_threshold = chunked_threshold
+        self.hash_cache = hash_cache
+        self.checksum_algorithm = checksum_algorithm
+        self.chunked_uploader = chunked_uploader or ChunkedUploadManager(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=self.transport,
+            metadata_cache=metadata_cache,
+            retry_policy=retry_policy,
+            limiter=limiter,
+        )
 
     def upload_file(
         self,
         LOCAL_UPLOAD_PATH: Optional[str] = None,
-        FILE: Optional[bytes] = None,
+        FILE: Optional[UploadSource] = None,
         REMOTE_UPLOAD_PATH: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        create_parents: bool = False,
+        deduplicate: bool = False,
     ) -> bool:
         """
         Uploads a file to Nextcloud. Creates target directory if needed.
 
+        Local files, file objects, iterators and mmaps are streamed in
+        ``chunk_size`` blocks, so memory use does not grow with file size.
+        Uploads of known size above ``chunked_threshold`` are sent with the
+        chunked upload protocol instead of a single PUT.
+
+        The target directory is checked (or created) only once; later uploads
+        into the same directory skip the request. A directory deleted behind
+        the client's back is forgotten when the upload into it fails.
+
+        With ``deduplicate`` the content of a local file or bytes is hashed
+        first and nothing is sent if the remote file already holds it (see
+        ``check_duplicate``); otherwise the checksum goes along with the
+        upload as ``OC-Checksum``. File objects and iterators are uploaded
+        as usual, since hashing would consume them.
+
         :param LOCAL_UPLOAD_PATH: Local file path to upload
-        :param FILE: Raw file bytes to upload (alternative to LOCAL_UPLOAD_PATH)
+        :param FILE: Bytes, binary file object, mmap or iterator of bytes to upload (alternative to LOCAL_UPLOAD_PATH)
         :param REMOTE_UPLOAD_PATH: Remote path in Nextcloud
+        :param chunk_size: Size of the blocks sent over the wire
+        :param progress_callback: Called with (bytes_sent, total_size) after each block
+        :param create_parents: Create missing directories of REMOTE_UPLOAD_PATH instead of failing
+        :param deduplicate: Skip the transfer if the remote file already has this content
         :return: True if successful
         """
         try:
+            checksum = None
+            if deduplicate:
+                checksum, duplicate = self.check_duplicate(
+                    REMOTE_UPLOAD_PATH, LOCAL_UPLOAD_PATH=LOCAL_UPLOAD_PATH, FILE=FILE
+                )
+                if duplicate:
+                    return True
+            headers = {"OC-Checksum": checksum} if checksum else {}
+
             # Extract directory path from the REMOTE_UPLOAD_PATH
             remote_dir = "/".join(REMOTE_UPLOAD_PATH.split("/")[:-1])
 
             # Check if the directory exists
-            dir_check = self.directory_manager.directory_exists_check(remote_dir)
-            if not dir_check:
-                raise HTTPError(f"Directory does not exist: {remote_dir}")
+            if remote_dir not in self.known_directories:
+                if create_parents:
+                    self.directory_manager.create_directory(
+                        remote_dir, create_parents=True
+                    )
+                else:
+                    dir_check = self.directory_manager.directory_exists_check(
+                        remote_dir
+                    )
+                    if not dir_check:
+                        raise HTTPError(f"Directory does not exist: {remote_dir}")
+                self.known_directories.add(remote_dir)
 
-            # Proceed with file upload
-            if FILE:
-                response = self._request_webdav("PUT", REMOTE_UPLOAD_PATH, data=FILE)
+            # Large files go up in parallel chunks
+            if FILE is not None:
+                size = source_size(FILE)
             else:
-                with open(LOCAL_UPLOAD_PATH, "rb") as file:
-                    file_data = file.read()
+                size = os.path.getsize(LOCAL_UPLOAD_PATH)
+            if (
+                self.chunked_threshold is not None
+                and size is not None
+                and size > self.chunked_threshold
+            ):
+                return self.chunked_uploader.upload(
+                    REMOTE_UPLOAD_PATH,
+                    LOCAL_UPLOAD_PATH=LOCAL_UPLOAD_PATH if FILE is None else None,
+                    FILE=FILE,
+                    progress_callback=progress_callback,
+                    checksum=checksum,
+                )
+
+            # Proceed with file upload
+            if FILE is not None:
+                if isinstance(FILE, bytes) and progress_callback is None:
+                    data = FILE
+                else:
+                    data = UploadStream(FILE, chunk_size, progress_callback)
                 response = self._request_webdav(
-                    "PUT", REMOTE_UPLOAD_PATH, data=file_data
+                    "PUT", REMOTE_UPLOAD_PATH, data=data, headers=headers
                 )
-            if response.status_code in [200, 201, 207, 206]:
+            else:
+                with open(LOCAL_UPLOAD_PATH, "rb") as file:
+                    response = self._request_webdav(
+                        "PUT",
+                        REMOTE_UPLOAD_PATH,
+                        data=UploadStream(file, chunk_size, progress_callback),
+                        headers=headers,
+                    )
+            if response.status_code in [200, 201, 204, 207, 206]:
+                if checksum:
+                    self.record_upload(REMOTE_UPLOAD_PATH, checksum, response)
                 return True
             else:
+                if response.status_code in [404, 409]:
+                    # The parent directory is gone, check it again next time
+                    self.known_directories.discard(remote_dir)
                 raise HTTPError(
                     f"Failed to upload file: {response.status_code} - {response.text}",
                     response=response,
@@ -60,80 +206,291 @@ class FileManager(BaseManager):
         except Exception as e:
             raise Exception(f"Failed to upload file: {e}") from e
 
+    def local_checksum(
+        self,
+        LOCAL_UPLOAD_PATH: Optional[str] = None,
+        FILE: Optional[UploadSource] = None,
+    ) -> Optional[str]:
+        """
+        :param LOCAL_UPLOAD_PATH: Local file path, hashed through the hash cache when one is set
+        :param FILE: Bytes to hash (alternative to LOCAL_UPLOAD_PATH)
+        :return: ``OC-Checksum`` value, None for sources that hashing would consume
+        """
+        if FILE is None:
+            return file_checksum(
+                LOCAL_UPLOAD_PATH, self.checksum_algorithm, self.hash_cache
+            )
+        if isinstance(FILE, (bytes, bytearray)):
+            return data_checksum(FILE, self.checksum_algorithm)
+        return None
+
+    def check_duplicate(
+        self,
+        REMOTE_UPLOAD_PATH: str,
+        LOCAL_UPLOAD_PATH: Optional[str] = None,
+        FILE: Optional[UploadSource] = None,
+    ) -> Tuple[Optional[str], bool]:
+        """
+        Compares local content with the remote file before an upload.
+
+        The remote checksums, size and ETag are fetched with one Depth: 0
+        PROPFIND; local files above ``THREADED_HASH_SIZE`` are hashed in a
+        worker thread meanwhile. See ``content_matches`` for the rules.
+
+        :param REMOTE_UPLOAD_PATH: Remote path in Nextcloud
+        :param LOCAL_UPLOAD_PATH: Local file path
+        :param FILE: Bytes (alternative to LOCAL_UPLOAD_PATH)
+        :return: Checksum of the local content (None if it cannot be hashed) and whether the remote file already holds it
+        """
+        if FILE is not None:
+            if not isinstance(FILE, (bytes, bytearray)):
+                return None, False
+            size = len(FILE)
+        else:
+            size = os.path.getsize(LOCAL_UPLOAD_PATH)
+
+        if FILE is None and size > THREADED_HASH_SIZE:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending = executor.submit(self.local_checksum, LOCAL_UPLOAD_PATH)
+                remote = self._checksum_info(REMOTE_UPLOAD_PATH)
+                checksum = pending.result()
+        else:
+            checksum = self.local_checksum(LOCAL_UPLOAD_PATH, FILE)
+            remote = self._checksum_info(REMOTE_UPLOAD_PATH)
+
+        last_upload = (
+            self.hash_cache.get_upload(normalize_path(REMOTE_UPLOAD_PATH))
+            if self.hash_cache is not None
+            else None
+        )
+        return checksum, content_matches(remote, size, checksum, last_upload)
+
+    def record_upload(
+        self, REMOTE_UPLOAD_PATH: str, checksum: str, response: Response
+    ) -> None:
+        """Stores the checksum sent and the ETag answered in the hash cache."""
+        etag = response.headers.get("OC-ETag") or response.headers.get("ETag")
+        if self.hash_cache is not None and etag:
+            self.hash_cache.put_upload(
+                normalize_path(REMOTE_UPLOAD_PATH), checksum, etag
+            )
+
+    def _checksum_info(self, REMOTE_FILE_PATH: str) -> Optional[FileInfo]:
+        response = self._request_webdav(
+            "PROPFIND",
+            REMOTE_FILE_PATH,
+            data=propfind_body("checksum"),
+            headers={"Depth": "0", "Content-Type": "application/xml"},
+        )
+        if response.status_code == 404:
+            return None
+        if response.status_code != 207:
+            raise HTTPError(
+                f"HTTP error: {response.status_code} - {response.text}",
+                response=response,
+            )
+        parser = MultistatusParser(REMOTE_FILE_PATH)
+        entries = parser.feed(response.content) + parser.close()
+        return entries[0] if entries else None
+
     def download_file(
-        self, LOCAL_DOWNLOAD_PATH: str, REMOTE_DOWNLOAD_PATH: str
+        self,
+        LOCAL_DOWNLOAD_PATH: str,
+        REMOTE_DOWNLOAD_PATH: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> bool:
         """
         Downloads a file from Nextcloud.
 
+        The body is streamed in ``chunk_size`` blocks into
+        ``LOCAL_DOWNLOAD_PATH + ".part"``, which atomically replaces the target
+        once complete. With ``resume`` a leftover partial file is continued
+        with an HTTP Range request instead of starting over; a partial file
+        without the ETag recorded next to it is started over, since nothing
+        would tell whether the remote file changed in between.
+
         :param LOCAL_DOWNLOAD_PATH: Local path to save the file
         :param REMOTE_DOWNLOAD_PATH: Remote path to download from
+        :param chunk_size: Size of the blocks read from the network
+        :param resume: Continue an existing partial download
+        :param progress_callback: Called with (bytes_received, total_size) after each block
         :return: True if successful
         """
+        part_path = LOCAL_DOWNLOAD_PATH + PART_SUFFIX
+        etag_path = part_path + ".etag"
         try:
+            offset = 0
+            headers: Dict[str, str] = {}
+            if resume and os.path.exists(part_path) and os.path.exists(etag_path):
+                offset = os.path.getsize(part_path)
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+                # Server answers 200 with the full body if the file changed
+                with open(etag_path, "r") as file:
+                    headers["If-Range"] = file.read()
+
             # Send a request to GET a file from REMOTE_DOWNLOAD_PATH.
-            response = self._request_webdav("GET", REMOTE_DOWNLOAD_PATH)
-            if response.status_code in [200, 201, 207, 206]:
-                with open(LOCAL_DOWNLOAD_PATH, "wb") as file:
-                    file.write(response.content)
-                return True
-            else:
-                raise HTTPError(
-                    f"Failed to download file: {response.status_code} - {response.text}",
-                    response=response,
-                )
+            response = self._request_webdav(
+                "GET", REMOTE_DOWNLOAD_PATH, headers=headers, stream=True
+            )
+            with response:
+                if response.status_code == 416:
+                    # Partial file is already complete or longer than the remote one
+                    total = response.headers.get("Content-Range", "").split("/")[-1]
+                    if total.isdigit() and int(total) == offset:
+                        os.replace(part_path, LOCAL_DOWNLOAD_PATH)
+                        _remove_silently(etag_path)
+                        return True
+                    _remove_silently(part_path)
+                    _remove_silently(etag_path)
+                    return self.download_file(
+                        LOCAL_DOWNLOAD_PATH,
+                        REMOTE_DOWNLOAD_PATH,
+                        chunk_size=chunk_size,
+                        resume=False,
+                        progress_callback=progress_callback,
+                    )
+                if response.status_code not in [200, 206]:
+                    raise HTTPError(
+                        f"Failed to download file: {response.status_code} - {response.text}",
+                        response=response,
+                    )
+
+                if response.status_code == 200:
+                    offset = 0
+                etag = response.headers.get("ETag")
+                if resume and etag:
+                    with open(etag_path, "w") as file:
+                        file.write(etag)
+
+                length = response.headers.get("Content-Length")
+                total = offset + int(length) if length and length.isdigit() else None
+
+                received = offset
+                with open(part_path, "ab" if offset else "wb") as file:
+                    for block in response.iter_content(chunk_size):
+                        file.write(block)
+                        received += len(block)
+                        if progress_callback:
+                            progress_callback(received, total)
+
+            os.replace(part_path, LOCAL_DOWNLOAD_PATH)
+            _remove_silently(etag_path)
+            return True
         except Exception as e:
+            if not resume:
+                _remove_silently(part_path)
             raise Exception(f"Failed to download file: {e}") from e
 
-    def get_data_file(self, REMOTE_FILE_PATH: str) -> Union[Dict[str, str], str]:
+    def iter_download(
+        self,
+        REMOTE_DOWNLOAD_PATH: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        offset: int = 0,
+    ) -> Iterator[bytes]:
+        """
+        Streams a file from Nextcloud without touching the local disk.
+
+        :param REMOTE_DOWNLOAD_PATH: Remote path to download from
+        :param chunk_size: Size of the yielded blocks
+        :param offset: Byte offset to start from (sent as an HTTP Range)
+        :return: Iterator over the file contents
+        """
+        response = self._open_download_response(REMOTE_DOWNLOAD_PATH, offset)
+
+        def blocks() -> Iterator[bytes]:
+            with response:
+                yield from response.iter_content(chunk_size)
+
+        return blocks()
+
+    def open_download(self, REMOTE_DOWNLOAD_PATH: str, offset: int = 0) -> BinaryIO:
+        """
+        Opens a remote file as a read-only binary stream.
+
+        The caller is responsible for closing the returned object.
+
+        :param REMOTE_DOWNLOAD_PATH: Remote path to download from
+        :param offset: Byte offset to start from (sent as an HTTP Range)
+        :return: File-like object reading the response body
+        """
+        response = self._open_download_response(REMOTE_DOWNLOAD_PATH, offset)
+        response.raw.decode_content = True
+        return response.raw
+
+    def _open_download_response(self, REMOTE_DOWNLOAD_PATH: str, offset: int) -> Response:
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            response = self._request_webdav(
+                "GET", REMOTE_DOWNLOAD_PATH, headers=headers, stream=True
+            )
+            if response.status_code == 206 or (
+                response.status_code == 200 and not offset
+            ):
+                return response
+            message = f"Failed to download file: {response.status_code} - {response.text}"
+            response.close()
+            raise HTTPError(message, response=response)
+        except Exception as e:
+            raise Exception(f"Failed to download file: {e}") from e
+
+    def get_data_file(
+        self, REMOTE_FILE_PATH: str, profile: Profile = "full"
+    ) -> Union[Dict[str, str], str]:
         """
         Retrieves metadata of a file from Nextcloud via WebDAV PROPFIND.
 
+        With a metadata cache, fresh entries are returned without a request and
+        stale ones are revalidated with a cheap ETag-only PROPFIND.
+
         :param REMOTE_FILE_PATH: Remote file path in Nextcloud
+        :param profile: Properties to request, see ``nc_api.xml_query.properties``
         :return: Dict with metadata or error string
         """
+        info = self.get_file_info(REMOTE_FILE_PATH, profile=profile)
+        return info.as_file_data() if info is not None else {}
+
+    def get_file_info(
+        self, REMOTE_FILE_PATH: str, profile: Profile = "full"
+    ) -> Optional[FileInfo]:
+        """
+        Same as ``get_data_file`` but returns the typed entry, with size,
+        modification time and flags already converted.
+
+        Cached entries hold every property and answer any profile; entries
+        fetched with a smaller profile are not cached.
+
+        :param REMOTE_FILE_PATH: Remote file path in Nextcloud
+        :param profile: Properties to request, see ``nc_api.xml_query.properties``
+        :return: FileInfo, None if the response contained no entry
+        """
         try:
+            cache = self.metadata_cache
+            if cache is not None:
+                cached, fresh = cache.lookup(REMOTE_FILE_PATH)
+                # Entries without an ETag only record that a directory exists
+                if cached is not None and cached.etag:
+                    if fresh or self._revalidate_metadata(REMOTE_FILE_PATH, cached):
+                        return cached
+
             # Send PROPFIND request
             response = self._request_webdav(
                 "PROPFIND",
                 REMOTE_FILE_PATH,
-                data=propfind_xml,
+                data=propfind_body(profile),
                 headers={"Depth": "0", "Content-Type": "application/xml"},
             )
 
             if response.status_code in [200, 201, 207, 206]:
-                # Parse XML response
-                root = ET.fromstring(response.text)
-
-                # Collect properties
-                namespace = {
-                    "d": "DAV:",
-                    "oc": "http://owncloud.org/ns",
-                    "nc": "http://nextcloud.org/ns",
-                }
-
-                file_data = {}
-
-                for response_elem in root.findall(".//d:response", namespace):
-                    href = response_elem.find(".//d:href", namespace)
-                    if href is not None:
-                        file_data["href"] = href.text
-
-                    propstat = response_elem.find(".//d:propstat", namespace)
-                    if propstat is not None:
-                        prop = propstat.find(".//d:prop", namespace)
-                        if prop is not None:
-                            # Flatten properties
-                            for elem in prop:
-                                tag_name = elem.tag
-                                # Strip namespace
-                                if "}" in tag_name:
-                                    tag_name = tag_name.split("}")[1]
-
-                                value = elem.text if elem.text else ""
-                                file_data[tag_name] = value
-
-                return file_data
+                parser = MultistatusParser(REMOTE_FILE_PATH)
+                entries = parser.feed(response.content) + parser.close()
+                if not entries:
+                    return None
+                if cache is not None and profile == "full":
+                    cache.set(REMOTE_FILE_PATH, entries[0])
+                return entries[0]
             elif response.status_code == 404:
                 raise RuntimeError(
                     f"File not found: {REMOTE_FILE_PATH}", response=response
@@ -148,3 +505,205 @@ class FileManager(BaseManager):
             raise ValueError(f"Failed to parse XML: {e}") from e
         except Exception as e:
             raise Exception(f"Failed to retrieve file metadata: {e}") from e
+
+    def get_data_files(
+        self,
+        REMOTE_FILE_PATHS: Iterable[str],
+        max_workers: int = 8,
+        profile: Profile = "full",
+    ) -> Dict[str, Optional[Dict[str, str]]]:
+        """
+        Retrieves metadata of many files with about one request per directory.
+
+        Paths are grouped by parent directory. A group that covers a good part
+        of its directory (``GROUP_LISTING_FRACTION`` of the children counted
+        in the cached parent, or ``GROUP_LISTING_MIN`` paths when the count is
+        unknown) is fetched with a single Depth: 1 PROPFIND of the parent;
+        other paths use a Depth: 0 PROPFIND each, so a few files in a large
+        directory do not pull its whole listing. Requests run concurrently.
+
+        :param REMOTE_FILE_PATHS: Remote file paths in Nextcloud
+        :param max_workers: Number of PROPFIND requests in flight
+        :param profile: Properties to request, see ``nc_api.xml_query.properties``
+        :return: Mapping of every requested path to its metadata dict, None if it does not exist
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive.")
+
+        results: Dict[str, Optional[Dict[str, str]]] = {}
+        pending: List[str] = []
+        cache = self.metadata_cache
+        for path in dict.fromkeys(REMOTE_FILE_PATHS):
+            cached = cache.get(path) if cache is not None else None
+            if cached is not None and cached.etag:
+                results[path] = cached.as_file_data()
+            else:
+                pending.append(path)
+
+        try:
+            batches: List[Tuple[str, List[str]]] = []
+            for parent, group in _group_by_parent(pending).items():
+                if self._list_parent(parent, len(group)):
+                    batches.append((parent, group))
+                else:
+                    batches.extend((parent, [path]) for path in group)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for found in executor.map(
+                    lambda batch: self._fetch_group(*batch, profile),
+                    batches,
+                ):
+                    results.update(found)
+        except ET.ParseError as e:
+            raise ValueError(f"Failed to parse XML: {e}") from e
+        except Exception as e:
+            raise Exception(f"Failed to retrieve file metadata: {e}") from e
+        return results
+
+    def _list_parent(self, parent: str, count: int) -> bool:
+        """True if ``count`` paths in ``parent`` are cheaper to fetch with one listing."""
+        if not parent or count < 2:
+            return False
+        cached = (
+            self.metadata_cache.lookup(parent)[0]
+            if self.metadata_cache is not None
+            else None
+        )
+        if (
+            cached is not None
+            and cached.contained_file_count is not None
+            and cached.contained_folder_count is not None
+        ):
+            children = cached.contained_file_count + cached.contained_folder_count
+            return count >= children * GROUP_LISTING_FRACTION
+        return count >= GROUP_LISTING_MIN
+
+    def _fetch_group(
+        self, parent: str, paths: List[str], profile: Profile = "full"
+    ) -> Dict[str, Optional[Dict[str, str]]]:
+        target, depth = (paths[0], "0") if len(paths) == 1 else (parent, "1")
+        response = self._request_webdav(
+            "PROPFIND",
+            target,
+            data=propfind_body(profile),
+            headers={"Depth": depth, "Content-Type": "application/xml"},
+        )
+        cache = self.metadata_cache if profile == "full" else None
+        return _match_group(target, paths, response, cache)
+
+    def search(
+        self, query: SearchQuery, page_size: Optional[int] = None
+    ) -> Iterator[FileInfo]:
+        """
+        Runs a WebDAV SEARCH on the server and yields the matching entries
+        as the response is parsed.
+
+        Filtering, ordering and limits are applied by the server, so finding
+        e.g. the files modified in the last hour costs one query instead of
+        a crawl of the tree. With ``page_size`` the results are fetched in
+        pages of that many entries until a short page arrives; queries
+        without an ordering are then ordered by file ID so pages stay stable.
+
+        :param query: Query built with ``nc_api.xml_query.search``
+        :param page_size: Entries per request, None to fetch all in one response
+        :return: Iterator of FileInfo entries with paths relative to the user's files root
+        """
+        if page_size is not None and page_size < 1:
+            raise ValueError("page_size must be positive.")
+        if page_size is None:
+            yield from self._search_page(query)
+            return
+
+        if not query.ordering:
+            query = query.order_by("fileid")
+        remaining = query.max_results
+        offset = query.offset
+        while remaining is None or remaining > 0:
+            count = page_size if remaining is None else min(page_size, remaining)
+            received = 0
+            for entry in self._search_page(query.limit(count, offset)):
+                received += 1
+                yield entry
+            if received < count:
+                return
+            offset += received
+            if remaining is not None:
+                remaining -= received
+
+    def _search_page(self, query: SearchQuery) -> Iterator[FileInfo]:
+        response = self._request_webdav(
+            "SEARCH",
+            "remote.php/dav/",
+            data=query.to_xml(self.USERNAME).encode(),
+            headers={"Content-Type": "text/xml"},
+            stream=True,
+            is_rest=True,
+        )
+        with response:
+            if response.status_code == 404:
+                raise FileNotFoundError(f"Search scope not found: {query.scope}")
+            if response.status_code != 207:
+                raise HTTPError(
+                    f"Search failed: {response.status_code} - {response.text}",
+                    response=response,
+                )
+
+            parser = MultistatusParser(
+                "", href_root=f"/remote.php/dav/files/{self.USERNAME}"
+            )
+
+            def entries() -> Iterator[FileInfo]:
+                for block in response.iter_content(LISTING_READ_SIZE):
+                    yield from parser.feed(block)
+                yield from parser.close()
+
+            # Entries only carry every property when the default set was selected
+            cache = self.metadata_cache if query.properties is None else None
+            for entry in entries():
+                if cache is not None:
+                    cache.set(entry.path, entry)
+                yield entry
+
+
+def _group_by_parent(paths: Iterable[str]) -> Dict[str, List[str]]:
+    """Groups remote paths by their parent directory."""
+    groups: Dict[str, List[str]] = {}
+    for path in paths:
+        key = normalize_path(path)
+        parent = key.rsplit("/", 1)[0] or "/"
+        # The root has no parent to list, it is fetched on its own
+        groups.setdefault(parent if key != "/" else "", []).append(path)
+    return groups
+
+
+def _match_group(
+    target: str,
+    paths: List[str],
+    response: Any,
+    cache: Optional[MetadataCache] = None,
+) -> Dict[str, Optional[Dict[str, str]]]:
+    """Picks the requested paths out of the PROPFIND response for ``target``."""
+    found: Dict[str, Optional[Dict[str, str]]] = dict.fromkeys(paths)
+    if response.status_code == 404:
+        return found
+    if response.status_code != 207:
+        raise HTTPError(
+            f"HTTP error: {response.status_code} - {response.text}",
+            response=response,
+        )
+
+    parser = MultistatusParser(target)
+    wanted = {normalize_path(path): path for path in paths}
+    for entry in parser.feed(response.content) + parser.close():
+        if cache is not None:
+            cache.set(entry.path, entry)
+        path = wanted.get(normalize_path(entry.path))
+        if path is not None:
+            found[path] = entry.as_file_data()
+    return found
+
+
+def _remove_silently(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,230 @@
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Responses that mean the server is overloaded or throttling this client
+OVERLOAD_STATUS_CODES = frozenset({429, 503, 504})
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: ``rate`` requests per second on average, with
+    bursts of up to ``burst`` requests.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        :param rate: Tokens added per second
+        :param burst: Bucket capacity, ``rate`` (one second worth of tokens) by default
+        :param clock: Monotonic time source
+        :param sleep: Function used to wait for tokens
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Takes tokens from the bucket, waiting until they are available.
+
+        :param tokens: Number of tokens to take
+        :return: Seconds spent waiting
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Reserve the tokens now; a negative balance queues later callers
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the number of requests in flight with AIMD (additive increase,
+    multiplicative decrease).
+
+    Every successful request raises the limit by about one per round trip;
+    an overload signal (429/503/504, a connection error or, if
+    ``latency_target`` is set, a slower response) multiplies it by
+    ``backoff_ratio``, at most once per round trip.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_ratio: float = 0.5,
+        latency_target: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param initial: Starting limit
+        :param min_limit: Lowest limit the controller may reach
+        :param max_limit: Highest limit the controller may reach
+        :param backoff_ratio: Factor applied to the limit on overload
+        :param latency_target: Seconds above which a response counts as overload, None to ignore latency
+        :param clock: Monotonic time source
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial <= max_limit.")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1.")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_target = latency_target
+        self.clock = clock
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Waits until a request may be sent."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        """
+        Returns the slot of a finished request and adjusts the limit.
+
+        :param latency: Seconds the request took
+        :param overloaded: The server signalled overload or the request failed
+        """
+        if self.latency_target is not None and latency > self.latency_target:
+            overloaded = True
+        with self._condition:
+            self._in_flight -= 1
+            now = self.clock()
+            if overloaded:
+                # Requests already in flight report the same overload; react once
+                if now - self._last_decrease >= latency:
+                    self._limit = max(
+                        float(self.min_limit), self._limit * self.backoff_ratio
+                    )
+                    self._last_decrease = now
+            else:
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+
+class RequestLimiter:
+    """
+    Rate and concurrency limits applied to every request of the managers
+    sharing it.
+
+    With ``per_host`` each host gets its own token bucket and concurrency
+    limiter; otherwise one set is shared by all requests of the client.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        concurrency: Optional[int] = 8,
+        max_concurrency: int = 64,
+        adaptive: bool = True,
+        latency_target: Optional[float] = None,
+        per_host: bool = True,
+    ) -> None:
+        """
+        :param rate: Requests per second, None for no rate limit
+        :param burst: Requests allowed at once above the rate, ``rate`` by default
+        :param concurrency: Requests in flight (starting value when adaptive), None for no limit
+        :param max_concurrency: Upper bound of the adaptive concurrency limit
+        :param adaptive: Adjust the concurrency limit with AIMD
+        :param latency_target: Seconds above which a response counts as overload
+        :param per_host: Keep separate limits for every host
+        """
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = concurrency
+        self.max_concurrency = max(max_concurrency, concurrency or 1)
+        self.adaptive = adaptive
+        self.latency_target = latency_target
+        self.per_host = per_host
+        self._hosts: Dict[
+            str, Tuple[Optional[TokenBucket], Optional[AdaptiveConcurrencyLimiter]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> str:
+        """
+        Waits until a request to ``url`` may be sent.
+
+        :param url: Absolute URL of the request
+        :return: Key to pass to ``release``
+        """
+        key = urlsplit(url).netloc if self.per_host else ""
+        bucket, limiter = self._limits(key)
+        if bucket is not None:
+            bucket.acquire()
+        if limiter is not None:
+            limiter.acquire()
+        return key
+
+    def release(self, key: str, latency: float, overloaded: bool) -> None:
+        """
+        :param key: Value returned by ``acquire``
+        :param latency: Seconds the request took
+        :param overloaded: The server signalled overload or the request failed
+        """
+        _, limiter = self._limits(key)
+        if limiter is not None:
+            limiter.release(latency, overloaded)
+
+    def concurrency_limit(self, url: str = "") -> Optional[int]:
+        """Current concurrency limit for the host of ``url``."""
+        key = urlsplit(url).netloc if self.per_host else ""
+        _, limiter = self._limits(key)
+        return limiter.limit if limiter is not None else None
+
+    def _limits(
+        self, key: str
+    ) -> Tuple[Optional[TokenBucket], Optional[AdaptiveConcurrencyLimiter]]:
+        with self._lock:
+            limits = self._hosts.get(key)
+            if limits is None:
+                bucket = TokenBucket(self.rate, self.burst) if self.rate else None
+                limiter = None
+                if self.concurrency is not None:
+                    limiter = AdaptiveConcurrencyLimiter(
+                        initial=self.concurrency,
+                        max_limit=(
+                            self.max_concurrency if self.adaptive else self.concurrency
+                        ),
+                        min_limit=1 if self.adaptive else self.concurrency,
+                        latency_target=self.latency_target,
+                    )
+                limits = self._hosts[key] = (bucket, limiter)
+            return limits
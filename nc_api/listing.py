@@ -0,0 +1,194 @@
+import math
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+
+from nc_api.propfind import FileInfo
+
+Timestamp = Union[datetime, float]
+
+# Columns ``sort_by`` accepts
+SORT_COLUMNS = ("path", "name", "size", "last_modified")
+
+
+class FileTable:
+    """
+    Column-oriented collection of listing entries.
+
+    Sizes, modification times and file IDs are kept in ``array`` columns and
+    directory flags in a ``bytearray``, so a listing of millions of entries
+    costs little more than its path strings, and filtering or sorting by
+    size or time does not build an object per entry. Rows are turned back
+    into ``FileInfo`` only when read; ``href`` and unknown properties are
+    not kept.
+    """
+
+    def __init__(self) -> None:
+        self.paths: List[str] = []
+        self.etags: List[Optional[str]] = []
+        self.content_types: List[Optional[str]] = []
+        self.permissions: List[Optional[str]] = []
+        # -1 / NaN stand for a missing value
+        self.sizes = array("q")
+        self.mtimes = array("d")
+        self.file_ids = array("q")
+        self.dirs = bytearray()
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[FileInfo]) -> "FileTable":
+        """
+        :param entries: FileInfo entries, e.g. from ``DirectoryManager.walk``
+        :return: Table holding the entries
+        """
+        table = cls()
+        for entry in entries:
+            table.append(entry)
+        return table
+
+    def append(self, entry: FileInfo) -> None:
+        self.paths.append(entry.path)
+        self.etags.append(entry.etag)
+        # Few distinct values; interning shares them between rows
+        self.content_types.append(_intern(entry.content_type))
+        self.permissions.append(_intern(entry.permissions))
+        self.sizes.append(entry.size if entry.size is not None else -1)
+        self.mtimes.append(
+            entry.last_modified.timestamp()
+            if entry.last_modified is not None
+            else math.nan
+        )
+        self.file_ids.append(entry.file_id if entry.file_id is not None else -1)
+        self.dirs.append(entry.is_dir)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __getitem__(self, index: int) -> FileInfo:
+        mtime = self.mtimes[index]
+        return FileInfo(
+            path=self.paths[index],
+            href="",
+            is_dir=bool(self.dirs[index]),
+            size=self.sizes[index] if self.sizes[index] >= 0 else None,
+            etag=self.etags[index],
+            last_modified=(
+                datetime.fromtimestamp(mtime, timezone.utc)
+                if not math.isnan(mtime)
+                else None
+            ),
+            content_type=self.content_types[index],
+            file_id=self.file_ids[index] if self.file_ids[index] >= 0 else None,
+            permissions=self.permissions[index],
+        )
+
+    def __iter__(self) -> Iterator[FileInfo]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def take(self, indices: Iterable[int]) -> "FileTable":
+        """
+        :param indices: Row numbers to copy, in the order given
+        :return: New table with the selected rows
+        """
+        table = FileTable()
+        for index in indices:
+            table.paths.append(self.paths[index])
+            table.etags.append(self.etags[index])
+            table.content_types.append(self.content_types[index])
+            table.permissions.append(self.permissions[index])
+            table.sizes.append(self.sizes[index])
+            table.mtimes.append(self.mtimes[index])
+            table.file_ids.append(self.file_ids[index])
+            table.dirs.append(self.dirs[index])
+        return table
+
+    def filter(
+        self,
+        is_dir: Optional[bool] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        modified_after: Optional[Timestamp] = None,
+        modified_before: Optional[Timestamp] = None,
+        suffix: Optional[str] = None,
+    ) -> "FileTable":
+        """
+        Selects rows matching all given conditions.
+
+        Rows with an unknown size or modification time never match a
+        condition on that column.
+
+        :param is_dir: Only directories (True) or only files (False)
+        :param min_size: Smallest size in bytes, inclusive
+        :param max_size: Largest size in bytes, inclusive
+        :param modified_after: Earliest modification time (datetime or epoch seconds), exclusive
+        :param modified_before: Latest modification time (datetime or epoch seconds), exclusive
+        :param suffix: Path suffix, e.g. ``".pdf"``
+        :return: New table with the matching rows
+        """
+        after = _to_timestamp(modified_after)
+        before = _to_timestamp(modified_before)
+        lowest = min_size if min_size is not None else 0
+        highest = max_size if max_size is not None else sys.maxsize
+        check_size = min_size is not None or max_size is not None
+
+        matches = []
+        for index, (size, mtime, directory) in enumerate(
+            zip(self.sizes, self.mtimes, self.dirs)
+        ):
+            if is_dir is not None and bool(directory) != is_dir:
+                continue
+            if check_size and not lowest <= size <= highest:
+                continue
+            # NaN fails every comparison, so unknown times never match
+            if after is not None and not mtime > after:
+                continue
+            if before is not None and not mtime < before:
+                continue
+            if suffix is not None and not self.paths[index].endswith(suffix):
+                continue
+            matches.append(index)
+        return self.take(matches)
+
+    def sort_by(self, column: str = "path", reverse: bool = False) -> "FileTable":
+        """
+        :param column: One of ``SORT_COLUMNS``
+        :param reverse: Sort in descending order
+        :return: New table with the rows sorted; unknown values sort first
+        """
+        paths, mtimes = self.paths, self.mtimes
+
+        def name_key(index: int) -> str:
+            return paths[index].rstrip("/").rsplit("/", 1)[-1]
+
+        def mtime_key(index: int) -> float:
+            return -math.inf if math.isnan(mtimes[index]) else mtimes[index]
+
+        key: Callable[[int], Any]
+        if column == "path":
+            key = paths.__getitem__
+        elif column == "name":
+            key = name_key
+        elif column == "size":
+            key = self.sizes.__getitem__
+        elif column == "last_modified":
+            key = mtime_key
+        else:
+            raise ValueError(f"Cannot sort by {column!r}, expected one of {SORT_COLUMNS}")
+        return self.take(sorted(range(len(self)), key=key, reverse=reverse))
+
+    def total_size(self) -> int:
+        """Sum of the known sizes of all files (directories are not counted)."""
+        return sum(
+            size for size, directory in zip(self.sizes, self.dirs) if not directory and size > 0
+        )
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def _to_timestamp(value: Optional[Timestamp]) -> Optional[float]:
+    if value is None or isinstance(value, (int, float)):
+        return value
+    return value.timestamp()
@@ -0,0 +1,181 @@
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+@dataclass
+class RequestEvent:
+    """One HTTP request sent by a manager, passed to the hooks."""
+
+    method: str
+    url: str
+    status_code: Optional[int] = None
+    elapsed: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    attempt: int = 0
+    error: Optional[BaseException] = None
+
+
+RequestHook = Callable[[RequestEvent], None]
+
+
+class RequestMetrics:
+    """
+    Thread-safe request statistics of a client.
+
+    Collects per-method latency histograms, status code counters, byte
+    counts and retries from every request sent through the transport it
+    is attached to, and calls user hooks before and after each request.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """
+        :param buckets: Upper bounds in seconds of the latency histogram buckets
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.before_request: List[RequestHook] = []
+        self.after_request: List[RequestHook] = []
+        self._lock = threading.Lock()
+        self.reset()
+
+    def add_hooks(
+        self,
+        before: Optional[RequestHook] = None,
+        after: Optional[RequestHook] = None,
+    ) -> None:
+        """
+        :param before: Called with the event before a request is sent
+        :param after: Called with the completed event after the response (or error)
+        """
+        if before is not None:
+            self.before_request.append(before)
+        if after is not None:
+            self.after_request.append(after)
+
+    def started(self, event: RequestEvent) -> None:
+        for hook in self.before_request:
+            hook(event)
+
+    def finished(self, event: RequestEvent) -> None:
+        method = event.method.upper()
+        status = str(event.status_code) if event.status_code is not None else "error"
+        with self._lock:
+            histogram = self._latency.get(method)
+            if histogram is None:
+                histogram = self._latency[method] = [0] * (len(self.buckets) + 1)
+                self._latency_sum[method] = 0.0
+            histogram[bisect_left(self.buckets, event.elapsed)] += 1
+            self._latency_sum[method] += event.elapsed
+            key = (method, status)
+            self._responses[key] = self._responses.get(key, 0) + 1
+            self._bytes_sent += event.bytes_sent
+            self._bytes_received += event.bytes_received
+            if event.attempt:
+                self._retries[method] = self._retries.get(method, 0) + 1
+        for hook in self.after_request:
+            hook(event)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latency: Dict[str, List[int]] = {}
+            self._latency_sum: Dict[str, float] = {}
+            self._responses: Dict[Tuple[str, str], int] = {}
+            self._retries: Dict[str, int] = {}
+            self._bytes_sent = 0
+            self._bytes_received = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        :return: Plain dict with requests, latency, status codes, bytes and retries
+        """
+        with self._lock:
+            latency = {}
+            for method, counts in self._latency.items():
+                total = sum(counts)
+                latency[method] = {
+                    "count": total,
+                    "sum": self._latency_sum[method],
+                    "mean": self._latency_sum[method] / total if total else 0.0,
+                    "buckets": dict(zip(self.buckets + (float("inf"),), counts)),
+                }
+            return {
+                "requests": sum(self._responses.values()),
+                "responses": {
+                    f"{method} {status}": count
+                    for (method, status), count in sorted(self._responses.items())
+                },
+                "latency": latency,
+                "bytes_sent": self._bytes_sent,
+                "bytes_received": self._bytes_received,
+                "retries": dict(self._retries),
+            }
+
+    def to_prometheus(
+        self,
+        prefix: str = "nc_api",
+        connection_stats: Optional[Dict[str, int]] = None,
+    ) -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format, which
+        Prometheus and the OpenTelemetry collector can scrape.
+
+        :param prefix: Prefix of every metric name
+        :param connection_stats: ``Transport.connection_stats()`` to include
+        :return: Exposition text
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        with self._lock:
+            responses = sorted(self._responses.items())
+            retries = sorted(self._retries.items())
+        for (method, status), count in responses:
+            lines.append(
+                f'{prefix}_requests_total{{method="{method}",status="{status}"}} {count}'
+            )
+        lines.append(f"# TYPE {prefix}_request_duration_seconds histogram")
+        for method, histogram in sorted(snapshot["latency"].items()):
+            cumulative = 0
+            for bound, count in histogram["buckets"].items():
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(
+                    f'{prefix}_request_duration_seconds_bucket{{method="{method}",le="{le}"}} {cumulative}'
+                )
+            lines.append(
+                f'{prefix}_request_duration_seconds_sum{{method="{method}"}} {histogram["sum"]}'
+            )
+            lines.append(
+                f'{prefix}_request_duration_seconds_count{{method="{method}"}} {histogram["count"]}'
+            )
+        lines.append(f"# TYPE {prefix}_retries_total counter")
+        for method, count in retries:
+            lines.append(f'{prefix}_retries_total{{method="{method}"}} {count}')
+        lines.append(f"# TYPE {prefix}_bytes_sent_total counter")
+        lines.append(f"{prefix}_bytes_sent_total {snapshot['bytes_sent']}")
+        lines.append(f"# TYPE {prefix}_bytes_received_total counter")
+        lines.append(f"{prefix}_bytes_received_total {snapshot['bytes_received']}")
+        for name, value in sorted((connection_stats or {}).items()):
+            lines.append(f"# TYPE {prefix}_pool_{name}_total counter")
+            lines.append(f"{prefix}_pool_{name}_total {value}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,88 @@
+import json
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - optional speedup
+    lxml_etree = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+XML_BACKENDS = ("lxml", "etree")
+JSON_BACKENDS = ("orjson", "json")
+
+# The C-accelerated ElementTree parser stays the XML default: on streamed
+# multistatus bodies lxml is slower, since every element it hands back is a
+# new Python proxy. lxml is kept for its huge_tree support.
+_backends: Dict[str, str] = {
+    "xml": "etree",
+    "json": "orjson" if orjson is not None else "json",
+}
+
+
+def get_backends() -> Dict[str, str]:
+    """
+    :return: Names of the XML and JSON backends in use
+    """
+    return dict(_backends)
+
+
+def set_backends(xml: Optional[str] = None, json: Optional[str] = None) -> None:
+    """
+    Selects the parsers used for WebDAV and OCS responses.
+
+    By default orjson is used for JSON when installed (``pip install
+    nc-api[speedups]``) and the standard library parser for XML.
+
+    :param xml: ``"lxml"`` or ``"etree"``, None to keep the current one
+    :param json: ``"orjson"`` or ``"json"``, None to keep the current one
+    """
+    if xml is not None:
+        if xml not in XML_BACKENDS:
+            raise ValueError(f"Unknown XML backend: {xml}")
+        if xml == "lxml" and lxml_etree is None:
+            raise ValueError("lxml is not installed.")
+        _backends["xml"] = xml
+    if json is not None:
+        if json not in JSON_BACKENDS:
+            raise ValueError(f"Unknown JSON backend: {json}")
+        if json == "orjson" and orjson is None:
+            raise ValueError("orjson is not installed.")
+        _backends["json"] = json
+
+
+def xml_pull_parser(events: Tuple[str, ...] = ("start", "end")) -> Any:
+    """
+    Incremental XML parser of the selected backend.
+
+    Both backends share the ``feed``/``read_events``/``close`` interface
+    and return elements supporting the ElementTree API.
+    """
+    if _backends["xml"] == "lxml":
+        # huge_tree lifts the libxml2 limits that long listings can hit
+        return lxml_etree.XMLPullParser(
+            events=events, huge_tree=True, resolve_entities=False
+        )
+    return ET.XMLPullParser(events=events)
+
+
+def xml_parse_errors() -> Tuple[type, ...]:
+    """Exception types raised by the XML backends on malformed input."""
+    if lxml_etree is not None:
+        return (ET.ParseError, lxml_etree.XMLSyntaxError)
+    return (ET.ParseError,)
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Decodes a JSON body straight from the response bytes.
+
+    Both backends raise ``json.JSONDecodeError`` (orjson subclasses it).
+    """
+    if _backends["json"] == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
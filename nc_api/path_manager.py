@@ -1,9 +1,20 @@
 import os
-from typing import Optional
+import posixpath
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from requests import HTTPError
 
 from nc_api.base_manager import BaseManager
+from nc_api.cache import MetadataCache, normalize_path
+from nc_api.checksums import content_matches
+from nc_api.limits import RequestLimiter
+from nc_api.propfind import FileInfo
+from nc_api.results import BatchReport, TransferResult
+from nc_api.retry import RetryPolicy
+from nc_api.streams import DEFAULT_CHUNK_SIZE, UploadStream
+from nc_api.transport import Transport
 
 
 class PathManager(BaseManager):
@@ -14,19 +25,63 @@ class PathManager(BaseManager):
         PASSWORD: str,
         directory_manager: Optional[object] = None,
         file_manager: Optional[object] = None,
+        transport: Optional[Transport] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        limiter: Optional[RequestLimiter] = None,
     ) -> None:
-        super().__init__(NEXTCLOUD_URL, USERNAME, PASSWORD)
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            metadata_cache=metadata_cache,
+            retry_policy=retry_policy,
+            limiter=limiter,
+        )
         self.directory_manager = directory_manager
         self.file_manager = file_manager
 
-    def rename_path(self, CURRENT_PATH: str, NEW_PATH: str) -> bool:
+    def rename_path(
+        self, CURRENT_PATH: str, NEW_PATH: str, overwrite: bool = True
+    ) -> bool:
         """
         Renames or moves a file or directory in Nextcloud. If the new path requires non-existent folders, they will be created.
 
         :param CURRENT_PATH: The current path of the file or folder.
         :param NEW_PATH: The new path for the file or folder.
+        :param overwrite: Replace an existing resource at NEW_PATH.
         :return: True if successful
         """
+        return self._move_or_copy("MOVE", CURRENT_PATH, NEW_PATH, overwrite)
+
+    def copy_path(
+        self,
+        CURRENT_PATH: str,
+        NEW_PATH: str,
+        overwrite: bool = True,
+        depth: str = "infinity",
+    ) -> bool:
+        """
+        Copies a file or directory on the server with WebDAV COPY, without transferring its content.
+
+        :param CURRENT_PATH: The path of the file or folder to copy.
+        :param NEW_PATH: The path of the copy.
+        :param overwrite: Replace an existing resource at NEW_PATH.
+        :param depth: "infinity" copies a directory with its contents, "0" only the directory itself.
+        :return: True if successful
+        """
+        return self._move_or_copy("COPY", CURRENT_PATH, NEW_PATH, overwrite, depth)
+
+    def _move_or_copy(
+        self,
+        method: str,
+        CURRENT_PATH: str,
+        NEW_PATH: str,
+        overwrite: bool,
+        depth: Optional[str] = None,
+    ) -> bool:
+        action = "rename/move" if method == "MOVE" else "copy"
         try:
             # Ensure the paths are valid strings
             if not isinstance(CURRENT_PATH, str) or not isinstance(NEW_PATH, str):
@@ -39,35 +94,34 @@ class PathManager(BaseManager):
             if new_dir and self.directory_manager:
                 # Best-effort create missing directories
                 try:
-                    self.directory_manager.CreateDirectory(new_dir)
+                    self.directory_manager.create_directory(
+                        new_dir, create_parents=True
+                    )
                 except Exception:
                     pass
 
-            # Construct the full URLs for the old and new paths
-            new_url = f"{self.NEXTCLOUD_URL}{NEW_PATH}"
-
-            # Send the MOVE request to rename/move the resource
+            # Send the MOVE/COPY request
             response = self._request_webdav(
-                "MOVE",
+                method,
                 CURRENT_PATH,
-                headers={"Destination": new_url},
+                headers=_destination_headers(
+                    self._build_url(NEW_PATH), overwrite, depth
+                ),
             )
 
             # Handle the response
-            if response.status_code in [200, 201, 207, 206]:
+            if response.status_code in [200, 201, 204, 207, 206]:
+                if method == "MOVE":
+                    self._forget_directory(CURRENT_PATH)
                 return True
             if response.status_code == 404:
-                raise RuntimeError(
-                    f"The resource at '{CURRENT_PATH}' does not exist.",
-                    response=response,
-                )
+                raise RuntimeError(f"The resource at '{CURRENT_PATH}' does not exist.")
             if response.status_code == 403:
-                raise PermissionError(
-                    f"Permission denied to rename/move '{CURRENT_PATH}'.",
-                    response=response,
-                )
+                raise PermissionError(f"Permission denied to {action} '{CURRENT_PATH}'.")
+            if response.status_code == 412:
+                raise FileExistsError(f"The resource at '{NEW_PATH}' already exists.")
             raise HTTPError(
-                f"Failed to rename/move '{CURRENT_PATH}': {response.status_code} - {response.text}",
+                f"Failed to {action} '{CURRENT_PATH}': {response.status_code} - {response.text}",
                 response=response,
             )
 
@@ -90,7 +144,8 @@ class PathManager(BaseManager):
             response = self._request_webdav("DELETE", TRAGET_PATH)
 
             # Handle the response
-            if response.status_code in [200, 201, 207, 206]:
+            if response.status_code in [200, 201, 204, 207, 206]:
+                self._forget_directory(TRAGET_PATH)
                 return f"Successfully deleted '{TRAGET_PATH}'."
             if response.status_code == 404:
                 raise RuntimeError(f"The resource at '{TRAGET_PATH}' does not exist.")
@@ -104,53 +159,491 @@ class PathManager(BaseManager):
         except Exception:
             raise
 
-    def upload_folder(self, LOCAL_FOLDER_PATH: str, REMOTE_FOLDER_PATH: str) -> None:
+    def move_paths(
+        self,
+        PATHS: Iterable[Tuple[str, str]],
+        overwrite: bool = True,
+        max_workers: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+    ) -> BatchReport:
+        """
+        Moves many files or directories concurrently with server-side MOVE requests.
+
+        :param PATHS: (current path, new path) pairs.
+        :param overwrite: Replace existing resources at the new paths.
+        :param max_workers: Number of requests in flight.
+        :param retries: Additional attempts per request after a failure.
+        :param backoff: Base delay in seconds between attempts.
+        :return: BatchReport with one TransferResult per pair.
+        """
+        return self._bulk("MOVE", list(PATHS), overwrite, None, max_workers, retries, backoff)
+
+    def copy_paths(
+        self,
+        PATHS: Iterable[Tuple[str, str]],
+        overwrite: bool = True,
+        depth: str = "infinity",
+        max_workers: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+    ) -> BatchReport:
+        """
+        Copies many files or directories concurrently with server-side COPY requests.
+
+        :param PATHS: (current path, new path) pairs.
+        :param overwrite: Replace existing resources at the new paths.
+        :param depth: "infinity" copies directories with their contents, "0" only the directories.
+        :param max_workers: Number of requests in flight.
+        :param retries: Additional attempts per request after a failure.
+        :param backoff: Base delay in seconds between attempts.
+        :return: BatchReport with one TransferResult per pair.
+        """
+        return self._bulk("COPY", list(PATHS), overwrite, depth, max_workers, retries, backoff)
+
+    def delete_paths(
+        self,
+        PATHS: Iterable[str],
+        max_workers: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+    ) -> BatchReport:
+        """
+        Deletes many files or directories concurrently.
+
+        :param PATHS: Paths of the files or folders to delete.
+        :param max_workers: Number of requests in flight.
+        :param retries: Additional attempts per request after a failure.
+        :param backoff: Base delay in seconds between attempts.
+        :return: BatchReport with one TransferResult per path.
+        """
+        items = [(path, None) for path in PATHS]
+        return self._bulk("DELETE", items, True, None, max_workers, retries, backoff)
+
+    def _bulk(
+        self,
+        method: str,
+        items: List[Tuple[str, Optional[str]]],
+        overwrite: bool,
+        depth: Optional[str],
+        max_workers: int,
+        retries: int,
+        backoff: float,
+    ) -> BatchReport:
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Every target directory is created once, not once per item
+            parents = {
+                posixpath.dirname(new_path.rstrip("/"))
+                for _, new_path in items
+                if new_path is not None
+            }
+            parents.discard("")
+            parents.discard("/")
+            if parents and self.directory_manager:
+                for _ in executor.map(
+                    lambda path: self._create_parents(path), sorted(parents)
+                ):
+                    pass
+
+            results = list(
+                executor.map(
+                    lambda item: self._bulk_item(
+                        method, item[0], item[1], overwrite, depth, retries, backoff
+                    ),
+                    items,
+                )
+            )
+        return BatchReport(results=results, elapsed=time.monotonic() - started)
+
+    def _create_parents(self, DIRECTORY_PATH: str) -> None:
+        try:
+            self.directory_manager.create_directory(
+                DIRECTORY_PATH, create_parents=True
+            )
+        except Exception:
+            # The item requests report the failure per path
+            pass
+
+    def _bulk_item(
+        self,
+        method: str,
+        CURRENT_PATH: str,
+        NEW_PATH: Optional[str],
+        overwrite: bool,
+        depth: Optional[str],
+        retries: int,
+        backoff: float,
+    ) -> TransferResult:
+        result = TransferResult(
+            path=CURRENT_PATH,
+            ok=False,
+            attempts=0,
+            action=method.lower(),
+            destination=NEW_PATH,
+        )
+
+        def count(attempt: int) -> None:
+            result.attempts = attempt
+
+        headers = None
+        if NEW_PATH is not None:
+            headers = _destination_headers(self._build_url(NEW_PATH), overwrite, depth)
+        try:
+            response = self._request_with_retries(
+                method,
+                CURRENT_PATH,
+                retries=retries,
+                backoff=backoff,
+                on_attempt=count,
+                headers=headers,
+            )
+            result.status_code = response.status_code
+            if response.status_code in [200, 201, 204] or (
+                # A retried DELETE was sent again after a lost response, so
+                # 404 means an earlier attempt removed the resource. MOVE is
+                # only resent when the earlier attempt was refused or never
+                # sent, so its 404 means the source is missing.
+                method == "DELETE"
+                and response.status_code == 404
+                and result.attempts > 1
+            ):
+                result.ok = True
+                if method != "COPY":
+                    self._forget_directory(CURRENT_PATH)
+            else:
+                result.error = f"Failed to {method} '{CURRENT_PATH}': {response.status_code} - {response.text}"
+        except Exception as e:
+            result.error = str(e)
+        return result
+
+    def _forget_directory(self, PATH: str) -> None:
+        # Uploads into a moved or deleted directory must check it again
+        known = getattr(self.file_manager, "known_directories", None)
+        if known is not None:
+            known.discard(PATH)
+
+    def upload_folder(
+        self,
+        LOCAL_FOLDER_PATH: str,
+        REMOTE_FOLDER_PATH: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+        deduplicate: bool = False,
+    ) -> BatchReport:
         """
         Uploads a folder and its contents to Nextcloud, overwriting any existing files.
 
+        Remote directories are created breadth-first with MKCOL before any file
+        is sent, then files are streamed from disk by ``max_workers`` threads.
+        Throttled (429/503) requests and dropped connections are retried with
+        backoff. Files above the file manager's chunked threshold are sent with
+        the chunked upload protocol. A directory that cannot be created fails
+        the files below it in the report; the rest are still uploaded.
+
+        With ``deduplicate`` the remote folder is listed once with its
+        checksums, every local file is hashed by the upload threads (through
+        the file manager's hash cache, so unchanged files are not read
+        again), and files whose content is already on the server are skipped
+        (action ``"skip"``). Uploaded files carry ``OC-Checksum``.
+
         :param LOCAL_FOLDER_PATH: The local folder path to be uploaded.
         :param REMOTE_FOLDER_PATH: The remote folder path on Nextcloud.
+        :param chunk_size: Size of the blocks sent over the wire.
+        :param max_workers: Number of files uploaded in parallel.
+        :param retries: Additional attempts per request after a failure.
+        :param backoff: Base delay in seconds between attempts.
+        :param deduplicate: Skip files whose content the remote file already has.
+        :return: BatchReport with one TransferResult per file.
+        """
+        started = time.monotonic()
+        remote_files = (
+            self._remote_checksums(REMOTE_FOLDER_PATH) if deduplicate else None
+        )
+        directories: Dict[int, List[str]] = {}
+        uploads: List[Tuple[str, str]] = []
+
+        for root, dirs, files in os.walk(LOCAL_FOLDER_PATH):
+            relative_path = os.path.relpath(root, LOCAL_FOLDER_PATH)
+            if relative_path == ".":
+                remote_path = REMOTE_FOLDER_PATH
+            else:
+                remote_path = posixpath.join(
+                    REMOTE_FOLDER_PATH, relative_path.replace("\\", "/")
+                )
+            depth = 0 if relative_path == "." else relative_path.count(os.sep) + 1
+            # Directories seen in the remote listing need no MKCOL
+            existing = (remote_files or {}).get(normalize_path(remote_path))
+            if existing is None or not existing.is_dir:
+                directories.setdefault(depth, []).append(remote_path)
+
+            for file in files:
+                uploads.append(
+                    (os.path.join(root, file), posixpath.join(remote_path, file))
+                )
+
+        # Error of every directory that could not be created, by path
+        failed: Dict[str, str] = {}
+
+        def upload(item: Tuple[str, str]) -> TransferResult:
+            error = failed.get(posixpath.dirname(posixpath.normpath(item[1])))
+            if error is not None:
+                return TransferResult(
+                    path=item[1],
+                    ok=False,
+                    local_path=item[0],
+                    attempts=0,
+                    action="upload",
+                    error=error,
+                )
+            return self._upload_folder_file(
+                item[0], item[1], chunk_size, retries, backoff, remote_files
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Parents first: every level only depends on the one above it
+            for depth in sorted(directories):
+                pending = []
+                for path in directories[depth]:
+                    key = posixpath.normpath(path)
+                    parent_error = failed.get(posixpath.dirname(key))
+                    if parent_error is not None:
+                        failed[key] = parent_error
+                    else:
+                        pending.append(path)
+                for path, error in executor.map(
+                    lambda path: (path, self._directory_error(path, retries, backoff)),
+                    pending,
+                ):
+                    if error is not None:
+                        failed[posixpath.normpath(path)] = error
+
+            results = list(executor.map(upload, uploads))
+
+        return BatchReport(results=results, elapsed=time.monotonic() - started)
+
+    def download_folder(
+        self,
+        LOCAL_FOLDER_PATH: str,
+        REMOTE_FOLDER_PATH: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = 8,
+        skip_unchanged: bool = True,
+    ) -> BatchReport:
+        """
+        Downloads a remote folder and its contents.
+
+        The remote tree is listed once (``DirectoryManager.walk``), local
+        directories are created, then files are streamed to disk by
+        ``max_workers`` threads over the shared connection pool. Every file
+        is checked against the listed size and gets the remote modification
+        time, so with ``skip_unchanged`` a later run only fetches files whose
+        size or modification time differ.
+
+        :param LOCAL_FOLDER_PATH: The local folder to download into.
+        :param REMOTE_FOLDER_PATH: The remote folder path on Nextcloud.
+        :param chunk_size: Size of the blocks read from the network.
+        :param max_workers: Number of files downloaded in parallel.
+        :param skip_unchanged: Skip local files matching the remote size and modification time.
+        :return: BatchReport with one TransferResult per file.
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive.")
+
+        started = time.monotonic()
+        local_root = os.path.abspath(LOCAL_FOLDER_PATH)
+        prefix = normalize_path(REMOTE_FOLDER_PATH).rstrip("/") + "/"
+        downloads: List[Tuple[str, FileInfo]] = []
+
+        os.makedirs(local_root, exist_ok=True)
+        # Only the type, size and modification time of the entries are read
+        for entry in self.directory_manager.walk(REMOTE_FOLDER_PATH, profile="minimal"):
+            path = normalize_path(entry.path)
+            if not path.startswith(prefix):
+                continue
+            local_path = os.path.normpath(
+                os.path.join(local_root, *path[len(prefix) :].split("/"))
+            )
+            # Never write outside the target folder
+            if not local_path.startswith(local_root + os.sep):
+                continue
+            if entry.is_dir:
+                os.makedirs(local_path, exist_ok=True)
+            else:
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                downloads.append((local_path, entry))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda item: self._download_folder_file(
+                        item[0], item[1], chunk_size, skip_unchanged
+                    ),
+                    downloads,
+                )
+            )
+
+        return BatchReport(results=results, elapsed=time.monotonic() - started)
+
+    def _remote_checksums(self, REMOTE_FOLDER_PATH: str) -> Dict[str, FileInfo]:
+        """Remote entries below a folder and the folder itself, by normalized path."""
+        root = normalize_path(REMOTE_FOLDER_PATH)
         try:
-            for root, dirs, files in os.walk(LOCAL_FOLDER_PATH):
-                relative_path = os.path.relpath(root, LOCAL_FOLDER_PATH)
-                remote_path = os.path.join(REMOTE_FOLDER_PATH, relative_path).replace(
-                    "\\", "/"
+            entries = {
+                normalize_path(entry.path): entry
+                for entry in self.directory_manager.walk(
+                    REMOTE_FOLDER_PATH, profile="checksum"
                 )
+            }
+        except FileNotFoundError:
+            return {}
+        # The listing succeeded, so the folder itself exists
+        entries[root] = FileInfo(root, href="", is_dir=True)
+        return entries
 
-                if not self.directory_manager.directory_exists_check(remote_path):
-                    self.directory_manager.create_directory(remote_path)
+    def _directory_error(
+        self, DIRECTORY_PATH: str, retries: int, backoff: float
+    ) -> Optional[str]:
+        """:return: Why the directory could not be created, None on success"""
+        try:
+            self._make_directory(DIRECTORY_PATH, retries, backoff)
+        except Exception as e:
+            return str(e)
+        return None
 
-                for file in files:
-                    local_file_path = os.path.join(root, file)
-                    remote_file_path = os.path.join(remote_path, file).replace(
-                        "\\", "/"
-                    )
+    def _make_directory(self, DIRECTORY_PATH: str, retries: int, backoff: float) -> None:
+        response = self._request_with_retries(
+            "MKCOL", DIRECTORY_PATH, retries=retries, backoff=backoff
+        )
+        # 405 means the directory already exists
+        if response.status_code not in [200, 201, 405]:
+            raise HTTPError(
+                f"Failed to create directory '{DIRECTORY_PATH}': {response.status_code} - {response.text}",
+                response=response,
+            )
 
-                    with open(local_file_path, "rb") as f:
-                        file_data = f.read()
+    def _upload_folder_file(
+        self,
+        local_file_path: str,
+        remote_file_path: str,
+        chunk_size: int,
+        retries: int,
+        backoff: float,
+        remote_files: Optional[Dict[str, FileInfo]] = None,
+    ) -> TransferResult:
+        result = TransferResult(
+            path=remote_file_path,
+            ok=False,
+            local_path=local_file_path,
+            attempts=0,
+            action="upload",
+        )
+        try:
+            size = os.path.getsize(local_file_path)
+            checksum = None
+            headers = {}
+            if remote_files is not None:
+                checksum = self.file_manager.local_checksum(local_file_path)
+                key = normalize_path(remote_file_path)
+                hash_cache = self.file_manager.hash_cache
+                last_upload = (
+                    hash_cache.get_upload(key) if hash_cache is not None else None
+                )
+                if content_matches(remote_files.get(key), size, checksum, last_upload):
+                    result.ok = True
+                    result.action = "skip"
+                    return result
+                headers["OC-Checksum"] = checksum
 
-                    response = self._request_webdav(
-                        "PUT", remote_file_path, data=file_data
-                    )
-                    if response.status_code in [200, 201, 207, 206]:
-                        continue
-                    if response.status_code == 409:
-                        # overwrite
-                        response = self._request_webdav(
-                            "PUT", remote_file_path, data=file_data
-                        )
-                        if response.status_code == 201:
-                            continue
-
-                        raise HTTPError(
-                            f"Failed to overwrite {local_file_path}: {response.status_code} - {response.text}",
-                            response=response,
-                        )
-
-                    raise HTTPError(
-                        f"Failed to upload {local_file_path}: {response.status_code} - {response.text}",
-                        response=response,
-                    )
-        except Exception:
-            raise
+            threshold = getattr(self.file_manager, "chunked_threshold", None)
+            if threshold is not None and size > threshold:
+                result.attempts = 1
+                result.ok = self.file_manager.chunked_uploader.upload(
+                    remote_file_path, LOCAL_UPLOAD_PATH=local_file_path, checksum=checksum
+                )
+                result.bytes = size
+                return result
+
+            with open(local_file_path, "rb") as f:
+
+                def body() -> UploadStream:
+                    result.attempts += 1
+                    f.seek(0)
+                    return UploadStream(f, chunk_size)
+
+                response = self._request_with_retries(
+                    "PUT",
+                    remote_file_path,
+                    body=body,
+                    retries=retries,
+                    backoff=backoff,
+                    headers=headers,
+                )
+
+            result.status_code = response.status_code
+            if response.status_code in [200, 201, 204]:
+                result.ok = True
+                result.bytes = size
+                if checksum:
+                    self.file_manager.record_upload(remote_file_path, checksum, response)
+            else:
+                result.error = f"Failed to upload {local_file_path}: {response.status_code} - {response.text}"
+        except Exception as e:
+            result.error = str(e)
+        return result
+
+    def _download_folder_file(
+        self,
+        local_file_path: str,
+        entry: FileInfo,
+        chunk_size: int,
+        skip_unchanged: bool,
+    ) -> TransferResult:
+        result = TransferResult(
+            path=entry.path, ok=False, local_path=local_file_path, action="download"
+        )
+        mtime = entry.last_modified.timestamp() if entry.last_modified else None
+        try:
+            if skip_unchanged and _is_unchanged(local_file_path, entry, mtime):
+                result.ok = True
+                result.action = "skip"
+                return result
+
+            self.file_manager.download_file(
+                local_file_path, entry.path, chunk_size=chunk_size
+            )
+            size = os.path.getsize(local_file_path)
+            if entry.size is not None and size != entry.size:
+                result.error = (
+                    f"Size mismatch for {entry.path}: expected {entry.size}, got {size}"
+                )
+                return result
+            if mtime is not None:
+                os.utime(local_file_path, (time.time(), mtime))
+            result.ok = True
+            result.bytes = size
+        except Exception as e:
+            result.error = str(e)
+        return result
+
+
+def _destination_headers(
+    destination: str, overwrite: bool, depth: Optional[str] = None
+) -> Dict[str, str]:
+    headers = {"Destination": destination, "Overwrite": "T" if overwrite else "F"}
+    if depth is not None:
+        headers["Depth"] = depth
+    return headers
+
+
+def _is_unchanged(local_file_path: str, entry: FileInfo, mtime: Optional[float]) -> bool:
+    """True if the local file has the remote size and (second resolution) mtime."""
+    if entry.size is None or mtime is None:
+        return False
+    try:
+        stat = os.stat(local_file_path)
+    except FileNotFoundError:
+        return False
+    return stat.st_size == entry.size and int(stat.st_mtime) == int(mtime)
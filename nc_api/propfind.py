@@ -0,0 +1,328 @@
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote
+
+from nc_api.parsers import xml_parse_errors, xml_pull_parser
+
+_RESPONSE = "{DAV:}response"
+_HREF = "{DAV:}href"
+_PROPSTAT = "{DAV:}propstat"
+_PROP = "{DAV:}prop"
+_STATUS = "{DAV:}status"
+_COLLECTION = "{DAV:}collection"
+_RESOURCETYPE = "{DAV:}resourcetype"
+
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+        start=1,
+    )
+}
+
+# Local names of the property tags seen so far, e.g. "{DAV:}getetag" -> "getetag"
+_LOCAL_NAMES: Dict[str, str] = {}
+
+
+@dataclass(slots=True)
+class FileInfo:
+    """
+    Typed metadata of one entry of a PROPFIND response.
+
+    Known Nextcloud properties are stored converted (sizes and counts as
+    ``int``, flags as ``bool``, the modification time as ``datetime``);
+    only properties without a field are kept as strings in ``extra``.
+    """
+
+    path: str
+    href: str
+    is_dir: bool
+    size: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+    content_type: Optional[str] = None
+    file_id: Optional[int] = None
+    permissions: Optional[str] = None
+    favorite: Optional[bool] = None
+    has_preview: Optional[bool] = None
+    comments_unread: Optional[int] = None
+    owner_display_name: Optional[str] = None
+    contained_folder_count: Optional[int] = None
+    contained_file_count: Optional[int] = None
+    # Space-separated "ALGORITHM:digest" values, e.g. "SHA1:2aae6c35... MD5:..."
+    checksum: Optional[str] = None
+    extra: Optional[Dict[str, str]] = None
+
+    @property
+    def name(self) -> str:
+        return self.path.rstrip("/").rsplit("/", 1)[-1]
+
+    @property
+    def is_shared(self) -> bool:
+        return "S" in (self.permissions or "")
+
+    @property
+    def is_mounted(self) -> bool:
+        return "M" in (self.permissions or "")
+
+    @property
+    def can_read(self) -> bool:
+        return "G" in (self.permissions or "")
+
+    @property
+    def can_write(self) -> bool:
+        # Directories report the right to create entries instead of W
+        return any(flag in (self.permissions or "") for flag in "WCK")
+
+    @property
+    def can_delete(self) -> bool:
+        return "D" in (self.permissions or "")
+
+    @property
+    def can_rename(self) -> bool:
+        return "N" in (self.permissions or "")
+
+    @property
+    def can_move(self) -> bool:
+        return "V" in (self.permissions or "")
+
+    @property
+    def can_share(self) -> bool:
+        return "R" in (self.permissions or "")
+
+    def as_file_data(self) -> Dict[str, str]:
+        """Flattened representation returned by ``FileManager.get_data_file``."""
+        data = {"href": self.href}
+        if self.last_modified is not None:
+            data["getlastmodified"] = _format_datetime(self.last_modified)
+        if self.etag is not None:
+            data["getetag"] = self.etag
+        if self.content_type is not None:
+            data["getcontenttype"] = self.content_type
+        data["resourcetype"] = "collection" if self.is_dir else ""
+        for tag, (name, kind) in _TYPED_PROPS.items():
+            value = getattr(self, name)
+            if value is not None:
+                data[tag] = _format_value(value, kind)
+        if self.checksum is not None:
+            data["checksums"] = self.checksum
+        if self.size is not None:
+            data["size"] = str(self.size)
+            if not self.is_dir:
+                data["getcontentlength"] = str(self.size)
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+# Properties stored in a FileInfo field: local tag -> (field, conversion)
+_TYPED_PROPS = {
+    "fileid": ("file_id", "int"),
+    "permissions": ("permissions", "str"),
+    "favorite": ("favorite", "bool"),
+    "has-preview": ("has_preview", "bool-text"),
+    "comments-unread": ("comments_unread", "int"),
+    "owner-display-name": ("owner_display_name", "str"),
+    "contained-folder-count": ("contained_folder_count", "int"),
+    "contained-file-count": ("contained_file_count", "int"),
+}
+
+
+class MultistatusParser:
+    """
+    Incremental parser for WebDAV multistatus bodies.
+
+    Bytes are fed as they arrive from the network and every completed
+    ``d:response`` is turned into a ``FileInfo`` and dropped from the tree,
+    so memory use does not grow with the number of entries.
+
+    Entry paths are built relative to the first ``d:href`` of the body (the
+    requested resource), joined onto ``base_path``. Bodies whose first
+    entry is not the requested resource, like SEARCH results, pass
+    ``href_root`` instead.
+    """
+
+    def __init__(self, base_path: str, href_root: Optional[str] = None) -> None:
+        """
+        :param base_path: Path the PROPFIND was sent to
+        :param href_root: Decoded href prefix entry paths are relative to, e.g. ``/remote.php/dav/files/<user>``
+        """
+        self.base_path = base_path.rstrip("/")
+        self.href_root = href_root.rstrip("/") + "/" if href_root is not None else None
+        self._parser = xml_pull_parser()
+        self._root: Optional[ET.Element] = None
+        self._base_href: Optional[str] = None
+
+    def feed(self, data: bytes) -> List[FileInfo]:
+        """
+        :param data: Next piece of the response body
+        :return: Entries completed by this piece
+        """
+        try:
+            self._parser.feed(data)
+        except xml_parse_errors() as e:
+            raise _parse_error(e) from e
+        return self._drain()
+
+    def close(self) -> List[FileInfo]:
+        """
+        :return: Entries completed by the end of the body
+        """
+        try:
+            self._parser.close()
+        except xml_parse_errors() as e:
+            raise _parse_error(e) from e
+        return self._drain()
+
+    def _drain(self) -> List[FileInfo]:
+        entries = []
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                continue
+            if elem.tag != _RESPONSE:
+                continue
+            entry = self._entry(elem)
+            if entry is not None:
+                entries.append(entry)
+            # Drop the finished response so the tree stays small
+            if self._root is not None:
+                self._root.remove(elem)
+        return entries
+
+    def _relative_path(self, decoded: str) -> str:
+        if self.href_root is not None:
+            # The server may be installed below a path, so the root can follow a prefix
+            _, found, rest = (decoded + "/").partition(self.href_root)
+            if found:
+                return "/" + rest.rstrip("/") if rest else ""
+        else:
+            if self._base_href is None:
+                self._base_href = decoded
+            if decoded.startswith(self._base_href):
+                return decoded[len(self._base_href) :]
+        return "/" + decoded.rsplit("/", 1)[-1]
+
+    def _entry(self, elem: ET.Element) -> Optional[FileInfo]:
+        href = elem.findtext(_HREF)
+        if href is None:
+            return None
+        relative = self._relative_path(unquote(href).rstrip("/"))
+
+        fields: Dict[str, Any] = {}
+        extra: Dict[str, str] = {}
+        is_dir = False
+        size = length = modified = None
+        for propstat in elem.findall(_PROPSTAT):
+            # Properties the server could not return come with a 404 status
+            status = propstat.findtext(_STATUS) or ""
+            if status and " 200 " not in status:
+                continue
+            prop = propstat.find(_PROP)
+            if prop is None:
+                continue
+            for child in prop:
+                tag = _LOCAL_NAMES.get(child.tag)
+                if tag is None:
+                    if not isinstance(child.tag, str):
+                        # Comments and processing instructions (lxml)
+                        continue
+                    tag = _LOCAL_NAMES[child.tag] = child.tag.split("}", 1)[-1]
+                text = child.text or ""
+                typed = _TYPED_PROPS.get(tag)
+                if typed is not None:
+                    fields[typed[0]] = _parse_value(text, typed[1])
+                elif tag == "getetag":
+                    fields["etag"] = text or None
+                elif tag == "getcontenttype":
+                    fields["content_type"] = text or None
+                elif tag == "getlastmodified":
+                    modified = text
+                elif tag == "size":
+                    size = text
+                elif tag == "getcontentlength":
+                    length = text
+                elif child.tag == _RESOURCETYPE:
+                    is_dir = child.find(_COLLECTION) is not None
+                elif tag == "checksums":
+                    # One or more nested oc:checksum elements
+                    fields["checksum"] = " ".join(" ".join(child.itertext()).split()) or None
+                else:
+                    extra[tag] = text
+
+        return FileInfo(
+            path=(self.base_path + relative) or "/",
+            href=href,
+            is_dir=is_dir,
+            size=_to_int(size or length),
+            last_modified=_to_datetime(modified),
+            extra=extra or None,
+            **fields,
+        )
+
+
+def _parse_error(error: Exception) -> ET.ParseError:
+    """Backend error as the ``ET.ParseError`` the managers handle."""
+    if isinstance(error, ET.ParseError):
+        return error
+    return ET.ParseError(str(error))
+
+
+def _parse_value(text: str, kind: str) -> Any:
+    if kind == "int":
+        return _to_int(text)
+    if kind == "bool":
+        return text == "1"
+    if kind == "bool-text":
+        return text == "true"
+    return text
+
+
+def _format_value(value: Any, kind: str) -> str:
+    if kind == "bool":
+        return "1" if value else "0"
+    if kind == "bool-text":
+        return "true" if value else "false"
+    return str(value)
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+def _format_datetime(value: datetime) -> str:
+    if value.utcoffset() == timedelta(0):
+        return format_datetime(value, usegmt=True)
+    return format_datetime(value)
+
+
+def _to_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    # Fast path for the fixed format Nextcloud sends: "Mon, 01 Jan 2024 10:00:00 GMT"
+    parts = value.split(" ")
+    if len(parts) == 6 and parts[5] == "GMT" and parts[2] in _MONTHS:
+        try:
+            hour, minute, second = parts[4].split(":")
+            return datetime(
+                int(parts[3]),
+                _MONTHS[parts[2]],
+                int(parts[1]),
+                int(hour),
+                int(minute),
+                int(second),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
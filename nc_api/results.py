@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class TransferResult:
+    """Outcome of a single item of a batch operation."""
+
+    path: str
+    ok: bool
+    local_path: Optional[str] = None
+    destination: Optional[str] = None
+    status_code: Optional[int] = None
+    bytes: int = 0
+    attempts: int = 1
+    error: Optional[str] = None
+    action: Optional[str] = None
+
+
+@dataclass
+class BatchReport:
+    """Per-item results and totals of a batch operation."""
+
+    results: List[TransferResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> List[TransferResult]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[TransferResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results)
+
+    @property
+    def bytes_transferred(self) -> int:
+        return sum(result.bytes for result in self.results if result.ok)
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second over the whole batch."""
+        return self.bytes_transferred / self.elapsed if self.elapsed else 0.0
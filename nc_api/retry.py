@@ -0,0 +1,189 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, FrozenSet, Optional
+
+from requests.exceptions import ConnectTimeout, ProxyError, SSLError
+
+# Status codes worth retrying: throttling, maintenance and gateway errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Status codes that mean the server refused the request without acting on it
+REFUSED_STATUS_CODES = frozenset({429, 503})
+# Methods that can be repeated without changing the outcome
+IDEMPOTENT_METHODS = frozenset(
+    {
+        "GET",
+        "HEAD",
+        "OPTIONS",
+        "PROPFIND",
+        "REPORT",
+        "SEARCH",
+        "PUT",
+        "DELETE",
+        "MKCOL",
+        "PROPPATCH",
+    }
+)
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the requests sent.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    during an outage retries stop once they would add more than ``ratio``
+    extra load; ``reserve`` tokens allow short bursts on a quiet client.
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: int = 10) -> None:
+        """
+        :param ratio: Retries allowed per request sent
+        :param reserve: Retries available up front, also the maximum balance
+        """
+        if ratio < 0 or reserve < 0:
+            raise ValueError("ratio and reserve must not be negative.")
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = float(reserve)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(max(self.reserve, 1), self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        :return: True if a retry may be sent
+        """
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before a failed request is sent again.
+
+    Idempotent methods are retried after connection errors and any status in
+    ``status_codes``. Other methods (MOVE, COPY, POST) are only retried when
+    the server refused them outright (429/503) or the connection could not be
+    opened, since a lost response may hide a request that succeeded.
+
+    A ``Retry-After`` is waited out in full; when it exceeds
+    ``max_retry_after`` (``max_backoff`` if None) the response is returned
+    instead of retrying early.
+    """
+
+    retries: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    max_retry_after: Optional[float] = None
+    status_codes: FrozenSet[int] = RETRY_STATUS_CODES
+    idempotent_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+    budget: Optional[RetryBudget] = field(default=None, compare=False)
+
+    def retry_response(
+        self,
+        method: str,
+        status_code: int,
+        attempt: int,
+        response: Optional[Any] = None,
+    ) -> bool:
+        """
+        :param method: HTTP method of the request
+        :param status_code: Status of the response received
+        :param attempt: Number of retries already sent
+        :param response: Response received, checked for a ``Retry-After`` above the cap
+        :return: True if the request should be sent again
+        """
+        if attempt >= self.retries or status_code not in self.status_codes:
+            return False
+        if (
+            method.upper() not in self.idempotent_methods
+            and status_code not in REFUSED_STATUS_CODES
+        ):
+            return False
+        if response is not None and self.respect_retry_after:
+            retry_after = _retry_after(response)
+            cap = (
+                self.max_backoff
+                if self.max_retry_after is None
+                else self.max_retry_after
+            )
+            if retry_after is not None and retry_after > cap:
+                return False
+        return self._withdraw()
+
+    def retry_error(
+        self,
+        method: str,
+        error: BaseException,
+        attempt: int,
+        sent: Optional[bool] = None,
+    ) -> bool:
+        """
+        :param method: HTTP method of the request
+        :param error: Connection or timeout error raised while sending
+        :param attempt: Number of retries already sent
+        :param sent: Whether the request may have reached the server; told from requests' errors if None
+        :return: True if the request should be sent again
+        """
+        if attempt >= self.retries:
+            return False
+        if sent is None:
+            sent = not _not_sent(error)
+        if method.upper() not in self.idempotent_methods and sent:
+            return False
+        return self._withdraw()
+
+    def delay(self, attempt: int, response: Optional[Any] = None) -> float:
+        """
+        :param attempt: Number of retries already sent
+        :param response: Response that triggered the retry, if any
+        :return: Seconds to wait before the next attempt
+        """
+        if response is not None and self.respect_retry_after:
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                return retry_after
+        # Full jitter spreads out clients that failed at the same moment
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+    def record_request(self) -> None:
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def _withdraw(self) -> bool:
+        return self.budget is None or self.budget.withdraw()
+
+
+def _not_sent(error: BaseException) -> bool:
+    """True if the error happened before the request reached the server."""
+    if isinstance(error, (ConnectTimeout, ProxyError, SSLError)):
+        return True
+    # urllib3 wraps refused connections as NewConnectionError
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return type(reason).__name__ == "NewConnectionError"
+
+
+def _retry_after(response: Any) -> Optional[float]:
+    """Seconds requested by a ``Retry-After`` header (delta or HTTP date)."""
+    value = response.headers.get("Retry-After", "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,127 @@
+import mmap
+import os
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# callback(bytes_sent, total_bytes or None if unknown)
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+UploadSource = Union[bytes, bytearray, memoryview, mmap.mmap, BinaryIO, Iterable[bytes]]
+
+
+class UploadStream:
+    """
+    Request body that feeds an upload in fixed-size blocks.
+
+    Accepts raw bytes, an ``mmap``, a binary file object or an iterator of
+    byte blocks. Only one block is held in memory at a time, so the memory
+    footprint does not depend on the size of the upload. When the size is
+    known it is exposed as ``len`` and sent as ``Content-Length``,
+    otherwise the body goes out with chunked transfer encoding.
+    """
+
+    def __init__(
+        self,
+        source: UploadSource,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        total_size: Optional[int] = None,
+    ) -> None:
+        """
+        :param source: Data to upload
+        :param chunk_size: Size of the blocks sent over the wire
+        :param progress_callback: Called with (bytes_sent, total_size) after each block
+        :param total_size: Size of the data if it cannot be determined from the source
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive.")
+
+        self.source = source
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self.bytes_sent = 0
+
+        self._is_buffer = isinstance(source, (bytes, bytearray, memoryview, mmap.mmap))
+        self._is_file = not self._is_buffer and hasattr(source, "read")
+        self._start = source.tell() if self._is_file and _seekable(source) else 0
+        self.total_size: Optional[int] = (
+            total_size if total_size is not None else source_size(source)
+        )
+
+    @property
+    def len(self) -> Optional[int]:
+        # Picked up by requests to set Content-Length; None means chunked.
+        return self.total_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        for block in self._blocks():
+            if not block:
+                continue
+            self.bytes_sent += len(block)
+            if self.progress_callback:
+                self.progress_callback(self.bytes_sent, self.total_size)
+            yield block
+
+    def _blocks(self) -> Iterator[bytes]:
+        if self._is_buffer:
+            for offset in range(0, len(self.source), self.chunk_size):
+                yield bytes(self.source[offset : offset + self.chunk_size])
+        elif self._is_file:
+            while True:
+                block = self.source.read(self.chunk_size)
+                if not block:
+                    break
+                yield block
+        else:
+            # Re-slice iterator output so the wire blocks stay chunk_size long
+            pending = bytearray()
+            for piece in self.source:
+                pending += piece
+                while len(pending) >= self.chunk_size:
+                    yield bytes(pending[: self.chunk_size])
+                    del pending[: self.chunk_size]
+            if pending:
+                yield bytes(pending)
+
+    def rewind(self) -> None:
+        """
+        Resets the stream so the same body can be sent again.
+
+        :raises ValueError: If the source is a one-shot iterator or non-seekable file
+        """
+        if self._is_file:
+            if not _seekable(self.source):
+                raise ValueError("Upload source is not seekable.")
+            self.source.seek(self._start)
+        elif not self._is_buffer:
+            raise ValueError("Upload source is an iterator and cannot be rewound.")
+        self.bytes_sent = 0
+
+
+def source_size(source: UploadSource) -> Optional[int]:
+    """
+    Returns the number of bytes left in an upload source, if it can be known
+    without consuming it.
+
+    :param source: Bytes, mmap, binary file object or iterator
+    :return: Remaining size in bytes or None for iterators and pipes
+    """
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        return len(source)
+    if hasattr(source, "read") and _seekable(source):
+        start = source.tell()
+        try:
+            return os.fstat(source.fileno()).st_size - start
+        except (AttributeError, OSError, ValueError):
+            end = source.seek(0, os.SEEK_END)
+            source.seek(start)
+            return end - start
+    return None
+
+
+def _seekable(file: Any) -> bool:
+    try:
+        return bool(file.seekable())
+    except (AttributeError, ValueError):
+        return False
@@ -0,0 +1,451 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from requests import HTTPError
+
+from nc_api.base_manager import BaseManager
+from nc_api.cache import MetadataCache, normalize_path
+from nc_api.file_manager import PART_SUFFIX
+from nc_api.limits import RequestLimiter
+from nc_api.propfind import FileInfo
+from nc_api.results import BatchReport, TransferResult
+from nc_api.retry import RetryPolicy
+from nc_api.transport import Transport
+from nc_api.xml_query.properties import PROFILES
+
+# Default name of the state index, kept in the root of the local folder
+SYNC_INDEX_NAME = ".nc-api-sync.sqlite"
+SYNC_DIRECTIONS = ("both", "upload", "download")
+CONFLICT_POLICIES = ("skip", "local", "remote")
+# Index rows written between two commits
+INDEX_COMMIT_EVERY = 500
+HASH_READ_SIZE = 1024 * 1024
+# Remote properties the sync plan and the index read
+SYNC_PROFILE = PROFILES["minimal"] + ("fileid", "checksums")
+
+_UPLOAD_ACTIONS = frozenset({"upload", "delete_remote"})
+_DOWNLOAD_ACTIONS = frozenset({"download", "delete_local"})
+
+
+@dataclass
+class SyncRecord:
+    """State of one file as of the last time both sides were in sync."""
+
+    path: str
+    size: int
+    mtime: int
+    sha1: str
+    etag: Optional[str] = None
+    file_id: Optional[str] = None
+
+
+class SyncIndex:
+    """
+    SQLite-backed state index of a local/remote folder pair.
+
+    Stores size, mtime and SHA-1 of the local file and ETag and file id of
+    the remote one for every file, keyed by the path relative to the folder.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        """
+        :param db_path: SQLite database file, created if missing
+        """
+        self.db_path = db_path
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime INTEGER NOT NULL, "
+            "sha1 TEXT NOT NULL, etag TEXT, file_id TEXT)"
+        )
+        self._db.commit()
+
+    def load(self) -> Dict[str, SyncRecord]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT path, size, mtime, sha1, etag, file_id FROM entries"
+            ).fetchall()
+        return {row[0]: SyncRecord(*row) for row in rows}
+
+    def put(self, record: SyncRecord) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    record.path,
+                    record.size,
+                    record.mtime,
+                    record.sha1,
+                    record.etag,
+                    record.file_id,
+                ),
+            )
+            self._written()
+
+    def remove(self, path: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM entries WHERE path = ?", (path,))
+            self._written()
+
+    def commit(self) -> None:
+        with self._lock:
+            self._db.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        self.commit()
+        self._db.close()
+
+    def __enter__(self) -> "SyncIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _written(self) -> None:
+        # Commit in batches so an interrupted sync keeps most of its progress
+        self._pending += 1
+        if self._pending >= INDEX_COMMIT_EVERY:
+            self._db.commit()
+            self._pending = 0
+
+
+class SyncManager(BaseManager):
+    """
+    Incremental two-way synchronization of a local folder with a remote one.
+
+    The local tree and a recursive remote listing are compared against the
+    state index of the previous run, and only files that changed on one side
+    are transferred. Files changed on both sides are conflicts.
+    """
+
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        directory_manager: Optional[Any] = None,
+        file_manager: Optional[Any] = None,
+        transport: Optional[Transport] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        limiter: Optional[RequestLimiter] = None,
+    ) -> None:
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            metadata_cache=metadata_cache,
+            retry_policy=retry_policy,
+            limiter=limiter,
+        )
+        self.directory_manager = directory_manager
+        self.file_manager = file_manager
+
+    def sync_folder(
+        self,
+        LOCAL_FOLDER_PATH: str,
+        REMOTE_FOLDER_PATH: str,
+        direction: str = "both",
+        conflict: str = "skip",
+        delete: bool = False,
+        index_path: Optional[str] = None,
+        max_workers: int = 8,
+    ) -> BatchReport:
+        """
+        Synchronizes a local folder with a remote folder, transferring only changed files.
+
+        A local file counts as changed when its size or mtime differ from the
+        index and its SHA-1 does too; a remote file when its ETag differs. On
+        the first run, files present on both sides are compared by SHA-1,
+        against the checksum the server stores or, without one, the
+        downloaded content; files that differ are conflicts. Empty
+        directories are not synchronized.
+
+        :param LOCAL_FOLDER_PATH: The local folder path.
+        :param REMOTE_FOLDER_PATH: The remote folder path on Nextcloud.
+        :param direction: "both", "upload" (local to remote) or "download" (remote to local).
+        :param conflict: Files changed on both sides: "skip" reports them, "local" or "remote" picks the winner.
+        :param delete: Propagate deletions instead of restoring the deleted side.
+        :param index_path: State index file, ``SYNC_INDEX_NAME`` in the local folder by default.
+        :param max_workers: Number of files transferred in parallel.
+        :return: BatchReport with one TransferResult per transferred, deleted or conflicting file.
+        """
+        if direction not in SYNC_DIRECTIONS:
+            raise ValueError(f"direction must be one of {SYNC_DIRECTIONS}.")
+        if conflict not in CONFLICT_POLICIES:
+            raise ValueError(f"conflict must be one of {CONFLICT_POLICIES}.")
+
+        started = time.monotonic()
+        os.makedirs(LOCAL_FOLDER_PATH, exist_ok=True)
+        if index_path is None:
+            index_path = os.path.join(LOCAL_FOLDER_PATH, SYNC_INDEX_NAME)
+
+        with SyncIndex(index_path) as index:
+            records = index.load()
+            local = _scan_local(LOCAL_FOLDER_PATH, index_path)
+            remote = self._scan_remote(REMOTE_FOLDER_PATH)
+
+            actions: List[Tuple[str, str]] = []
+            for path in sorted(set(local) | set(remote) | set(records)):
+                action = self._plan(
+                    path,
+                    LOCAL_FOLDER_PATH,
+                    REMOTE_FOLDER_PATH,
+                    local.get(path),
+                    remote.get(path),
+                    records.get(path),
+                    index,
+                    direction,
+                    conflict,
+                    delete,
+                )
+                if action is not None:
+                    actions.append((path, action))
+
+            results: List[TransferResult] = []
+            uploaded: Dict[str, SyncRecord] = {}
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for result, record in executor.map(
+                    lambda item: self._apply(
+                        item[0],
+                        item[1],
+                        LOCAL_FOLDER_PATH,
+                        REMOTE_FOLDER_PATH,
+                        remote.get(item[0]),
+                    ),
+                    actions,
+                ):
+                    if result is not None:
+                        results.append(result)
+                    if record is None:
+                        continue
+                    if result is not None and result.action == "upload":
+                        uploaded[result.path] = record
+                    elif result is not None and result.action.startswith("delete"):
+                        index.remove(record.path)
+                    else:
+                        index.put(record)
+
+            # The ETags of uploaded files come from one listing per directory
+            if uploaded:
+                metadata = self.file_manager.get_data_files(
+                    list(uploaded), max_workers=max_workers, profile=SYNC_PROFILE
+                )
+                for remote_path, record in uploaded.items():
+                    props = metadata.get(remote_path) or {}
+                    record.etag = props.get("getetag") or None
+                    record.file_id = props.get("fileid") or None
+                    index.put(record)
+
+        return BatchReport(results=results, elapsed=time.monotonic() - started)
+
+    def _scan_remote(self, REMOTE_FOLDER_PATH: str) -> Dict[str, FileInfo]:
+        prefix = normalize_path(REMOTE_FOLDER_PATH).rstrip("/") + "/"
+        entries: Dict[str, FileInfo] = {}
+        try:
+            for entry in self.directory_manager.walk(
+                REMOTE_FOLDER_PATH, profile=SYNC_PROFILE
+            ):
+                path = normalize_path(entry.path)
+                if not entry.is_dir and path.startswith(prefix):
+                    entries[path[len(prefix) :]] = entry
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _plan(
+        self,
+        path: str,
+        local_root: str,
+        remote_root: str,
+        local: Optional[os.stat_result],
+        remote: Optional[FileInfo],
+        record: Optional[SyncRecord],
+        index: SyncIndex,
+        direction: str,
+        conflict: str,
+        delete: bool,
+    ) -> Optional[str]:
+        if local is None and remote is None:
+            index.remove(path)
+            return None
+
+        local_changed = local is not None and _local_changed(
+            os.path.join(local_root, path), local, record, index
+        )
+        remote_changed = remote is not None and (
+            record is None or remote.etag != record.etag
+        )
+
+        if local is not None and remote is not None:
+            if record is None and local.st_size == remote.size:
+                # First run: index the pair only if both sides hold the same content
+                candidate = _record(path, os.path.join(local_root, path), remote)
+                remote_path = normalize_path(f"{remote_root}/{path}")
+                if self._remote_sha1(remote_path, remote) == candidate.sha1:
+                    index.put(candidate)
+                    return None
+            if local_changed and remote_changed:
+                action = "conflict"
+            elif local_changed:
+                action = "upload"
+            elif remote_changed:
+                action = "download"
+            else:
+                return None
+        elif local is not None:
+            if record is not None and not local_changed and delete:
+                action = "delete_local"
+            else:
+                action = "upload"
+        else:
+            if record is not None and not remote_changed and delete:
+                action = "delete_remote"
+            else:
+                action = "download"
+
+        if action == "conflict":
+            if direction == "upload" or conflict == "local":
+                action = "upload"
+            elif direction == "download" or conflict == "remote":
+                action = "download"
+            else:
+                return action
+        if direction == "upload" and action in _DOWNLOAD_ACTIONS:
+            return None
+        if direction == "download" and action in _UPLOAD_ACTIONS:
+            return None
+        return action
+
+    def _remote_sha1(self, remote_path: str, remote: FileInfo) -> str:
+        """SHA-1 of a remote file, from its stored checksums or its content."""
+        for known in (remote.checksum or "").split():
+            algorithm, _, digest = known.partition(":")
+            if algorithm.upper() == "SHA1" and digest:
+                return digest.lower()
+        digest = hashlib.sha1()
+        for block in self.file_manager.iter_download(remote_path, HASH_READ_SIZE):
+            digest.update(block)
+        return digest.hexdigest()
+
+    def _apply(
+        self,
+        path: str,
+        action: str,
+        local_root: str,
+        remote_root: str,
+        remote: Optional[FileInfo],
+    ) -> Tuple[Optional[TransferResult], Optional[SyncRecord]]:
+        local_path = os.path.join(local_root, *path.split("/"))
+        remote_path = normalize_path(f"{remote_root}/{path}")
+        result = TransferResult(
+            path=remote_path, ok=False, local_path=local_path, action=action
+        )
+        if action == "conflict":
+            result.error = f"Changed on both sides: {path}"
+            return result, None
+
+        record: Optional[SyncRecord] = None
+        try:
+            if action == "upload":
+                record = _record(path, local_path)
+                result.ok = self.file_manager.upload_file(
+                    LOCAL_UPLOAD_PATH=local_path,
+                    REMOTE_UPLOAD_PATH=remote_path,
+                    create_parents=True,
+                )
+                result.bytes = record.size
+            elif action == "download":
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                result.ok = self.file_manager.download_file(local_path, remote_path)
+                record = _record(path, local_path, remote)
+                result.bytes = record.size
+            elif action == "delete_remote":
+                response = self._request_webdav("DELETE", remote_path)
+                result.status_code = response.status_code
+                if response.status_code not in [200, 204, 404]:
+                    raise HTTPError(
+                        f"Failed to delete '{remote_path}': {response.status_code} - {response.text}",
+                        response=response,
+                    )
+                result.ok = True
+                record = SyncRecord(path, 0, 0, "")
+            elif action == "delete_local":
+                os.remove(local_path)
+                result.ok = True
+                record = SyncRecord(path, 0, 0, "")
+        except Exception as e:
+            result.error = str(e)
+            return result, None
+        return result, record
+
+
+def _scan_local(root: str, index_path: str) -> Dict[str, os.stat_result]:
+    """Stats every regular file below ``root`` by relative POSIX path."""
+    skipped = os.path.abspath(index_path)
+    entries: Dict[str, os.stat_result] = {}
+    for directory, _, files in os.walk(root):
+        for name in files:
+            local_path = os.path.join(directory, name)
+            # Skip the index itself and leftovers of interrupted downloads
+            if os.path.abspath(local_path).startswith(skipped):
+                continue
+            if name.endswith(PART_SUFFIX) or name.endswith(PART_SUFFIX + ".etag"):
+                continue
+            relative = os.path.relpath(local_path, root).replace(os.sep, "/")
+            entries[relative] = os.stat(local_path)
+    return entries
+
+
+def _local_changed(
+    local_path: str,
+    stat: os.stat_result,
+    record: Optional[SyncRecord],
+    index: SyncIndex,
+) -> bool:
+    if record is None or stat.st_size != record.size:
+        return True
+    if stat.st_mtime_ns == record.mtime:
+        return False
+    # Touched but maybe not modified: compare content before transferring
+    if _file_sha1(local_path) != record.sha1:
+        return True
+    record.mtime = stat.st_mtime_ns
+    index.put(record)
+    return False
+
+
+def _record(
+    path: str, local_path: str, remote: Optional[FileInfo] = None
+) -> SyncRecord:
+    stat = os.stat(local_path)
+    return SyncRecord(
+        path=path,
+        size=stat.st_size,
+        mtime=stat.st_mtime_ns,
+        sha1=_file_sha1(local_path),
+        etag=remote.etag if remote is not None else None,
+        file_id=(
+            str(remote.file_id)
+            if remote is not None and remote.file_id is not None
+            else None
+        ),
+    )
+
+
+def _file_sha1(local_path: str) -> str:
+    digest = hashlib.sha1()
+    with open(local_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_READ_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,92 @@
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+from requests import Response
+from requests.adapters import HTTPAdapter
+
+from nc_api.metrics import RequestMetrics
+
+Timeout = Union[None, float, Tuple[float, float]]
+
+
+class Transport:
+    """
+    Pooled keep-alive HTTP transport shared by all managers of a client.
+
+    Wraps a single ``requests.Session`` so that consecutive WebDAV/OCS calls
+    reuse TCP/TLS connections instead of opening a new one per request.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        timeout: Timeout = None,
+        session: Optional[requests.Session] = None,
+        metrics: Optional[RequestMetrics] = None,
+    ) -> None:
+        """
+        :param pool_connections: Number of per-host connection pools to keep
+        :param pool_maxsize: Maximum number of connections kept per host
+        :param pool_block: Block when all connections to a host are busy instead of opening extra ones
+        :param timeout: Default timeout in seconds, or (connect, read) tuple
+        :param session: Existing session to use instead of creating a new one
+        :param metrics: Statistics collected from every request sent by the managers
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be positive.")
+
+        self.timeout: Timeout = timeout
+        self.metrics: Optional[RequestMetrics] = metrics
+        self.session: requests.Session = session or requests.Session()
+
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """
+        Sends a request over the pooled session.
+
+        :param method: HTTP method
+        :param url: Absolute URL
+        :param kwargs: Additional parameters for requests
+        :return: requests.Response object
+        """
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return self.session.request(method=method, url=url, **kwargs)
+
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        Connection reuse of the pools currently kept by the adapter.
+
+        :return: Dict with connections_opened, requests and connections_reused
+        """
+        opened = requests_sent = 0
+        pools = self.adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+                requests_sent += pool.num_requests
+        return {
+            "connections_opened": opened,
+            "requests": requests_sent,
+            "connections_reused": max(0, requests_sent - opened),
+        }
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
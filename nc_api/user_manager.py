@@ -1,14 +1,45 @@
+import copy
 import json
-from typing import Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote
 
 from requests import HTTPError
 
 from nc_api.base_manager import BaseManager
+from nc_api.cache import UserCache
+from nc_api.limits import RequestLimiter
+from nc_api.parsers import loads_json
+from nc_api.retry import RetryPolicy
+from nc_api.transport import Transport
+
+# OCS status codes of a user that does not exist (v1 API, v2 API)
+OCS_NOT_FOUND = frozenset({998, 404})
 
 
 class UserManager(BaseManager):
-    def __init__(self, NEXTCLOUD_URL: str, USERNAME: str, PASSWORD: str) -> None:
-        super().__init__(NEXTCLOUD_URL, USERNAME, PASSWORD)
+    def __init__(
+        self,
+        NEXTCLOUD_URL: str,
+        USERNAME: str,
+        PASSWORD: str,
+        transport: Optional[Transport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        limiter: Optional[RequestLimiter] = None,
+        user_cache: Optional[UserCache] = None,
+    ) -> None:
+        """
+        :param user_cache: Cache of user records used by ``get_user`` and ``get_users_details``, None to disable
+        """
+        super().__init__(
+            NEXTCLOUD_URL,
+            USERNAME,
+            PASSWORD,
+            transport=transport,
+            retry_policy=retry_policy,
+            limiter=limiter,
+        )
+        self.user_cache = user_cache
 
     def get_users(
         self,
@@ -47,7 +78,7 @@ class UserManager(BaseManager):
 
             if response.status_code in [200, 201, 207, 206]:
                 # Parse JSON response
-                return json.loads(response.text)
+                return loads_json(response.content)
             else:
                 raise HTTPError(
                     f"HTTP error: {response.status_code} - {response.text}",
@@ -85,29 +116,152 @@ class UserManager(BaseManager):
             else:
                 raise ValueError("One of username, user_id or name must be provided")
 
-            # Build URL for specific user
-            url = f"/ocs/v1.php/cloud/users/{userid}?format=json"
+            status_code, payload = self._lookup_user(userid)
+            if status_code == 404:
+                raise HTTPError(f"User not found: {userid}")
+            return payload
 
-            # Send GET request with OCS-APIRequest header
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse JSON: {e}") from e
+        except Exception as e:
+            raise Exception(f"Failed to retrieve user data: {e}") from e
+
+    def iter_users(
+        self, search: Optional[str] = None, page_size: int = 500
+    ) -> Iterator[str]:
+        """
+        Yields all user IDs, fetching them page by page via OCS API.
+
+        :param search: Optional search filter
+        :param page_size: Users requested per call
+        :return: Iterator over user IDs
+        """
+        for page in self._iter_pages("ocs/v1.php/cloud/users", search, page_size):
+            yield from page
+
+    def iter_users_details(
+        self, search: Optional[str] = None, page_size: int = 500
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yields full user data page by page via the ``cloud/users/details``
+        endpoint, one request per page instead of one per user.
+
+        :param search: Optional search filter
+        :param page_size: Users requested per call
+        :return: Iterator over ``(user ID, user data)`` pairs
+        """
+        for page in self._iter_pages(
+            "ocs/v1.php/cloud/users/details", search, page_size
+        ):
+            yield from page.items()
+
+    def get_users_details(
+        self, usernames: Iterable[str], max_workers: int = 8
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Retrieves user data of many users concurrently via OCS API.
+
+        :param usernames: User IDs to fetch
+        :param max_workers: Number of requests in flight
+        :return: Mapping of every user ID to its data, None if the user does not exist
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive.")
+
+        userids = list(dict.fromkeys(usernames))
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return dict(zip(userids, executor.map(self._fetch_user, userids)))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse JSON: {e}") from e
+        except Exception as e:
+            raise Exception(f"Failed to retrieve user data: {e}") from e
+
+    def _iter_pages(
+        self, url: str, search: Optional[str], page_size: int
+    ) -> Iterator[Any]:
+        if page_size < 1:
+            raise ValueError("page_size must be positive.")
+
+        offset = 0
+        while True:
+            params: Dict[str, Any] = {
+                "format": "json",
+                "limit": page_size,
+                "offset": offset,
+            }
+            if search:
+                params["search"] = search
+            try:
+                response = self._request_webdav(
+                    "GET",
+                    url,
+                    headers={"OCS-APIRequest": "true"},
+                    params=params,
+                    is_rest=True,
+                )
+                if response.status_code != 200:
+                    raise HTTPError(
+                        f"HTTP error: {response.status_code} - {response.text}",
+                        response=response,
+                    )
+                page = _ocs_data(response)["users"]
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Failed to parse JSON: {e}") from e
+            except Exception as e:
+                raise Exception(f"Failed to retrieve users list: {e}") from e
+
+            if page:
+                yield page
+            # A short page is the last one
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    def _fetch_user(self, userid: str) -> Optional[Dict[str, Any]]:
+        status_code, payload = self._lookup_user(userid)
+        if status_code == 404 or not _user_found(payload):
+            return None
+        return payload["ocs"]["data"]
+
+    def _lookup_user(self, userid: str) -> Tuple[int, Dict[str, Any]]:
+        """
+        Status code and parsed OCS response of ``cloud/users/<userid>``,
+        served from ``user_cache`` when possible.
+        """
+        cache = self.user_cache
+        cached = cache.get(userid) if cache is not None else None
+        if cached is None:
             response = self._request_webdav(
                 "GET",
-                url,
+                f"ocs/v1.php/cloud/users/{quote(userid, safe='')}",
                 headers={"OCS-APIRequest": "true"},
+                params={"format": "json"},
                 is_rest=True,
             )
-
-            if response.status_code in [200, 201, 207, 206]:
-                # Parse JSON response
-                return json.loads(response.text)
-            elif response.status_code == 404:
-                raise HTTPError(f"User not found: {userid}", response=response)
+            if response.status_code == 404:
+                cached = (404, {})
+            elif response.status_code in [200, 201, 207, 206]:
+                cached = (response.status_code, loads_json(response.content))
             else:
                 raise HTTPError(
                     f"HTTP error: {response.status_code} - {response.text}",
                     response=response,
                 )
+            if cache is not None:
+                found = cached[0] != 404 and _user_found(cached[1])
+                cache.set(userid, cached[0], cached[1], found=found)
+        if cache is None:
+            return cached
+        # Callers get their own copy; the cached record may be shared
+        return cached[0], copy.deepcopy(cached[1])
 
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse JSON: {e}") from e
-        except Exception as e:
-            raise Exception(f"Failed to retrieve user data: {e}") from e
+
+def _ocs_data(response: Any) -> Any:
+    """``data`` element of an OCS JSON response."""
+    return loads_json(response.content)["ocs"]["data"]
+
+
+def _user_found(payload: Dict[str, Any]) -> bool:
+    # OCS v1 reports a missing user with HTTP 200 and an OCS status code
+    return payload["ocs"]["meta"].get("statuscode") not in OCS_NOT_FOUND
@@ -1,4 +1,6 @@
-# XML запрос для получения метаданных файла
+# XML запрос для получения метаданных файла.
+# Менеджеры собирают тела PROPFIND по профилям (nc_api.xml_query.properties);
+# строка оставлена для совместимости.
 propfind_xml = """<?xml version="1.0" encoding="UTF-8"?>
 <d:propfind xmlns:d="DAV:" xmlns:oc="http://owncloud.org/ns" xmlns:nc="http://nextcloud.org/ns">
   <d:prop>
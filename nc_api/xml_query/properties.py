@@ -0,0 +1,141 @@
+"""
+WebDAV property names and the PROPFIND bodies built from them.
+
+A *profile* is either the name of one of ``PROFILES`` or a sequence of
+property names. Bodies are generated once per profile and cached as
+encoded bytes, so hot paths can ask for just the properties they read
+without paying for the rest on the server.
+"""
+
+from functools import lru_cache
+from typing import Sequence, Tuple, Union
+
+NAMESPACES = {
+    "d": "DAV:",
+    "oc": "http://owncloud.org/ns",
+    "nc": "http://nextcloud.org/ns",
+}
+
+# Namespace prefix of the properties that can be named without one
+PROPERTIES = {
+    "getlastmodified": "d",
+    "getetag": "d",
+    "getcontenttype": "d",
+    "getcontentlength": "d",
+    "resourcetype": "d",
+    "displayname": "d",
+    "fileid": "oc",
+    "permissions": "oc",
+    "size": "oc",
+    "favorite": "oc",
+    "comments-unread": "oc",
+    "owner-id": "oc",
+    "owner-display-name": "oc",
+    "share-types": "oc",
+    "checksums": "oc",
+    "has-preview": "nc",
+    "contained-folder-count": "nc",
+    "contained-file-count": "nc",
+    "upload_time": "nc",
+    "creation_time": "nc",
+}
+# FileInfo field names accepted in place of the property names
+ALIASES = {
+    "name": "displayname",
+    "etag": "getetag",
+    "last_modified": "getlastmodified",
+    "content_type": "getcontenttype",
+    "file_id": "fileid",
+}
+
+PROFILES = {
+    # What listings and change checks read: identity, size, time and type
+    "minimal": ("getetag", "getlastmodified", "getcontenttype", "resourcetype", "size"),
+    # Everything FileInfo has a field for; comment counts, share types,
+    # previews and folder counts are the expensive part on the server
+    "full": (
+        "getlastmodified",
+        "getetag",
+        "getcontenttype",
+        "resourcetype",
+        "fileid",
+        "permissions",
+        "size",
+        "getcontentlength",
+        "has-preview",
+        "favorite",
+        "comments-unread",
+        "owner-display-name",
+        "share-types",
+        "contained-folder-count",
+        "contained-file-count",
+        "checksums",
+    ),
+    # Cache revalidation and existence checks
+    "etag": ("getetag",),
+    # Comparison of local content with remote files before uploads
+    "checksum": ("getetag", "size", "checksums"),
+}
+
+Profile = Union[str, Sequence[str]]
+
+
+def qualified_name(name: str) -> str:
+    """
+    :param name: ``"size"``, a FileInfo alias like ``"last_modified"`` or a prefixed ``"oc:size"``
+    :return: Prefixed name, e.g. ``"oc:size"``
+    """
+    if ":" in name:
+        prefix = name.split(":", 1)[0]
+        if prefix not in NAMESPACES:
+            raise ValueError(f"Unknown namespace prefix in {name!r}")
+        return name
+    name = ALIASES.get(name, name)
+    prefix = PROPERTIES.get(name)
+    if prefix is None:
+        raise ValueError(
+            f"Unknown property {name!r}, use a prefixed name such as 'oc:{name}'"
+        )
+    return f"{prefix}:{name}"
+
+
+def profile_properties(profile: Profile) -> Tuple[str, ...]:
+    """
+    ``d:resourcetype`` is always included: it is cheap, and without it every
+    entry would look like a file.
+
+    :param profile: Profile name or sequence of property names
+    :return: Prefixed names of the properties the profile asks for
+    """
+    if isinstance(profile, str):
+        names = PROFILES.get(profile)
+        if names is None:
+            raise ValueError(
+                f"Unknown property profile {profile!r}, expected one of {tuple(PROFILES)} "
+                "or a sequence of property names"
+            )
+        profile = names
+    names = tuple(dict.fromkeys(qualified_name(name) for name in profile))
+    if "d:resourcetype" not in names:
+        names += ("d:resourcetype",)
+    return names
+
+
+def propfind_body(profile: Profile = "full") -> bytes:
+    """
+    :param profile: Profile name or sequence of property names
+    :return: Encoded PROPFIND body, built once per profile
+    """
+    return _propfind_body(profile if isinstance(profile, str) else tuple(profile))
+
+
+@lru_cache(maxsize=64)
+def _propfind_body(profile: Union[str, Tuple[str, ...]]) -> bytes:
+    namespaces = "".join(
+        f' xmlns:{prefix}="{uri}"' for prefix, uri in NAMESPACES.items()
+    )
+    props = "".join(f"<{name}/>" for name in profile_properties(profile))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f"<d:propfind{namespaces}><d:prop>{props}</d:prop></d:propfind>"
+    ).encode()
@@ -0,0 +1,243 @@
+"""
+Builder of WebDAV ``SEARCH`` (DASL basicsearch) request bodies.
+
+Conditions are composed from ``prop(...)`` comparisons with ``&``, ``|``
+and ``~``; ``SearchQuery`` adds the scope, ordering, paging and the
+properties to return::
+
+    hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+    query = (
+        SearchQuery("/photos")
+        .where((prop("last_modified") > hour_ago) & ~is_collection())
+        .order_by("last_modified", descending=True)
+        .limit(100)
+    )
+"""
+
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Optional, Tuple, Union
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from nc_api.xml_query.properties import (
+    NAMESPACES,
+    Profile,
+    profile_properties,
+    qualified_name,
+)
+
+# Namespace of the firstresult paging extension Nextcloud implements
+SEARCHDAV_NS = "https://github.com/icewind1991/SearchDAV/ns"
+
+Literal = Union[str, int, float, bool, datetime]
+
+
+def _prop_xml(name: str) -> str:
+    return f"<d:prop><{name}/></d:prop>"
+
+
+def _literal(value: Literal) -> str:
+    if isinstance(value, bool):
+        # Nextcloud reads boolean literals as "yes" / anything else
+        return "yes" if value else "no"
+    if isinstance(value, datetime):
+        # Naive datetimes are taken as local time; the server expects ATOM
+        return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+    return escape(str(value))
+
+
+class Condition:
+    """Node of a where-clause; combine with ``&``, ``|`` and ``~``."""
+
+    def to_xml(self) -> str:
+        raise NotImplementedError
+
+    def __and__(self, other: "Condition") -> "Condition":
+        return _Group("and", (self, other))
+
+    def __or__(self, other: "Condition") -> "Condition":
+        return _Group("or", (self, other))
+
+    def __invert__(self) -> "Condition":
+        return _Not(self)
+
+
+class _Compare(Condition):
+    def __init__(self, operator: str, name: str, value: Literal) -> None:
+        self.operator = operator
+        self.name = name
+        self.value = value
+
+    def to_xml(self) -> str:
+        return (
+            f"<d:{self.operator}>{_prop_xml(self.name)}"
+            f"<d:literal>{_literal(self.value)}</d:literal></d:{self.operator}>"
+        )
+
+
+class _IsCollection(Condition):
+    def to_xml(self) -> str:
+        return "<d:is-collection/>"
+
+
+class _Group(Condition):
+    def __init__(self, operator: str, conditions: Tuple[Condition, ...]) -> None:
+        # Flatten chains like a & b & c into one element
+        flat = []
+        for condition in conditions:
+            if isinstance(condition, _Group) and condition.operator == operator:
+                flat.extend(condition.conditions)
+            else:
+                flat.append(condition)
+        self.operator = operator
+        self.conditions = tuple(flat)
+
+    def to_xml(self) -> str:
+        inner = "".join(condition.to_xml() for condition in self.conditions)
+        return f"<d:{self.operator}>{inner}</d:{self.operator}>"
+
+
+class _Not(Condition):
+    def __init__(self, condition: Condition) -> None:
+        self.condition = condition
+
+    def to_xml(self) -> str:
+        return f"<d:not>{self.condition.to_xml()}</d:not>"
+
+
+class Prop:
+    """Property operand of a condition, created by ``prop``."""
+
+    def __init__(self, name: str) -> None:
+        self.name = qualified_name(name)
+
+    def __eq__(self, value: Literal) -> Condition:  # type: ignore[override]
+        return _Compare("eq", self.name, value)
+
+    def __ne__(self, value: Literal) -> Condition:  # type: ignore[override]
+        return _Not(_Compare("eq", self.name, value))
+
+    def __lt__(self, value: Literal) -> Condition:
+        return _Compare("lt", self.name, value)
+
+    def __le__(self, value: Literal) -> Condition:
+        return _Compare("lte", self.name, value)
+
+    def __gt__(self, value: Literal) -> Condition:
+        return _Compare("gt", self.name, value)
+
+    def __ge__(self, value: Literal) -> Condition:
+        return _Compare("gte", self.name, value)
+
+    def like(self, pattern: str) -> Condition:
+        """:param pattern: SQL-style pattern, ``%`` matches any run of characters"""
+        return _Compare("like", self.name, pattern)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def prop(name: str) -> Prop:
+    """
+    :param name: Property name, see ``qualified_name``
+    :return: Operand supporting ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=`` and ``like``
+    """
+    return Prop(name)
+
+
+def is_collection() -> Condition:
+    """Matches directories; ``~is_collection()`` matches files."""
+    return _IsCollection()
+
+
+def all_of(*conditions: Condition) -> Condition:
+    return _Group("and", conditions)
+
+
+def any_of(*conditions: Condition) -> Condition:
+    return _Group("or", conditions)
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """
+    Immutable SEARCH query; every builder method returns a new query.
+
+    :param scope: Directory searched recursively, relative to the user's files root
+    """
+
+    scope: str = "/"
+    condition: Optional[Condition] = None
+    ordering: Tuple[Tuple[str, bool], ...] = ()
+    max_results: Optional[int] = None
+    offset: int = 0
+    properties: Optional[Tuple[str, ...]] = None
+
+    def where(self, condition: Condition) -> "SearchQuery":
+        """Adds a condition; repeated calls are combined with ``and``."""
+        if self.condition is not None:
+            condition = self.condition & condition
+        return replace(self, condition=condition)
+
+    def order_by(self, name: str, descending: bool = False) -> "SearchQuery":
+        """Adds a sort key; earlier keys take precedence."""
+        return replace(
+            self, ordering=self.ordering + ((qualified_name(name), descending),)
+        )
+
+    def limit(self, count: Optional[int], offset: int = 0) -> "SearchQuery":
+        """
+        :param count: Largest number of results, None for no limit
+        :param offset: Number of leading results to skip
+        """
+        if count is not None and count < 1:
+            raise ValueError("count must be positive.")
+        if offset < 0:
+            raise ValueError("offset must not be negative.")
+        return replace(self, max_results=count, offset=offset)
+
+    def select(self, profile: Profile) -> "SearchQuery":
+        """
+        :param profile: Profile name or property names to return instead of the ``"full"`` profile
+        """
+        return replace(self, properties=profile_properties(profile))
+
+    def to_xml(self, username: str) -> str:
+        """
+        :param username: Owner of the searched files
+        :return: Body of the SEARCH request sent to ``/remote.php/dav/``
+        """
+        names = self.properties or profile_properties("full")
+        select = "".join(f"<{name}/>" for name in names)
+        scope = f"/files/{quote(username)}/{quote(self.scope.strip('/'))}".rstrip("/")
+        # An empty where-clause is not accepted, a size >= 0 test matches everything
+        condition = self.condition or (prop("size") >= 0)
+        orders = "".join(
+            f"<d:order>{_prop_xml(name)}"
+            f"{'<d:descending/>' if descending else '<d:ascending/>'}</d:order>"
+            for name, descending in self.ordering
+        )
+        limit = ""
+        if self.max_results is not None or self.offset:
+            limit = "<d:limit>"
+            if self.max_results is not None:
+                limit += f"<d:nresults>{self.max_results}</d:nresults>"
+            if self.offset:
+                limit += f"<ns:firstresult>{self.offset}</ns:firstresult>"
+            limit += "</d:limit>"
+        namespaces = "".join(
+            f' xmlns:{prefix}="{uri}"' for prefix, uri in NAMESPACES.items()
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f'<d:searchrequest{namespaces} xmlns:ns="{SEARCHDAV_NS}">'
+            "<d:basicsearch>"
+            f"<d:select><d:prop>{select}</d:prop></d:select>"
+            f"<d:from><d:scope><d:href>{escape(scope)}</d:href>"
+            "<d:depth>infinity</d:depth></d:scope></d:from>"
+            f"<d:where>{condition.to_xml()}</d:where>"
+            f"<d:orderby>{orders}</d:orderby>"
+            f"{limit}"
+            "</d:basicsearch>"
+            "</d:searchrequest>"
+        )
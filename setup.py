@@ -21,6 +21,11 @@ setup(
     install_requires=[
         "requests>=2.31.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.9"],
+        "speedups": ["orjson>=3.9"],
+        "lxml": ["lxml>=4.9"],
+    },
     include_package_data=True,
     project_urls={"GitHub": "https://github.com/odnashestaia/nc-api-python"},
     classifiers=[
@@ -2,6 +2,7 @@ import os
 
 import pytest
 
+from benchmarks.standin import StandinServer
 from nc_api.base_manager import BaseManager
 from nc_api.client import NextcloudClient
 from nc_api.directory_manager import DirectoryManager
@@ -79,3 +80,9 @@ def managers(nc_url: str, nc_user: str, nc_pass: str):
         "client": client,
         "helper": helper,
     }
+
+
+@pytest.fixture()
+def standin():
+    with StandinServer() as server:
+        yield server
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from nc_api.aio import AsyncNextcloudClient  # noqa: E402
+
+
+def test_async_client_roundtrip(nc_url, nc_user, nc_pass, tmp_path):
+    async def scenario():
+        async with AsyncNextcloudClient(
+            nc_url + "/remote.php/dav/files/" + nc_user, nc_user, nc_pass
+        ) as client:
+            assert await client.dirs.create_directory("/it_async")
+            assert (
+                await client.files.upload_file(
+                    FILE=b"async", REMOTE_UPLOAD_PATH="/it_async/a.txt"
+                )
+                is True
+            )
+            out = tmp_path / "a.txt"
+            assert await client.files.download_file(str(out), "/it_async/a.txt")
+            assert out.read_bytes() == b"async"
+            assert await client.paths.delete_path("/it_async/a.txt")
+
+    asyncio.run(scenario())
+
+
+def test_async_chunked_upload(nc_url, nc_user, nc_pass, tmp_path):
+    data = bytes(range(256)) * (48 * 1024)  # 12 MiB
+
+    async def scenario():
+        async with AsyncNextcloudClient(
+            nc_url + "/remote.php/dav/files/" + nc_user, nc_user, nc_pass
+        ) as client:
+            client.files.chunked_threshold = 6 * 1024 * 1024
+            assert await client.dirs.create_directory("/it_async_chunked")
+            assert await client.files.upload_file(
+                FILE=data, REMOTE_UPLOAD_PATH="/it_async_chunked/big.bin"
+            )
+            out = tmp_path / "big.bin"
+            assert await client.files.download_file(str(out), "/it_async_chunked/big.bin")
+            assert out.read_bytes() == data
+
+    asyncio.run(scenario())
@@ -1,3 +1,60 @@
 def test_client_smoke(managers):
     c = managers["client"]
     assert c.dirs and c.files and c.paths and c.users
+
+
+def test_client_shares_transport(managers):
+    c = managers["client"]
+    assert c.dirs.transport is c.transport
+    assert c.files.transport is c.transport
+    assert c.paths.transport is c.transport
+    assert c.users.transport is c.transport
+
+
+def test_client_retry_policy(nc_url, nc_user, nc_pass):
+    from nc_api import NextcloudClient, RetryBudget, RetryPolicy
+
+    policy = RetryPolicy(retries=2, backoff=0.1, budget=RetryBudget(reserve=5))
+    client = NextcloudClient(
+        nc_url + "/remote.php/dav/files/" + nc_user,
+        nc_user,
+        nc_pass,
+        retry_policy=policy,
+    )
+    assert client.files.retry_policy is policy
+    assert client.users.retry_policy is policy
+    assert client.dirs.create_directory("/it_retry")
+    assert client.dirs.directory_exists_check("/it_retry") is True
+
+
+def test_client_request_limiter(nc_url, nc_user, nc_pass):
+    from nc_api import NextcloudClient, RequestLimiter
+
+    limiter = RequestLimiter(rate=20, concurrency=2, max_concurrency=4)
+    client = NextcloudClient(
+        nc_url + "/remote.php/dav/files/" + nc_user,
+        nc_user,
+        nc_pass,
+        limiter=limiter,
+    )
+    assert client.dirs.create_directory("/it_limits")
+    for _ in range(5):
+        assert client.dirs.directory_exists_check("/it_limits") is True
+    assert 1 <= limiter.concurrency_limit(nc_url) <= 4
+
+
+def test_client_metrics_snapshot(managers):
+    client = managers["client"]
+    events = []
+    client.metrics.add_hooks(after=events.append)
+
+    assert client.dirs.create_directory("/it_metrics")
+    assert client.files.upload_file(FILE=b"m" * 10, REMOTE_UPLOAD_PATH="/it_metrics/m.txt")
+
+    snapshot = client.metrics_snapshot()
+    assert snapshot["requests"] >= 2
+    assert snapshot["bytes_sent"] >= 10
+    assert "PUT" in snapshot["latency"]
+    assert snapshot["connections"]["requests"] >= 2
+    assert any(event.method == "PUT" for event in events)
+    assert "nc_api_requests_total" in client.metrics_prometheus()
@@ -1,3 +1,6 @@
+from nc_api.changes import ChangeIndex
+
+
 def test_directory_exists_check(managers):
     helper = managers["helper"]
     base = managers["base"]
@@ -11,3 +14,89 @@ def test_directory_exists_check(managers):
         False,
         "Unexpected response: 404 - ",
     )
+
+
+def test_list_directory_and_walk(managers):
+    helper = managers["helper"]
+    files = managers["files"]
+    d = managers["dirs"]
+
+    assert helper.CreateDirectory("/test_list")
+    assert helper.CreateDirectory("/test_list/sub")
+    assert files.upload_file(FILE=b"1", REMOTE_UPLOAD_PATH="/test_list/one.txt")
+    assert files.upload_file(FILE=b"22", REMOTE_UPLOAD_PATH="/test_list/sub/two.txt")
+
+    entries = {e.name: e for e in d.list_directory("/test_list")}
+    assert set(entries) == {"one.txt", "sub"}
+    assert entries["sub"].is_dir is True
+    assert entries["one.txt"].size == 1
+    assert entries["one.txt"].etag
+
+    walked = {e.path for e in d.walk("/test_list")}
+    assert "/test_list/sub/two.txt" in walked
+
+
+def test_list_table(managers):
+    helper = managers["helper"]
+    files = managers["files"]
+    d = managers["dirs"]
+
+    assert helper.CreateDirectory("/test_table")
+    assert files.upload_file(FILE=b"1", REMOTE_UPLOAD_PATH="/test_table/small.txt")
+    assert files.upload_file(FILE=b"x" * 100, REMOTE_UPLOAD_PATH="/test_table/big.bin")
+
+    table = d.list_table("/test_table")
+    assert len(table) == 2
+    assert table.total_size() == 101
+
+    big = table.filter(is_dir=False, min_size=50)
+    assert [e.name for e in big] == ["big.bin"]
+    assert [e.name for e in table.sort_by("size")] == ["small.txt", "big.bin"]
+    assert isinstance(big[0].file_id, int)
+
+
+def test_property_profiles(managers):
+    helper = managers["helper"]
+    files = managers["files"]
+    d = managers["dirs"]
+
+    assert helper.CreateDirectory("/test_profiles")
+    assert files.upload_file(FILE=b"abc", REMOTE_UPLOAD_PATH="/test_profiles/a.txt")
+
+    minimal = d.list_directory("/test_profiles", profile="minimal")
+    assert [(e.name, e.size) for e in minimal] == [("a.txt", 3)]
+    assert minimal[0].etag and minimal[0].permissions is None
+
+    custom = files.get_file_info("/test_profiles/a.txt", profile=["fileid"])
+    assert isinstance(custom.file_id, int) and custom.size is None
+    assert d.directory_exists_check("/test_profiles", profile="minimal") is True
+
+
+def test_iter_changes(managers):
+    helper = managers["helper"]
+    files = managers["files"]
+    d = managers["dirs"]
+
+    assert helper.CreateDirectory("/test_changes")
+    assert helper.CreateDirectory("/test_changes/sub")
+    assert files.upload_file(FILE=b"1", REMOTE_UPLOAD_PATH="/test_changes/sub/a.txt")
+
+    index = ChangeIndex()
+    first = {(c.kind, c.path) for c in d.iter_changes("/test_changes", index)}
+    assert first == {("added", "/test_changes/sub"), ("added", "/test_changes/sub/a.txt")}
+    assert list(d.iter_changes("/test_changes", index)) == []
+
+    assert files.upload_file(FILE=b"22", REMOTE_UPLOAD_PATH="/test_changes/sub/a.txt")
+    assert files.upload_file(FILE=b"3", REMOTE_UPLOAD_PATH="/test_changes/b.txt")
+    changes = {(c.kind, c.path) for c in d.iter_changes("/test_changes", index)}
+    assert changes == {
+        ("modified", "/test_changes/sub/a.txt"),
+        ("added", "/test_changes/b.txt"),
+    }
+
+    # A profile without getetag still reports modifications
+    assert files.upload_file(FILE=b"333", REMOTE_UPLOAD_PATH="/test_changes/sub/a.txt")
+    changes = list(d.iter_changes("/test_changes", index, profile=["size"]))
+    assert [(c.kind, c.path, c.entry.size) for c in changes] == [
+        ("modified", "/test_changes/sub/a.txt", 3)
+    ]
@@ -1,3 +1,8 @@
+import os
+
+from nc_api.xml_query.search import SearchQuery, is_collection, prop
+
+
 def test_file_upload_and_get_data(managers, tmp_path):
     helper = managers["helper"]
     files = managers["files"]
@@ -22,3 +27,165 @@ def test_file_download(managers, tmp_path):
     out = tmp_path / "b.txt"
     assert files.download_file(str(out), "/it_dir2/b.txt") is True
     assert out.read_bytes() == b"world"
+
+
+def test_file_upload_streaming(managers, tmp_path):
+    helper = managers["helper"]
+    files = managers["files"]
+
+    assert helper.CreateDirectory("/it_dir_stream")
+
+    src = tmp_path / "big.bin"
+    src.write_bytes(b"z" * 300_000)
+    progress = []
+    with open(src, "rb") as f:
+        assert (
+            files.upload_file(
+                FILE=f,
+                REMOTE_UPLOAD_PATH="/it_dir_stream/big.bin",
+                chunk_size=64 * 1024,
+                progress_callback=lambda sent, total: progress.append((sent, total)),
+            )
+            is True
+        )
+    assert progress[-1] == (300_000, 300_000)
+
+    assert (
+        files.upload_file(
+            FILE=iter([b"ab"] * 10), REMOTE_UPLOAD_PATH="/it_dir_stream/gen.txt"
+        )
+        is True
+    )
+
+
+def test_file_download_resume_and_stream(managers, tmp_path):
+    helper = managers["helper"]
+    files = managers["files"]
+
+    assert helper.CreateDirectory("/it_dir_dl")
+    payload = bytes(range(256)) * 1000
+    assert files.upload_file(FILE=payload, REMOTE_UPLOAD_PATH="/it_dir_dl/c.bin")
+
+    out = tmp_path / "c.bin"
+    (tmp_path / "c.bin.part").write_bytes(payload[:1000])
+    assert files.download_file(str(out), "/it_dir_dl/c.bin", chunk_size=4096) is True
+    assert out.read_bytes() == payload
+    assert not (tmp_path / "c.bin.part").exists()
+
+    assert b"".join(files.iter_download("/it_dir_dl/c.bin", offset=10)) == payload[10:]
+    with files.open_download("/it_dir_dl/c.bin") as stream:
+        assert stream.read(256) == payload[:256]
+
+
+def test_file_upload_chunked(managers, tmp_path):
+    helper = managers["helper"]
+    files = managers["files"]
+
+    assert helper.CreateDirectory("/it_dir_chunked")
+
+    src = tmp_path / "large.bin"
+    payload = os.urandom(12 * 1024 * 1024)
+    src.write_bytes(payload)
+
+    files.chunked_threshold = 6 * 1024 * 1024
+    files.chunked_uploader.chunk_size = 5 * 1024 * 1024
+    assert (
+        files.upload_file(
+            LOCAL_UPLOAD_PATH=str(src), REMOTE_UPLOAD_PATH="/it_dir_chunked/large.bin"
+        )
+        is True
+    )
+    assert files.get_data_file("/it_dir_chunked/large.bin").get("size") == str(
+        len(payload)
+    )
+
+
+def test_file_metadata_cache(nc_url, nc_user, nc_pass):
+    from nc_api import MetadataCache, NextcloudClient
+
+    client = NextcloudClient(
+        nc_url + "/remote.php/dav/files/" + nc_user,
+        nc_user,
+        nc_pass,
+        metadata_cache=MetadataCache(ttl=60),
+    )
+    assert client.dirs.create_directory("/it_dir_cache")
+    assert client.files.upload_file(
+        FILE=b"one", REMOTE_UPLOAD_PATH="/it_dir_cache/c.txt"
+    )
+
+    first = client.files.get_data_file("/it_dir_cache/c.txt")
+    assert client.files.get_data_file("/it_dir_cache/c.txt") == first
+
+    # Own writes invalidate the cached entry
+    assert client.files.upload_file(
+        FILE=b"three", REMOTE_UPLOAD_PATH="/it_dir_cache/c.txt"
+    )
+    assert client.files.get_data_file("/it_dir_cache/c.txt")["size"] == "5"
+
+
+def test_file_upload_create_parents(managers):
+    client = managers["client"]
+
+    for i in range(3):
+        assert client.files.upload_file(
+            FILE=b"p", REMOTE_UPLOAD_PATH=f"/it_parents/a/b/{i}.txt", create_parents=True
+        )
+    assert "/it_parents/a/b" in client.files.known_directories
+
+    assert client.paths.delete_path("/it_parents")
+    assert "/it_parents/a/b" not in client.files.known_directories
+
+
+def test_file_get_data_files(managers):
+    client = managers["client"]
+
+    for i in range(3):
+        assert client.files.upload_file(
+            FILE=b"x" * i, REMOTE_UPLOAD_PATH=f"/it_batch/{i}.txt", create_parents=True
+        )
+
+    paths = [f"/it_batch/{i}.txt" for i in range(3)] + ["/it_batch/missing.txt"]
+    meta = client.files.get_data_files(paths)
+    assert set(meta) == set(paths)
+    assert meta["/it_batch/2.txt"]["getcontentlength"] == "2"
+    assert meta["/it_batch/missing.txt"] is None
+
+
+def test_get_file_info(managers):
+    helper = managers["helper"]
+    files = managers["files"]
+
+    assert helper.CreateDirectory("/it_info")
+    assert files.upload_file(FILE=b"12345", REMOTE_UPLOAD_PATH="/it_info/a.txt")
+
+    info = files.get_file_info("/it_info/a.txt")
+    assert info is not None
+    assert info.size == 5
+    assert not info.is_dir
+    assert info.last_modified is not None
+    assert files.get_data_file("/it_info/a.txt")["getetag"] == info.etag
+
+
+def test_file_search(managers):
+    client = managers["client"]
+
+    for i in range(5):
+        assert client.files.upload_file(
+            FILE=b"s" * (i + 1),
+            REMOTE_UPLOAD_PATH=f"/it_search/{i}.txt",
+            create_parents=True,
+        )
+
+    query = (
+        SearchQuery("/it_search")
+        .where(~is_collection() & (prop("size") >= 3))
+        .order_by("size", descending=True)
+    )
+    found = list(client.files.search(query))
+    assert [entry.size for entry in found] == [5, 4, 3]
+    assert found[0].path.endswith("/it_search/4.txt")
+
+    files_only = SearchQuery("/it_search").where(~is_collection())
+    paged = list(client.files.search(files_only, page_size=2))
+    assert len(paged) == 5
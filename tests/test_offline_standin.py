@@ -0,0 +1,288 @@
+import asyncio
+import hashlib
+import time
+
+import pytest
+
+from benchmarks.standin import StandinHandler
+from nc_api import (
+    ChangeIndex,
+    MetadataCache,
+    NextcloudClient,
+    RequestLimiter,
+    RetryPolicy,
+)
+from nc_api.cache import KnownDirectories
+
+
+@pytest.fixture()
+def faults(monkeypatch):
+    """Plan of (method, status, headers) replacing the next matching responses."""
+    plan = []
+    send = StandinHandler._send
+
+    def _send(self, status, body=b"", headers=None):
+        if plan and self.command == plan[0][0]:
+            _, status, extra = plan.pop(0)
+            headers = dict(headers or {}, **extra)
+        return send(self, status, body, headers)
+
+    monkeypatch.setattr(StandinHandler, "_send", _send)
+    return plan
+
+
+@pytest.fixture()
+def client(standin):
+    return NextcloudClient(
+        standin.url, "admin", "admin", retry_policy=RetryPolicy(backoff=0.01)
+    )
+
+
+def test_move_retried_after_503_then_404_fails(client, faults):
+    assert client.files.upload_file(
+        FILE=b"m", REMOTE_UPLOAD_PATH="/m/a.txt", create_parents=True
+    )
+
+    # The first MOVE is applied but answered 503, the retry then gets a 404
+    faults.append(("MOVE", 503, {}))
+    report = client.paths.move_paths([("/m/a.txt", "/m/b.txt")], backoff=0.01)
+    result = report.results[0]
+    assert not result.ok
+    assert result.attempts == 2
+
+
+def test_delete_retried_after_502_then_404_succeeds(client, faults):
+    assert client.files.upload_file(
+        FILE=b"d", REMOTE_UPLOAD_PATH="/d/a.txt", create_parents=True
+    )
+
+    faults.append(("DELETE", 502, {}))
+    result = client.paths.delete_paths(["/d/a.txt"], backoff=0.01).results[0]
+    assert result.ok
+    assert result.attempts == 2
+
+    result = client.paths.delete_paths(["/d/missing.txt"], backoff=0.01).results[0]
+    assert not result.ok
+    assert result.attempts == 1
+
+
+def _folder_with_forbidden_directory(tmp_path, monkeypatch):
+    for rel in ["a.txt", "bad/b.txt", "bad/deep/c.txt", "ok/d.txt"]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_bytes(b"x")
+
+    mkcol = StandinHandler.do_MKCOL
+
+    def do_MKCOL(self):
+        if self.path.rstrip("/").endswith("/bad"):
+            self._begin()
+            return self._send(403)
+        return mkcol(self)
+
+    monkeypatch.setattr(StandinHandler, "do_MKCOL", do_MKCOL)
+
+
+def test_upload_folder_mkcol_failure(client, tmp_path, monkeypatch):
+    _folder_with_forbidden_directory(tmp_path, monkeypatch)
+
+    report = client.paths.upload_folder(str(tmp_path), "/up")
+    assert sorted(result.path for result in report.failed) == [
+        "/up/bad/b.txt",
+        "/up/bad/deep/c.txt",
+    ]
+    assert sorted(result.path for result in report.succeeded) == [
+        "/up/a.txt",
+        "/up/ok/d.txt",
+    ]
+
+
+def test_async_upload_folder_mkcol_failure(standin, tmp_path, monkeypatch):
+    pytest.importorskip("aiohttp")
+    from nc_api.aio import AsyncNextcloudClient
+
+    _folder_with_forbidden_directory(tmp_path, monkeypatch)
+
+    async def upload():
+        async with AsyncNextcloudClient(standin.url, "admin", "admin") as client:
+            return await client.paths.upload_folder(str(tmp_path), "/aup")
+
+    report = asyncio.run(upload())
+    assert sorted(result.path for result in report.failed) == [
+        "/aup/bad/b.txt",
+        "/aup/bad/deep/c.txt",
+    ]
+    assert len(report.succeeded) == 2
+
+
+def test_directory_exists_check_on_file(standin):
+    client = NextcloudClient(
+        standin.url, "admin", "admin", metadata_cache=MetadataCache()
+    )
+    cache = client.dirs.metadata_cache
+    assert client.files.upload_file(
+        FILE=b"f", REMOTE_UPLOAD_PATH="/e/f.txt", create_parents=True
+    )
+
+    assert client.dirs.directory_exists_check("/e/f.txt") is True
+    assert not cache.is_known_directory("/e/f.txt")
+    assert client.dirs.directory_exists_check("/e") is True
+    assert cache.is_known_directory("/e")
+
+    client.dirs.directory_exists_check("/e/f.txt", profile="full")
+    entry, _ = cache.lookup("/e/f.txt")
+    assert entry is not None and not entry.is_dir
+
+
+def test_retry_after_above_cap_returns_response(standin, faults):
+    client = NextcloudClient(
+        standin.url, "admin", "admin", retry_policy=RetryPolicy(max_backoff=1)
+    )
+
+    faults.append(("PROPFIND", 503, {"Retry-After": "120"}))
+    started = time.monotonic()
+    response = client.dirs._request_webdav("PROPFIND", "/", headers={"Depth": "0"})
+    assert response.status_code == 503
+    assert time.monotonic() - started < 1
+
+
+def test_retry_after_below_cap_is_waited_in_full(standin, faults):
+    client = NextcloudClient(
+        standin.url,
+        "admin",
+        "admin",
+        retry_policy=RetryPolicy(max_backoff=0.1, max_retry_after=5),
+    )
+
+    faults.append(("PROPFIND", 429, {"Retry-After": "1"}))
+    started = time.monotonic()
+    response = client.dirs._request_webdav("PROPFIND", "/", headers={"Depth": "0"})
+    assert response.status_code == 207
+    assert time.monotonic() - started >= 1
+
+
+def test_known_directories_bounded():
+    now = [0.0]
+    known = KnownDirectories(maxsize=2, ttl=10, clock=lambda: now[0])
+
+    known.add("/a")
+    known.add("/a/b")
+    known.add("/ab")
+    assert "/a" not in known
+    assert "/a/b" in known and "/ab" in known
+
+    known.add("/a/b/c")
+    assert "/a/b" not in known
+    known.discard("/a")
+    assert "/a/b/c" not in known
+    assert "/ab" in known
+    assert "/" in known
+
+    known.add("/x")
+    now[0] = 11
+    assert "/x" not in known
+
+
+def test_upload_create_parents_remembers_directories(client):
+    for i in range(3):
+        assert client.files.upload_file(
+            FILE=b"p", REMOTE_UPLOAD_PATH=f"/p/a/b/{i}.txt", create_parents=True
+        )
+    assert "/p/a/b" in client.files.known_directories
+
+    assert client.paths.delete_path("/p")
+    assert "/p/a/b" not in client.files.known_directories
+
+
+def test_get_data_files_lists_parent_only_for_large_groups(client, monkeypatch):
+    depths = []
+    propfind = StandinHandler.do_PROPFIND
+
+    def do_PROPFIND(self):
+        depths.append(self.headers.get("Depth"))
+        return propfind(self)
+
+    monkeypatch.setattr(StandinHandler, "do_PROPFIND", do_PROPFIND)
+    for i in range(10):
+        assert client.files.upload_file(
+            FILE=b"x" * i, REMOTE_UPLOAD_PATH=f"/g/{i}.txt", create_parents=True
+        )
+
+    depths.clear()
+    meta = client.files.get_data_files(["/g/1.txt", "/g/2.txt", "/g/missing.txt"])
+    assert depths == ["0", "0", "0"]
+    assert meta["/g/2.txt"]["getcontentlength"] == "2"
+    assert meta["/g/missing.txt"] is None
+
+    depths.clear()
+    meta = client.files.get_data_files([f"/g/{i}.txt" for i in range(8)])
+    assert depths == ["1"]
+    assert all(meta.values())
+
+
+def test_request_limiter_backs_off_on_429(standin, faults):
+    limiter = RequestLimiter(concurrency=4)
+    client = NextcloudClient(
+        standin.url,
+        "admin",
+        "admin",
+        limiter=limiter,
+        retry_policy=RetryPolicy(retries=0),
+    )
+    assert client.dirs.create_directory("/l")
+    assert client.dirs.directory_exists_check("/l") is True
+    before = limiter.concurrency_limit(standin.url)
+
+    faults.append(("PROPFIND", 429, {}))
+    client.dirs.directory_exists_check("/l")
+    assert limiter.concurrency_limit(standin.url) < before
+
+
+def test_metrics_count_retries(client, faults):
+    events = []
+    client.metrics.add_hooks(after=events.append)
+    assert client.dirs.create_directory("/r")
+
+    faults.append(("PUT", 503, {}))
+    assert client.files.upload_file(FILE=b"r" * 10, REMOTE_UPLOAD_PATH="/r/a.txt")
+
+    snapshot = client.metrics_snapshot()
+    puts = {
+        key: count
+        for key, count in snapshot["responses"].items()
+        if key.startswith("PUT")
+    }
+    assert puts["PUT 503"] == 1
+    assert sum(puts.values()) == 2
+    assert snapshot["retries"]
+    assert [event.method for event in events].count("PUT") == 2
+
+
+def test_iter_changes_without_getetag(client):
+    assert client.files.upload_file(
+        FILE=b"1", REMOTE_UPLOAD_PATH="/w/sub/a.txt", create_parents=True
+    )
+    index = ChangeIndex()
+    list(client.dirs.iter_changes("/w", index, profile=["size"]))
+
+    assert client.files.upload_file(FILE=b"22", REMOTE_UPLOAD_PATH="/w/sub/a.txt")
+    changes = list(client.dirs.iter_changes("/w", index, profile=["size"]))
+    assert [(c.kind, c.path, c.entry.size) for c in changes] == [
+        ("modified", "/w/sub/a.txt", 2)
+    ]
+
+
+def test_upload_deduplicate_sends_checksum(client, standin):
+    assert client.files.upload_file(
+        FILE=b"abc",
+        REMOTE_UPLOAD_PATH="/h/x.txt",
+        create_parents=True,
+        deduplicate=True,
+    )
+    node = standin.state.nodes["h/x.txt"]
+    assert node.checksum == "SHA1:" + hashlib.sha1(b"abc").hexdigest()
+
+    requests = standin.state.requests
+    assert client.files.upload_file(
+        FILE=b"abc", REMOTE_UPLOAD_PATH="/h/x.txt", deduplicate=True
+    )
+    assert standin.state.requests - requests == 1
@@ -8,3 +8,130 @@ def test_rename_and_delete(managers):
 
     assert paths.rename_path("/itp/x.txt", "/itp/y.txt") is True
     assert paths.delete_path("/itp/y.txt")
+
+
+def test_upload_folder_report(managers, tmp_path):
+    paths = managers["paths"]
+
+    (tmp_path / "sub" / "deep").mkdir(parents=True)
+    (tmp_path / "a.txt").write_bytes(b"a")
+    (tmp_path / "sub" / "b.txt").write_bytes(b"bb")
+    (tmp_path / "sub" / "deep" / "c.txt").write_bytes(b"ccc")
+
+    report = paths.upload_folder(str(tmp_path), "/itp_folder", max_workers=4)
+    assert report.ok
+    assert len(report.results) == 3
+    assert report.bytes_transferred == 6
+    assert {r.path for r in report.results} == {
+        "/itp_folder/a.txt",
+        "/itp_folder/sub/b.txt",
+        "/itp_folder/sub/deep/c.txt",
+    }
+
+
+def test_sync_folder_transfers_only_changes(managers, tmp_path):
+    client = managers["client"]
+
+    local = tmp_path / "sync"
+    (local / "sub").mkdir(parents=True)
+    (local / "a.txt").write_bytes(b"a")
+    (local / "sub" / "b.txt").write_bytes(b"bb")
+
+    first = client.sync.sync_folder(str(local), "/it_sync")
+    assert first.ok
+    assert sorted(r.action for r in first.results) == ["upload", "upload"]
+
+    assert client.sync.sync_folder(str(local), "/it_sync").results == []
+
+    (local / "a.txt").write_bytes(b"changed")
+    assert client.files.upload_file(FILE=b"remote", REMOTE_UPLOAD_PATH="/it_sync/sub/b.txt")
+    third = client.sync.sync_folder(str(local), "/it_sync")
+    assert sorted((r.action, r.path) for r in third.results) == [
+        ("download", "/it_sync/sub/b.txt"),
+        ("upload", "/it_sync/a.txt"),
+    ]
+    assert (local / "sub" / "b.txt").read_bytes() == b"remote"
+
+
+def test_sync_folder_first_run_compares_content(managers, tmp_path):
+    client = managers["client"]
+
+    assert client.files.upload_file(
+        FILE=b"remote", REMOTE_UPLOAD_PATH="/it_sync_first/a.txt", create_parents=True
+    )
+    assert client.files.upload_file(FILE=b"same", REMOTE_UPLOAD_PATH="/it_sync_first/b.txt")
+    local = tmp_path / "sync_first"
+    local.mkdir()
+    (local / "a.txt").write_bytes(b"locall")
+    (local / "b.txt").write_bytes(b"same")
+
+    report = client.sync.sync_folder(str(local), "/it_sync_first")
+    assert [(r.action, r.path) for r in report.results] == [
+        ("conflict", "/it_sync_first/a.txt")
+    ]
+
+
+def test_copy_and_bulk_operations(managers):
+    client = managers["client"]
+
+    for i in range(3):
+        assert client.files.upload_file(
+            FILE=b"c" * i, REMOTE_UPLOAD_PATH=f"/it_bulk/src/{i}.txt", create_parents=True
+        )
+    assert client.paths.copy_path("/it_bulk/src/0.txt", "/it_bulk/single/0.txt")
+
+    copied = client.paths.copy_paths(
+        [(f"/it_bulk/src/{i}.txt", f"/it_bulk/copy/{i}.txt") for i in range(3)]
+    )
+    assert copied.ok and len(copied.results) == 3
+
+    moved = client.paths.move_paths(
+        [(f"/it_bulk/copy/{i}.txt", f"/it_bulk/moved/{i}.txt") for i in range(3)]
+        + [("/it_bulk/missing.txt", "/it_bulk/moved/missing.txt")]
+    )
+    assert [r.path for r in moved.failed] == ["/it_bulk/missing.txt"]
+
+    deleted = client.paths.delete_paths([f"/it_bulk/moved/{i}.txt" for i in range(3)])
+    assert deleted.ok
+
+
+def test_download_folder(managers, tmp_path):
+    files = managers["files"]
+    paths = managers["paths"]
+
+    assert files.upload_file(
+        FILE=b"one", REMOTE_UPLOAD_PATH="/it_download/a.txt", create_parents=True
+    )
+    assert files.upload_file(
+        FILE=b"two!", REMOTE_UPLOAD_PATH="/it_download/sub/b.txt", create_parents=True
+    )
+
+    report = paths.download_folder(str(tmp_path / "out"), "/it_download", max_workers=2)
+    assert report.ok
+    assert report.bytes_transferred == 7
+    assert (tmp_path / "out" / "sub" / "b.txt").read_bytes() == b"two!"
+
+    again = paths.download_folder(str(tmp_path / "out"), "/it_download")
+    assert {result.action for result in again.results} == {"skip"}
+
+
+def test_upload_folder_deduplicate(managers, tmp_path):
+    paths = managers["paths"]
+
+    local = tmp_path / "dedup"
+    (local / "sub").mkdir(parents=True)
+    (local / "a.txt").write_bytes(b"alpha")
+    (local / "sub" / "b.txt").write_bytes(b"beta")
+
+    first = paths.upload_folder(str(local), "/it_dedup", deduplicate=True)
+    assert first.ok
+    assert {result.action for result in first.results} == {"upload"}
+
+    again = paths.upload_folder(str(local), "/it_dedup", deduplicate=True)
+    assert again.ok
+    assert {result.action for result in again.results} == {"skip"}
+
+    (local / "a.txt").write_bytes(b"alpha, changed")
+    changed = paths.upload_folder(str(local), "/it_dedup", deduplicate=True)
+    uploaded = [result for result in changed.results if result.action == "upload"]
+    assert len(uploaded) == 1
@@ -5,3 +5,31 @@ def test_users_and_user(managers):
 
     u = users.get_user(username="admin")
     assert u.get("id") == "admin"
+
+
+def test_iter_users_and_details(managers):
+    users = managers["users"]
+    ids = list(users.iter_users(page_size=1))
+    assert "admin" in ids
+
+    details = dict(users.iter_users_details(page_size=1))
+    assert "admin" in details
+
+    found = users.get_users_details(["admin", "no-such-user-it"], max_workers=2)
+    assert found["admin"]["id"] == "admin"
+    assert found["no-such-user-it"] is None
+
+
+def test_user_cache(nc_url, nc_user, nc_pass):
+    from nc_api import UserCache, UserManager
+
+    users = UserManager(nc_url, nc_user, nc_pass, user_cache=UserCache(ttl=60))
+    first = users.get_user(username="admin")
+    assert users.user_cache.get("admin") is not None
+    assert users.get_user(username="admin") == first
+
+    assert users.get_users_details(["no-such-user-it"])["no-such-user-it"] is None
+    assert users.user_cache.get("no-such-user-it") is not None
+
+    users.user_cache.invalidate("admin")
+    assert users.user_cache.get("admin") is None